@@ -8,6 +8,8 @@ import glob
 import logging
 import azure.functions as func
 
+from websearch.profiler import profile_cold_start, format_report, DEFAULT_TOP
+
 app = func.FunctionApp(http_auth_level=func.AuthLevel.FUNCTION)
 
 # Constants for the Azure Blob Storage container, file, and blob path
@@ -37,6 +39,10 @@ from websearch.service import perform_search, dumps_response
 # where the custom binding may not be available (e.g., Azure).
 _ENABLE_MCP_TRIGGERS = os.getenv("ENABLE_MCP_TRIGGERS", "false").lower() == "true"
 
+# Feature flag to enable the debug routes (cold start profile), not meant for
+# production.
+_ENABLE_DEBUG_ROUTES = os.getenv("ENABLE_DEBUG_ROUTES", "false").lower() == "true"
+
 class ToolProperty:
     def __init__(self, property_name: str, property_type: str, description: str):
         self.propertyName = property_name
@@ -92,6 +98,34 @@ tool_properties_websearch_json = json.dumps([
         "propertyName": "max_results",
         "propertyType": "integer",
         "description": "Optional maximum number of results to return"
+    },
+    {
+        "propertyName": "rank_fusion",
+        "propertyType": "string",
+        "description": "Optional ranking of the merged results: legacy (default), rrf or borda"
+    },
+    {
+        "propertyName": "profile",
+        "propertyType": "string",
+        "description": (
+            "Optional result fields profile: minimal (url/title/content), "
+            "llm (plus engines/publishedDate) or full (default)"
+        )
+    },
+    {
+        "propertyName": "fields",
+        "propertyType": "string",
+        "description": "Optional comma separated list of result fields to return (overrides profile)"
+    },
+    {
+        "propertyName": "max_content_chars",
+        "propertyType": "integer",
+        "description": "Optional maximum length of the content of a result"
+    },
+    {
+        "propertyName": "detect_language",
+        "propertyType": "boolean",
+        "description": "Optional, add the detected language (lang) of the title and content to each result"
     }
 ])
 
@@ -116,6 +150,11 @@ if _ENABLE_MCP_TRIGGERS:
             "time_range": arguments.get("time_range"),
             "pageno": arguments.get("pageno"),
             "safesearch": arguments.get("safesearch"),
+            "rank_fusion": arguments.get("rank_fusion"),
+            "profile": arguments.get("profile"),
+            "fields": arguments.get("fields"),
+            "max_content_chars": arguments.get("max_content_chars"),
+            "detect_language": arguments.get("detect_language"),
         }
 
         response = perform_search(payload)
@@ -140,6 +179,11 @@ def http_websearch(req: func.HttpRequest) -> func.HttpResponse:  # type: ignore[
                 "pageno": req.params.get("pageno"),
                 "safesearch": req.params.get("safesearch"),
                 "max_results": req.params.get("max_results"),
+                "rank_fusion": req.params.get("rank_fusion"),
+                "profile": req.params.get("profile"),
+                "fields": req.params.get("fields"),
+                "max_content_chars": req.params.get("max_content_chars"),
+                "detect_language": req.params.get("detect_language"),
             }
 
         response = perform_search(content)
@@ -162,6 +206,27 @@ def http_websearch(req: func.HttpRequest) -> func.HttpResponse:  # type: ignore[
         )
 
 
+if _ENABLE_DEBUG_ROUTES:
+    # Profile of the cold start of the search core, recorded in a new process
+    @app.route(route="debug/profile", methods=["GET"], auth_level=func.AuthLevel.FUNCTION)
+    def http_debug_profile(req: func.HttpRequest) -> func.HttpResponse:  # type: ignore[override]
+        try:
+            profile = profile_cold_start(timeout=120)
+        except Exception as exc:  # pylint: disable=broad-except
+            return func.HttpResponse(
+                json.dumps({"error": "profile_failed", "detail": str(exc)}),
+                status_code=500,
+                mimetype="application/json",
+            )
+        if req.params.get("format") == "text":
+            try:
+                top = int(req.params.get("top") or DEFAULT_TOP)
+            except ValueError:
+                top = DEFAULT_TOP
+            return func.HttpResponse(format_report(profile, top), status_code=200, mimetype="text/plain")
+        return func.HttpResponse(json.dumps(profile), status_code=200, mimetype="application/json")
+
+
 @app.route(route="ping", methods=["GET"], auth_level=func.AuthLevel.ANONYMOUS)
 def http_ping(req: func.HttpRequest) -> func.HttpResponse:  # type: ignore[override]
     return func.HttpResponse(
@@ -9,7 +9,7 @@ import logging
 
 import searx.unixthreadname
 import searx.settings_loader
-from searx.settings_defaults import SCHEMA, apply_schema
+from searx.settings_defaults import SCHEMA, apply_schema, environ_names
 
 # Debug
 LOG_FORMAT_DEBUG = '%(levelname)-7s %(name)-30.30s: %(message)s'
@@ -35,9 +35,21 @@ def init_settings():
 
     global settings, sxng_debug  # pylint: disable=global-variable-not-assigned
 
-    cfg, msg = searx.settings_loader.load_settings(load_user_settings=True)
-    cfg = cfg or {}
-    apply_schema(cfg, SCHEMA, [])
+    cfg = None
+    cache_file = searx.settings_loader.get_settings_cache_file()
+    if cache_file:
+        cache_key = searx.settings_loader.settings_cache_key(environ_names(SCHEMA), load_user_settings=True)
+        cached = searx.settings_loader.read_settings_cache(cache_file, cache_key)
+        if cached:
+            cfg, msg = cached
+            msg += f" (cached in {cache_file})"
+
+    if cfg is None:
+        cfg, msg = searx.settings_loader.load_settings(load_user_settings=True)
+        cfg = cfg or {}
+        apply_schema(cfg, SCHEMA, [])
+        if cache_file:
+            searx.settings_loader.write_settings_cache(cache_file, cache_key, cfg, msg)
 
     settings.clear()
     settings.update(cfg)
@@ -6,6 +6,7 @@
 
 import json
 import html
+import re
 from urllib.parse import urlencode, quote_plus
 
 import lxml.etree
@@ -14,12 +15,14 @@ from httpx import HTTPError
 
 from searx.extended_types import SXNG_Response
 from searx import settings
+from searx.data import CURRENCIES
 from searx.engines import (
     engines,
     google,
 )
 from searx.network import get as http_get, post as http_post
 from searx.exceptions import SearxEngineResponseException
+from searx.search.processors.online_currency import normalize_name
 from searx.utils import extr, gen_useragent
 
 
@@ -374,11 +377,32 @@ backends = {
 }
 
 
+currency_query_re = re.compile(r'^(\d+(?:\.\d+)? (?:[^.0-9]+ (?:in|to) )?)([^.0-9]{2,})$', re.I)
+
+
+def currencies(query, limit=5):
+    """Completes the currency name at the end of a currency conversion query
+    (``10 us dol`` --> ``10 us dollar``, ``10 usd in eur`` --> ``10 usd in
+    euro``), see :py:obj:`searx.data.currencies.CurrenciesDB.complete`.  This
+    autocompleter has no backend, it is asked before the autocomplete backend.
+    """
+    m = currency_query_re.match(query)
+    if not m:
+        return []
+    head, prefix = m.groups()
+    # normalize_name strips the plural "s", a prefix like "us" is also cut
+    prefix = normalize_name(prefix)
+    if not prefix:
+        return []
+    return [head + name for name, _ in CURRENCIES.complete(prefix, limit)]
+
+
 def search_autocomplete(backend_name, query, sxng_locale):
+    results = currencies(query)
     backend = backends.get(backend_name)
     if backend is None:
-        return []
+        return results
     try:
-        return backend(query, sxng_locale)
+        return results + backend(query, sxng_locale)
     except (HTTPError, SearxEngineResponseException):
-        return []
+        return results
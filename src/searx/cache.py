@@ -1,43 +1,178 @@
 """Implementation of caching solutions.
 
 - :py:obj:`searx.cache.ExpireCache` and its :py:obj:`searx.cache.ExpireCacheCfg`
+- :py:obj:`searx.cache.ExpireCacheSQLite` and :py:obj:`searx.cache.ExpireCacheValkey`
+  backends of the :py:obj:`searx.cache.ExpireCache`
+- :py:obj:`searx.cache.ExpireCacheL1` in-process cache in front of a
+  :py:obj:`searx.cache.ExpireCache`
+- :py:obj:`searx.cache.ExpireCacheCodec` codecs of the values stored in a cache
+- :py:obj:`searx.cache.WriteBehindQueue` queue of pending writes of a cache
 
 ----
 """
 
 from __future__ import annotations
 
-__all__ = ["ExpireCacheCfg", "ExpireCacheStats", "ExpireCache", "ExpireCacheSQLite"]
+__all__ = [
+    "ExpireCacheCfg",
+    "ExpireCacheStats",
+    "ExpireCacheL1Metrics",
+    "ExpireCache",
+    "ExpireCacheSQLite",
+    "ExpireCacheValkey",
+    "ExpireCacheL1",
+    "ExpireCacheCodec",
+    "CODECS",
+    "WriteBehindQueue",
+]
 
 import abc
-from collections.abc import Iterator
+import atexit
+from collections import OrderedDict
+from collections.abc import Callable, Iterable, Iterator
 import dataclasses
 import datetime
 import hashlib
 import hmac
 import os
 import pickle
+import random
 import sqlite3
 import string
 import tempfile
+import threading
 import time
 import typing
 
 import msgspec
 
 from searx import sqlitedb
+from searx import valkeydb
+from searx import valkeylib
 from searx import logger
 from searx import get_setting
 
+try:
+    from compression import zstd  # type: ignore  # Python >= 3.14
+except ImportError:
+    try:
+        import zstandard as zstd  # type: ignore
+    except ImportError:
+        zstd = None
+
 log = logger.getChild("cache")
 
 
+class ExpireCacheCodec(abc.ABC):
+    """Abstract base class of the codecs used to store values in a
+    :py:obj:`ExpireCache` (see :py:obj:`ExpireCacheCfg.CODEC`)."""
+
+    name: str = ""
+
+    @abc.abstractmethod
+    def encode(self, value: typing.Any) -> bytes:
+        """Encode ``value``, raises a :py:obj:`TypeError` if the type of the
+        value is not supported by the codec."""
+
+    @abc.abstractmethod
+    def decode(self, data: bytes) -> typing.Any:
+        """Decode the ``data`` created by :py:obj:`ExpireCacheCodec.encode`."""
+
+
+class MsgPackCodec(ExpireCacheCodec):
+    """MessagePack codec (msgspec), supports the builtin types (``str``,
+    ``int``, ``list``, ``dict``, ..).  Tuples and sets are decoded as lists.
+    Unlike pickle, decoding does not execute code."""
+
+    name = "msgpack"
+
+    def encode(self, value: typing.Any) -> bytes:
+        return msgspec.msgpack.encode(value)
+
+    def decode(self, data: bytes) -> typing.Any:
+        return msgspec.msgpack.decode(data)
+
+
+class MsgPackZstdCodec(MsgPackCodec):
+    """:py:obj:`MsgPackCodec` whose values are compressed with zstd if they are
+    larger than :py:obj:`MsgPackZstdCodec.MIN_LEN`.  The first byte of the data
+    flags whether the value is compressed.  Requires Python 3.14+
+    (:py:obj:`compression.zstd`) or the package ``zstandard``."""
+
+    name = "msgpack+zstd"
+
+    MIN_LEN = 1024
+    """Values smaller than this (encoded) size are stored uncompressed."""
+
+    LEVEL = 3
+    """Compression level of zstd."""
+
+    def encode(self, value: typing.Any) -> bytes:
+        data = super().encode(value)
+        if len(data) < self.MIN_LEN:
+            return b"\x00" + data
+        return b"\x01" + zstd.compress(data, self.LEVEL)  # type: ignore
+
+    def decode(self, data: bytes) -> typing.Any:
+        if data[:1] == b"\x01":
+            return super().decode(zstd.decompress(data[1:]))  # type: ignore
+        return super().decode(data[1:])
+
+
+class PickleCodec(ExpireCacheCodec):
+    """Legacy codec (:py:obj:`pickle`), supports any picklable Python object.
+
+    .. attention::
+
+       Unpickling executes code, don't use this codec if the DB is located on a
+       storage that can be modified by others.
+    """
+
+    name = "pickle"
+
+    def encode(self, value: typing.Any) -> bytes:
+        try:
+            return pickle.dumps(value)
+        except (pickle.PicklingError, AttributeError) as exc:
+            raise TypeError(str(exc)) from exc
+
+    def decode(self, data: bytes) -> typing.Any:
+        return pickle.loads(data)
+
+
+CODECS: dict[str, ExpireCacheCodec] = {
+    MsgPackCodec.name: MsgPackCodec(),
+    MsgPackZstdCodec.name: MsgPackZstdCodec(),
+    PickleCodec.name: PickleCodec(),
+}
+"""Codecs available for :py:obj:`ExpireCacheCfg.CODEC`."""
+
+
 class ExpireCacheCfg(msgspec.Struct):  # pylint: disable=too-few-public-methods
     """Configuration of a :py:obj:`ExpireCache` cache."""
 
     name: str
     """Name of the cache."""
 
+    BACKEND: typing.Literal["sqlite", "valkey", "auto"] = "sqlite"
+    """Backend where the values are stored.
+
+    ``sqlite``:
+      A SQLite DB (:py:obj:`ExpireCacheSQLite`) in :py:obj:`db_url`, the cache
+      is local to the host.
+
+    ``valkey``:
+      The Valkey DB from :ref:`settings valkey` (:py:obj:`ExpireCacheValkey`),
+      the cache is shared by all processes / instances connected to this DB.
+      Falls back to ``sqlite`` if no Valkey DB is configured.
+
+    ``auto``:
+      ``valkey`` if a Valkey DB is configured, otherwise ``sqlite``.
+
+    Combined with :py:obj:`L1_MAX_ITEMS` a Valkey backend is a two-level
+    cache: a local in-process L1 in front of the shared Valkey DB.
+    """
+
     db_url: str = ""
     """URL of the SQLite DB, the path to the database file.  If unset a default
     DB will be created in `/tmp/sxng_cache_{self.name}.db`"""
@@ -52,18 +187,68 @@ class ExpireCacheCfg(msgspec.Struct):  # pylint: disable=too-few-public-methods
     """Maintenance period in seconds / when :py:obj:`MAINTENANCE_MODE` is set to
     ``auto``."""
 
+    MAINTENANCE_JITTER: int = 60 * 5
+    """Max. random delay (sec.) added to the :py:obj:`MAINTENANCE_PERIOD`, so the
+    maintenance of several processes / instances does not run in lockstep."""
+
     MAINTENANCE_MODE: typing.Literal["auto", "off"] = "auto"
     """Type of maintenance mode
 
     ``auto``:
       Maintenance is carried out automatically as part of the maintenance
-      intervals (:py:obj:`MAINTENANCE_PERIOD`); no external process is required.
+      intervals (:py:obj:`MAINTENANCE_PERIOD`) by a background thread of the
+      process; no external process is required and no request has to wait
+      for the maintenance.
 
     ``off``:
       Maintenance is switched off and must be carried out by an external process
       if required.
     """
 
+    L1_MAX_ITEMS: int = 0
+    """Max. number of values held in the in-process L1 cache
+    (:py:obj:`ExpireCacheL1`).  If set to ``0`` (default), no L1 is used."""
+
+    L1_MAX_BYTES: int = 1024 * 1024 * 4
+    """Max. size (sum of the *serialized* values) of the L1 cache."""
+
+    L1_TTL: int = 60
+    """Max. time in sec. a value is held in the L1 cache.  This is also the
+    maximum time an update of the value by another process (in the L2) is not
+    seen by this process."""
+
+    L1_NEGATIVE_TTL: int = 5
+    """Time in sec. a miss (key not in L2) is held in the L1 cache."""
+
+    WRITE_BEHIND_INTERVAL: float = 0
+    """If set, :py:obj:`ExpireCacheSQLite.set` does not write to the DB, the
+    values are queued in memory (:py:obj:`WriteBehindQueue`) and written in
+    batches by a background thread, at the latest after this interval in sec.
+    The values are read from the queue until they are written (read your
+    writes), other processes see the values after they are written.  If set to
+    ``0`` (default), the values are written immediately."""
+
+    WRITE_BEHIND_MAX_PENDING: int = 1000
+    """Number of queued values after which the background thread writes them
+    without waiting for the :py:obj:`WRITE_BEHIND_INTERVAL`."""
+
+    CODEC: typing.Literal["msgpack", "msgpack+zstd", "pickle"] = "msgpack"
+    """Codec used to store the values (see :py:obj:`CODECS`).
+
+    ``msgpack``:
+      Fast and compact, supports values of the builtin types.
+
+    ``msgpack+zstd``:
+      Like ``msgpack``, large values are compressed with zstd.  Falls back to
+      ``msgpack`` if zstd is not installed (the package ``zstandard`` is not in
+      the requirements, zstd is part of Python 3.14+).
+
+    ``pickle``:
+      Legacy codec, supports any picklable object but unpickling executes code.
+
+    When the codec is changed, all values in the cache are deleted.
+    """
+
     password: bytes = get_setting("server.secret_key").encode()  # type: ignore
     """Password used by :py:obj:`ExpireCache.secret_hash`.
 
@@ -78,6 +263,17 @@ class ExpireCacheCfg(msgspec.Struct):  # pylint: disable=too-few-public-methods
         if not self.db_url:
             self.db_url = tempfile.gettempdir() + os.sep + f"sxng_cache_{ExpireCache.normalize_name(self.name)}.db"
 
+        if self.CODEC == MsgPackZstdCodec.name and zstd is None:
+            log.warning("[%s] zstd is not installed, use codec %s", self.name, MsgPackCodec.name)
+            self.CODEC = MsgPackCodec.name
+
+        if self.BACKEND != "sqlite" and not (get_setting("valkey.url") or get_setting("redis.url")):
+            if self.BACKEND == "valkey":
+                log.warning("[%s] no Valkey DB configured, use backend sqlite", self.name)
+            self.BACKEND = "sqlite"
+        elif self.BACKEND == "auto":
+            self.BACKEND = "valkey"
+
 
 @dataclasses.dataclass
 class ExpireCacheStats:
@@ -119,6 +315,183 @@ class ExpireCacheStats:
         return "\n".join(lines)
 
 
+@dataclasses.dataclass
+class ExpireCacheL1Metrics:
+    """Dataclass with the counters of a :py:obj:`ExpireCacheL1`."""
+
+    l1_hits: int = 0
+    """Number of lookups answered by the L1 (including negative hits)."""
+
+    l1_negative_hits: int = 0
+    """Number of lookups answered by a cached miss."""
+
+    l1_misses: int = 0
+    """Number of lookups passed to the L2."""
+
+    l1_evictions: int = 0
+    """Number of values evicted from the L1 (LRU by count and bytes)."""
+
+    l1_time: float = 0.0
+    """Accumulated time (sec.) of the L1 lookups."""
+
+    l2_time: float = 0.0
+    """Accumulated time (sec.) of the L2 lookups."""
+
+    @property
+    def hit_ratio(self) -> float:
+        total = self.l1_hits + self.l1_misses
+        return self.l1_hits / total if total else 0.0
+
+    def report(self):
+        lookups = self.l1_hits + self.l1_misses
+        l1_avg = self.l1_time / lookups * 1e6 if lookups else 0.0
+        l2_avg = self.l2_time / self.l1_misses * 1e6 if self.l1_misses else 0.0
+        return "\n".join(
+            [
+                f"L1 hits: {self.l1_hits} (negative: {self.l1_negative_hits}) / misses: {self.l1_misses}"
+                f" / hit ratio: {self.hit_ratio:.2%}",
+                f"L1 evictions: {self.l1_evictions}",
+                f"avg. lookup time L1: {l1_avg:.1f} usec / L2: {l2_avg:.1f} usec",
+            ]
+        )
+
+
+_MISSING = object()
+
+
+class WriteBehindQueue:
+    """Queue of the pending writes of a cache, the writes are passed in
+    batches (``write(pending)``) to the cache by a background thread.
+
+    - Pending values are held in a map, a new value of a key replaces the
+      pending one (only the last value of a key is written).
+    - The background thread writes the pending values every ``interval``
+      seconds, or earlier when ``max_pending`` values (or ``max_bytes``, the
+      size of a value is given by ``sizeof``) are queued.
+    - If a batch can not be written, its values are queued again (those that
+      fit into the limits, the others are dropped) and written by the next
+      flush.
+    - The pending values are written when the process exits (:py:obj:`atexit`).
+
+    The thread is started once per process (threads do not survive a fork).
+    """
+
+    def __init__(
+        self,
+        name: str,
+        write: Callable[[dict], None],
+        interval: float,
+        max_pending: int = 1000,
+        max_bytes: int = 0,
+        sizeof: Callable[[typing.Any], int] | None = None,
+    ):
+        self.name = name
+        self.write = write
+        self.interval = interval
+        self.max_pending = max_pending
+        self.max_bytes = max_bytes
+        self.sizeof = sizeof
+        self._pending: dict = {}
+        self._pending_bytes = 0
+        # the values of the pending map that are written at the moment
+        self._flushing: dict = {}
+        self._lock = threading.Lock()
+        self._flush_lock = threading.RLock()
+        self._wakeup = threading.Event()
+        self._pid: int | None = None
+        self._atexit = False
+
+    def put(self, key: typing.Hashable, value: typing.Any):
+        with self._lock:
+            self._add(key, value)
+            full = self._full()
+        self._start()
+        if full:
+            self._wakeup.set()
+
+    def _size(self, value: typing.Any) -> int:
+        return 0 if self.sizeof is None else self.sizeof(value)
+
+    def _add(self, key: typing.Hashable, value: typing.Any):
+        old = self._pending.get(key, _MISSING)
+        if old is not _MISSING:
+            self._pending_bytes -= self._size(old)
+        self._pending[key] = value
+        self._pending_bytes += self._size(value)
+
+    def _full(self) -> bool:
+        return len(self._pending) >= self.max_pending or 0 < self.max_bytes <= self._pending_bytes
+
+    def get(self, key: typing.Hashable, default=None) -> typing.Any:
+        """Returns the pending value of the ``key`` or ``default`` if no value
+        of this key is pending."""
+        with self._lock:
+            value = self._pending.get(key, _MISSING)
+            if value is _MISSING:
+                value = self._flushing.get(key, _MISSING)
+        return default if value is _MISSING else value
+
+    def __len__(self):
+        return len(self._pending)
+
+    def clear(self):
+        """Drops the pending values."""
+        with self._lock:
+            self._pending = {}
+            self._pending_bytes = 0
+
+    def flush(self):
+        """Writes the pending values."""
+        with self._flush_lock:
+            with self._lock:
+                if not self._pending:
+                    return
+                self._flushing, self._pending = self._pending, {}
+                self._pending_bytes = 0
+            try:
+                self.write(self._flushing)
+            except Exception:  # pylint: disable=broad-exception-caught
+                log.exception("[%s] write-behind: failed to write %s values", self.name, len(self._flushing))
+                self._requeue(self._flushing)
+            finally:
+                with self._lock:
+                    self._flushing = {}
+
+    def _requeue(self, failed: dict):
+        """Queues the values of a batch that could not be written again, a
+        value that has been replaced in the meantime is not queued.  When the
+        limits are reached, the remaining values are dropped."""
+        dropped = 0
+        with self._lock:
+            for key, value in failed.items():
+                if key in self._pending:
+                    continue
+                if self._full():
+                    dropped += 1
+                    continue
+                self._add(key, value)
+        if dropped:
+            log.error("[%s] write-behind: queue is full, %s values are dropped", self.name, dropped)
+
+    def _start(self):
+        if self._pid == os.getpid():
+            return
+        with self._lock:
+            if self._pid == os.getpid():
+                return
+            self._pid = os.getpid()
+            threading.Thread(target=self._loop, name=f"{self.name}-write-behind", daemon=True).start()
+            if not self._atexit:
+                self._atexit = True
+                atexit.register(self.flush)
+
+    def _loop(self):
+        while True:
+            self._wakeup.wait(self.interval)
+            self._wakeup.clear()
+            self.flush()
+
+
 class ExpireCache(abc.ABC):
     """Abstract base class for the implementation of a key/value cache
     with expire date."""
@@ -127,6 +500,8 @@ class ExpireCache(abc.ABC):
 
     hash_token = "hash_token"
 
+    codec_token = "codec"
+
     @abc.abstractmethod
     def set(self, key: str, value: typing.Any, expire: int | None, ctx: str | None = None) -> bool:
         """Set *key* to *value*.  To set a timeout on key use argument
@@ -151,6 +526,30 @@ class ExpireCache(abc.ABC):
     def get(self, key: str, default=None, ctx: str | None = None) -> typing.Any:
         """Return *value* of *key*.  If key is unset, ``None`` is returned."""
 
+    def set_many(
+        self, items: Iterable[tuple[str, typing.Any]], ctx: str | None = None, expire: int | None = None
+    ) -> int:
+        """Set the *key*/*value* pairs of ``items`` in context ``ctx``, see
+        :py:obj:`ExpireCache.set`.  Returns the number of pairs stored.
+
+        Implementations should store all pairs in one bulk operation, this
+        default implementation calls :py:obj:`ExpireCache.set` for each pair.
+        """
+        count = 0
+        for key, value in items:
+            if self.set(key, value, expire, ctx=ctx):
+                count += 1
+        return count
+
+    def get_many(self, keys: Iterable[str], default=None, ctx: str | None = None) -> list[typing.Any]:
+        """Return the *values* of ``keys`` in context ``ctx`` (in the order of
+        ``keys``), unset keys are returned as ``default``.
+
+        Implementations should read all values in one bulk operation, this
+        default implementation calls :py:obj:`ExpireCache.get` for each key.
+        """
+        return [self.get(key, default=default, ctx=ctx) for key in keys]
+
     @abc.abstractmethod
     def maintenance(self, force: bool = False, truncate: bool = False) -> bool:
         """Performs maintenance on the cache.
@@ -171,15 +570,20 @@ class ExpireCache(abc.ABC):
 
     @staticmethod
     def build_cache(cfg: ExpireCacheCfg) -> ExpireCache:
-        """Factory to build a caching instance.
+        """Factory to build a caching instance, the backend is selected by
+        :py:obj:`ExpireCacheCfg.BACKEND`.
 
-        .. note::
-
-           Currently, only the SQLite adapter is available, but other database
-           types could be implemented in the future, e.g. a Valkey (Redis)
-           adapter.
+        If :py:obj:`ExpireCacheCfg.L1_MAX_ITEMS` is set, the cache is wrapped in
+        an in-process :py:obj:`ExpireCacheL1`.
         """
-        return ExpireCacheSQLite(cfg)
+        cache: ExpireCache
+        if cfg.BACKEND == "valkey":
+            cache = ExpireCacheValkey(cfg)
+        else:
+            cache = ExpireCacheSQLite(cfg)
+        if cfg.L1_MAX_ITEMS > 0:
+            cache = ExpireCacheL1(cfg, cache)
+        return cache
 
     @staticmethod
     def normalize_name(name: str) -> str:
@@ -189,13 +593,46 @@ class ExpireCache(abc.ABC):
         _valid = "-_." + string.ascii_letters + string.digits
         return "".join([c for c in name if c in _valid])
 
+    @property
+    def codec(self) -> ExpireCacheCodec:
+        """The codec selected by :py:obj:`ExpireCacheCfg.CODEC`."""
+        return CODECS[self.cfg.CODEC]
+
     def serialize(self, value: typing.Any) -> bytes:
-        dump: bytes = pickle.dumps(value)
-        return dump
+        return self.codec.encode(value)
 
     def deserialize(self, value: bytes) -> typing.Any:
-        obj = pickle.loads(value)
-        return obj
+        return self.codec.decode(value)
+
+    def encode_value(self, key: str, value: typing.Any, ctx: str | None = None) -> bytes | None:
+        """Returns the ``value`` of the ``key`` encoded as it is stored in the
+        cache.  ``None`` is returned if the value can't be serialized or is too
+        big to cache (:py:obj:`ExpireCacheCfg.MAX_VALUE_LEN`)."""
+        try:
+            data = self.serialize(value=value)
+        except TypeError as exc:
+            log.warning("ExpireCache.set(): %s.key='%s' - value can't be serialized: %s", ctx, key, exc)
+            return None
+        if len(data) > self.cfg.MAX_VALUE_LEN:
+            log.warning("ExpireCache.set(): %s.key='%s' - value too big to cache (len: %s)", ctx, key, len(data))
+            return None
+        return data
+
+    def decode_value(self, data: bytes) -> typing.Any:
+        """Decodes the ``data`` created by :py:obj:`ExpireCache.encode_value`,
+        each call returns a new object."""
+        return self.deserialize(data)
+
+    def set_encoded(self, key: str, data: bytes, expire: int | None, ctx: str | None = None) -> bool:
+        """Same as :py:obj:`ExpireCache.set` with a value encoded by
+        :py:obj:`ExpireCache.encode_value` (used by :py:obj:`ExpireCacheL1`,
+        which holds the encoded values)."""
+        raise NotImplementedError
+
+    def get_encoded(self, key: str, ctx: str | None = None) -> bytes | None:
+        """Returns the encoded value of the ``key`` (see
+        :py:obj:`ExpireCache.decode_value`) or ``None`` if the key is unset."""
+        raise NotImplementedError
 
     def secret_hash(self, name: str | bytes) -> str:
         """Creates a hash of the argument ``name``.  The hash value is formed
@@ -209,6 +646,16 @@ class ExpireCache(abc.ABC):
         return m.hexdigest()
 
 
+class TableSQL(typing.NamedTuple):
+    """The SQL statements of a key/value table of the :py:obj:`ExpireCacheSQLite`."""
+
+    get: str
+    set: str
+    pairs: str
+    items: str
+    delete_expired: str
+
+
 class ExpireCacheSQLite(sqlitedb.SQLiteAppl, ExpireCache):
     """Cache that manages key/value pairs in a SQLite DB.  The DB model in the
     SQLite DB is implemented in abstract class :py:obj:`SQLiteAppl
@@ -219,11 +666,26 @@ class ExpireCacheSQLite(sqlitedb.SQLiteAppl, ExpireCache):
     - :py:obj:`ExpireCacheCfg.db_url`
     - :py:obj:`ExpireCacheCfg.MAXHOLD_TIME`
     - :py:obj:`ExpireCacheCfg.MAINTENANCE_PERIOD`
+    - :py:obj:`ExpireCacheCfg.MAINTENANCE_JITTER`
     - :py:obj:`ExpireCacheCfg.MAINTENANCE_MODE`
+    - :py:obj:`ExpireCacheCfg.WRITE_BEHIND_INTERVAL`
+    - :py:obj:`ExpireCacheCfg.WRITE_BEHIND_MAX_PENDING`
+
+    The names of the key/value tables are cached in memory, the cache is
+    invalidated when a table is created or truncated.
+
+    The DB connections use the :py:obj:`performance profile
+    <searx.sqlitedb.SQLiteAppl.SQLITE_PERFORMANCE_PROFILE>` and a cache of
+    prepared statements, the SQL statements of a table are built once
+    (:py:obj:`ExpireCacheSQLite.table_sql`).
     """
 
     DB_SCHEMA = 1
 
+    SQLITE_PRAGMAS = sqlitedb.SQLiteAppl.SQLITE_PERFORMANCE_PROFILE
+
+    SQLITE_CONNECT_ARGS = {**sqlitedb.SQLiteAppl.SQLITE_CONNECT_ARGS, "cached_statements": 128}
+
     # The key/value tables will be created on demand by self.create_table
     DDL_CREATE_TABLES = {}
 
@@ -237,6 +699,49 @@ class ExpireCacheSQLite(sqlitedb.SQLiteAppl, ExpireCache):
         if cfg.db_url == ":memory:":
             log.critical("don't use SQLite DB in :memory: in production!!")
         super().__init__(cfg.db_url)
+        self._table_names: list[str] | None = None
+        self._table_sql: dict[str, TableSQL] = {}
+        self._maintenance_pid: int | None = None
+        self._maintenance_lock = threading.Lock()
+        self.write_behind: WriteBehindQueue | None = None
+        if cfg.WRITE_BEHIND_INTERVAL > 0:
+            self.write_behind = WriteBehindQueue(
+                name=cfg.name,
+                write=self._write_pending,
+                interval=cfg.WRITE_BEHIND_INTERVAL,
+                max_pending=cfg.WRITE_BEHIND_MAX_PENDING,
+            )
+
+    def start_maintenance(self):
+        """Starts the background thread that carries out the maintenance in
+        the :py:obj:`ExpireCacheCfg.MAINTENANCE_PERIOD` (when
+        :py:obj:`ExpireCacheCfg.MAINTENANCE_MODE` is ``auto``).  The thread is
+        started once per process (threads do not survive a fork)."""
+
+        if self.cfg.MAINTENANCE_MODE != "auto" or self._maintenance_pid == os.getpid():
+            return
+        with self._maintenance_lock:
+            if self._maintenance_pid == os.getpid():
+                return
+            self._maintenance_pid = os.getpid()
+            threading.Thread(
+                target=self._maintenance_loop,
+                name=f"{self.cfg.name}-maintenance",
+                daemon=True,
+            ).start()
+
+    def _maintenance_loop(self):
+        while True:
+            try:
+                delay = self.next_maintenance_time - time.time()
+            except Exception:  # pylint: disable=broad-exception-caught
+                log.exception("[%s] failed to read the next maintenance time", self.cfg.name)
+                delay = self.cfg.MAINTENANCE_PERIOD
+            time.sleep(max(delay, 0) + random.uniform(0, self.cfg.MAINTENANCE_JITTER))
+            try:
+                self.maintenance()
+            except Exception:  # pylint: disable=broad-exception-caught
+                log.exception("[%s] maintenance failed", self.cfg.name)
 
     def init(self, conn: sqlite3.Connection) -> bool:
         ret_val = super().init(conn)
@@ -251,6 +756,17 @@ class ExpireCacheSQLite(sqlitedb.SQLiteAppl, ExpireCache):
             self.maintenance(force=True, truncate=True)
             self.properties.set(self.hash_token, new)
 
+        # values stored by another codec (or by pickle in older versions, where
+        # this property did not exist) can't be decoded
+        old = self.properties(self.codec_token)
+        if old != self.cfg.CODEC:
+            if old is not None or self.table_names:
+                log.warning(
+                    "[%s] codec changed (%s -> %s): truncate all cache tables", self.cfg.name, old, self.cfg.CODEC
+                )
+            self.maintenance(force=True, truncate=True)
+            self.properties.set(self.codec_token, self.cfg.CODEC)
+
         return True
 
     def maintenance(self, force: bool = False, truncate: bool = False) -> bool:
@@ -264,6 +780,8 @@ class ExpireCacheSQLite(sqlitedb.SQLiteAppl, ExpireCache):
         self.properties.set("LAST_MAINTENANCE", "")  # hint: this (also) sets the m_time of the property!
 
         if truncate:
+            if self.write_behind is not None:
+                self.write_behind.clear()
             self.truncate_tables(self.table_names)
             return True
 
@@ -272,7 +790,7 @@ class ExpireCacheSQLite(sqlitedb.SQLiteAppl, ExpireCache):
 
         with self.connect() as conn:
             for table in self.table_names:
-                res = conn.execute(f"DELETE FROM {table} WHERE expire < ?", (expire,))
+                res = conn.execute(self.table_sql(table).delete_expired, (expire,))
                 log.debug("deleted %s keys from table %s (expire date reached)", res.rowcount, table)
 
         # Vacuuming the WALs
@@ -290,6 +808,10 @@ class ExpireCacheSQLite(sqlitedb.SQLiteAppl, ExpireCache):
         if table in self.table_names:
             # log.debug("key/value table %s exists in DB (no need to recreate)", table)
             return False
+        # the table may have been created by another process
+        self._table_names = None
+        if table in self.table_names:
+            return False
 
         log.info("key/value table '%s' NOT exists in DB -> create DB table ..", table)
         sql_table = "\n".join(
@@ -308,14 +830,48 @@ class ExpireCacheSQLite(sqlitedb.SQLiteAppl, ExpireCache):
         conn.close()
 
         self.properties.set(f"{self.CACHE_TABLE_PREFIX}-{table}", table)
+        self._table_names = None
         return True
 
+    def table_sql(self, table: str) -> TableSQL:
+        """Returns the SQL statements of the key/value ``table``, the statements
+        are built once per table (and the prepared statements are taken from
+        the statement cache of the DB connection)."""
+        sql = self._table_sql.get(table)
+        if sql is None:
+            sql = TableSQL(
+                get=f"SELECT value FROM {table} WHERE key = ? AND expire >= ?",
+                set=(
+                    f"INSERT INTO {table} (key, value, expire) VALUES (?, ?, ?)"
+                    f"    ON CONFLICT DO "
+                    f"UPDATE SET value=excluded.value, expire=excluded.expire"
+                ),
+                pairs=f"SELECT key, value FROM {table} WHERE expire >= ?",
+                items=f"SELECT key, value, expire FROM {table}",
+                delete_expired=f"DELETE FROM {table} WHERE expire < ?",
+            )
+            self._table_sql[table] = sql
+        return sql
+
     @property
     def table_names(self) -> list[str]:
-        """List of key/value tables already created in the DB."""
-        sql = f"SELECT value FROM properties WHERE name LIKE '{self.CACHE_TABLE_PREFIX}%%'"
-        rows = self.DB.execute(sql).fetchall() or []
-        return [r[0] for r in rows]
+        """List of key/value tables already created in the DB (cached)."""
+        table_names = self._table_names
+        if table_names is None:
+            sql = f"SELECT value FROM properties WHERE name LIKE '{self.CACHE_TABLE_PREFIX}%%'"
+            rows = self.DB.execute(sql).fetchall() or []
+            table_names = [r[0] for r in rows]
+            self._table_names = table_names
+        return table_names
+
+    def has_table(self, table: str) -> bool:
+        """Returns ``True`` if the key/value ``table`` exists, the cached table
+        names are reloaded if the table is unknown (may have been created by
+        another process)."""
+        if table in self.table_names:
+            return True
+        self._table_names = None
+        return table in self.table_names
 
     def truncate_tables(self, table_names: list[str]):
         log.debug("truncate table: %s", ",".join(table_names))
@@ -323,6 +879,7 @@ class ExpireCacheSQLite(sqlitedb.SQLiteAppl, ExpireCache):
             for table in table_names:
                 conn.execute(f"DELETE FROM {table}")
         conn.close()
+        self._table_names = None
         return True
 
     @property
@@ -341,13 +898,13 @@ class ExpireCacheSQLite(sqlitedb.SQLiteAppl, ExpireCache):
         exists, it will be created (on demand) by :py:obj:`self.create_table
         <ExpireCacheSQLite.create_table>`.
         """
-        table = ctx
-        self.maintenance()
-
-        value = self.serialize(value=value)
-        if len(value) > self.cfg.MAX_VALUE_LEN:
-            log.warning("ExpireCache.set(): %s.key='%s' - value too big to cache (len: %s)  ", table, value, len(value))
+        data = self.encode_value(key, value, ctx)
+        if data is None:
             return False
+        return self.set_encoded(key, data, expire, ctx=ctx)
+
+    def set_encoded(self, key: str, data: bytes, expire: int | None, ctx: str | None = None) -> bool:
+        table = ctx
 
         if not expire:
             expire = self.cfg.MAXHOLD_TIME
@@ -358,20 +915,19 @@ class ExpireCacheSQLite(sqlitedb.SQLiteAppl, ExpireCache):
             table_name = self.normalize_name(self.cfg.name)
         self.create_table(table_name)
 
-        sql = (
-            f"INSERT INTO {table_name} (key, value, expire) VALUES (?, ?, ?)"
-            f"    ON CONFLICT DO "
-            f"UPDATE SET value=?, expire=?"
-        )
+        sql = self.table_sql(table_name).set
 
-        if table:
+        if self.write_behind is not None:
+            self.write_behind.put((table_name, key), (data, expire))
+        elif table:
             with self.DB:
-                self.DB.execute(sql, (key, value, expire, value, expire))
+                self.DB.execute(sql, (key, data, expire))
         else:
             with self.connect() as conn:
-                conn.execute(sql, (key, value, expire, value, expire))
+                conn.execute(sql, (key, data, expire))
             conn.close()
 
+        self.start_maintenance()
         return True
 
     def get(self, key: str, default=None, ctx: str | None = None) -> typing.Any:
@@ -381,40 +937,415 @@ class ExpireCacheSQLite(sqlitedb.SQLiteAppl, ExpireCache):
         table), the ``default`` value is returned.
 
         """
+        data = self.get_encoded(key, ctx=ctx)
+        if data is None:
+            return default
+        return self.deserialize(data)
+
+    def get_encoded(self, key: str, ctx: str | None = None) -> bytes | None:
         table = ctx
-        self.maintenance()
 
         if not table:
             table = self.normalize_name(self.cfg.name)
 
-        if table not in self.table_names:
-            return default
+        if self.write_behind is not None:
+            pending = self.write_behind.get((table, key))
+            if pending is not None:
+                if pending[1] < int(time.time()):
+                    return None
+                return pending[0]
+
+        if not self.has_table(table):
+            return None
+        self.start_maintenance()
 
-        sql = f"SELECT value FROM {table} WHERE key = ?"
-        row = self.DB.execute(sql, (key,)).fetchone()
+        # expired values are filtered here, the maintenance may not have
+        # deleted them yet
+        row = self.DB.execute(self.table_sql(table).get, (key, int(time.time()))).fetchone()
         if row is None:
-            return default
+            return None
+        return row[0]
+
+    def set_many(
+        self, items: Iterable[tuple[str, typing.Any]], ctx: str | None = None, expire: int | None = None
+    ) -> int:
+        """Set the *key*/*value* pairs of ``items`` in the table given by
+        argument ``ctx`` (see :py:obj:`ExpireCacheSQLite.set`).  All pairs are
+        written by one ``executemany`` in a single transaction."""
+
+        table_name = ctx or self.normalize_name(self.cfg.name)
 
-        return self.deserialize(row[0])
+        if not expire:
+            expire = self.cfg.MAXHOLD_TIME
+        expire = int(time.time()) + expire
+
+        rows = []
+        for key, value in items:
+            data = self.encode_value(key, value, table_name)
+            if data is None:
+                continue
+            rows.append((key, data, expire))
+
+        if self.write_behind is not None:
+            # pending (older) values must not overwrite the new values
+            self.write_behind.flush()
+        self._write_rows({table_name: rows})
+
+        self.start_maintenance()
+        return len(rows)
+
+    def _write_rows(self, table_rows: dict[str, list[tuple[str, bytes, int]]]):
+        """Writes the (key, value, expire) rows of the tables in one
+        transaction."""
+        for table_name in table_rows:
+            self.create_table(table_name)
+        # the connection is in autocommit mode (isolation_level=None), without
+        # an explicit transaction each row would be committed on its own
+        conn = self.DB
+        conn.execute("BEGIN")
+        try:
+            for table_name, rows in table_rows.items():
+                conn.executemany(self.table_sql(table_name).set, rows)
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+    def _write_pending(self, pending: dict[tuple[str, str], tuple[bytes, int]]):
+        table_rows: dict[str, list[tuple[str, bytes, int]]] = {}
+        for (table_name, key), (value, expire) in pending.items():
+            table_rows.setdefault(table_name, []).append((key, value, expire))
+        self._write_rows(table_rows)
+        self.start_maintenance()
 
     def pairs(self, ctx: str) -> Iterator[tuple[str, typing.Any]]:
         """Iterate over key/value pairs from table given by argument ``ctx``.
         If ``ctx`` argument is ``None`` (the default), a table name is
         generated from the :py:obj:`ExpireCacheCfg.name`."""
         table = ctx
-        self.maintenance()
 
         if not table:
             table = self.normalize_name(self.cfg.name)
 
-        if table in self.table_names:
-            for row in self.DB.execute(f"SELECT key, value FROM {table}"):
+        if self.write_behind is not None:
+            self.write_behind.flush()
+        if self.has_table(table):
+            self.start_maintenance()
+            for row in self.DB.execute(self.table_sql(table).pairs, (int(time.time()),)):
                 yield row[0], self.deserialize(row[1])
 
     def state(self) -> ExpireCacheStats:
+        if self.write_behind is not None:
+            self.write_behind.flush()
         cached_items = {}
         for table in self.table_names:
             cached_items[table] = []
-            for row in self.DB.execute(f"SELECT key, value, expire FROM {table}"):
+            for row in self.DB.execute(self.table_sql(table).items):
                 cached_items[table].append((row[0], self.deserialize(row[1]), row[2]))
         return ExpireCacheStats(cached_items=cached_items)
+
+
+class ExpireCacheValkey(ExpireCache):
+    """Cache that manages key/value pairs in the Valkey DB from :ref:`settings
+    valkey` (:py:obj:`searx.valkeydb`).  Other than the SQLite DB, the Valkey
+    DB can be shared by all instances of a scaled-out deployment.
+
+    The following configurations are required / supported:
+
+    - :py:obj:`ExpireCacheCfg.MAXHOLD_TIME`
+    - :py:obj:`ExpireCacheCfg.MAX_VALUE_LEN`
+
+    The values expire by the native TTL of the Valkey DB, there is no need for
+    a maintenance.  The name of a Valkey key is::
+
+        SearXNG_cache:<cache name>:<codec>:<ctx>:<secret hash of key>
+
+    The *key* is hashed (:py:obj:`ExpireCache.secret_hash`), like the keys of
+    the counters in :py:obj:`searx.valkeylib`.  Since a hash can't be reversed,
+    the *key* is stored along with the *value* (needed by
+    :py:obj:`ExpireCacheValkey.pairs`).  When the codec or the password is
+    changed, the old values are no longer found and expire by their TTL.
+
+    If the Valkey DB is not available (:py:obj:`ExpireCacheValkey.ERRORS`), a
+    read is a cache miss and a write fails (the error is logged).
+    """
+
+    KEY_PREFIX = "SearXNG_cache"
+
+    ERRORS = (valkeydb.valkey.exceptions.ConnectionError, valkeydb.valkey.exceptions.TimeoutError)
+    """Errors of the Valkey DB that are handled by the reads and writes of the
+    cache."""
+
+    def __init__(self, cfg: ExpireCacheCfg):
+        self.cfg = cfg
+        self._prefix = f"{self.KEY_PREFIX}:{self.normalize_name(cfg.name)}:{cfg.CODEC}:"
+        self._connect_tried = False
+
+    @property
+    def client(self):
+        """The Valkey client (:py:obj:`searx.valkeydb.client`), the connection
+        is initialized on demand (once)."""
+        client = valkeydb.client()
+        if client is None and not self._connect_tried:
+            self._connect_tried = True
+            valkeydb.initialize()
+            client = valkeydb.client()
+        if client is None:
+            raise valkeydb.valkey.ConnectionError(f"[{self.cfg.name}] Valkey DB not available")
+        return client
+
+    def _ctx(self, ctx: str | None) -> str:
+        return self.normalize_name(ctx or self.cfg.name)
+
+    def _key(self, key: str, ctx: str | None) -> str:
+        return f"{self._prefix}{self._ctx(ctx)}:{self.secret_hash(key)}"
+
+    def encode_value(self, key: str, value: typing.Any, ctx: str | None = None) -> bytes | None:
+        # the key is stored along with the value
+        return super().encode_value(key, [key, value], ctx)
+
+    def decode_value(self, data: bytes) -> typing.Any:
+        return self.deserialize(data)[1]
+
+    def set(self, key: str, value: typing.Any, expire: int | None, ctx: str | None = None) -> bool:
+        """Set key/value in the context ``ctx``, the value expires after
+        ``expire`` seconds (default: :py:obj:`ExpireCacheCfg.MAXHOLD_TIME`)."""
+        data = self.encode_value(key, value, ctx)
+        if data is None:
+            return False
+        return self.set_encoded(key, data, expire, ctx=ctx)
+
+    def set_encoded(self, key: str, data: bytes, expire: int | None, ctx: str | None = None) -> bool:
+        try:
+            self.client.set(self._key(key, ctx), data, ex=expire or self.cfg.MAXHOLD_TIME)
+        except self.ERRORS as exc:
+            log.warning("[%s] Valkey DB: can't set %s.key='%s': %s", self.cfg.name, ctx, key, exc)
+            return False
+        return True
+
+    def get(self, key: str, default=None, ctx: str | None = None) -> typing.Any:
+        data = self.get_encoded(key, ctx=ctx)
+        if data is None:
+            return default
+        return self.decode_value(data)
+
+    def get_encoded(self, key: str, ctx: str | None = None) -> bytes | None:
+        try:
+            return self.client.get(self._key(key, ctx))
+        except self.ERRORS as exc:
+            log.warning("[%s] Valkey DB: can't get %s.key='%s': %s", self.cfg.name, ctx, key, exc)
+            return None
+
+    def set_many(
+        self, items: Iterable[tuple[str, typing.Any]], ctx: str | None = None, expire: int | None = None
+    ) -> int:
+        """Set the *key*/*value* pairs of ``items`` in one round trip.  ``MSET``
+        can't set a TTL, the ``SET .. EX`` commands are sent in a pipeline."""
+        expire = expire or self.cfg.MAXHOLD_TIME
+        count = 0
+        try:
+            pipe = self.client.pipeline(transaction=False)
+            for key, value in items:
+                data = self.encode_value(key, value, ctx)
+                if data is None:
+                    continue
+                pipe.set(self._key(key, ctx), data, ex=expire)
+                count += 1
+            if count:
+                pipe.execute()
+        except self.ERRORS as exc:
+            log.warning("[%s] Valkey DB: can't set %s values in %s: %s", self.cfg.name, count, ctx, exc)
+            return 0
+        return count
+
+    def get_many(self, keys: Iterable[str], default=None, ctx: str | None = None) -> list[typing.Any]:
+        """Read the values of ``keys`` by one ``MGET``."""
+        keys = list(keys)
+        if not keys:
+            return []
+        try:
+            rows = self.client.mget([self._key(key, ctx) for key in keys])
+        except self.ERRORS as exc:
+            log.warning("[%s] Valkey DB: can't get %s values from %s: %s", self.cfg.name, len(keys), ctx, exc)
+            return [default] * len(keys)
+        return [default if data is None else self.decode_value(data) for data in rows]
+
+    def pairs(self, ctx: str) -> Iterator[tuple[str, typing.Any]]:
+        """Iterate over key/value pairs of the context ``ctx``."""
+        client = self.client
+        names = list(client.scan_iter(match=f"{self._prefix}{self._ctx(ctx)}:*", count=500))
+        for i in range(0, len(names), 500):
+            for data in client.mget(names[i : i + 500]):
+                if data is not None:
+                    key, value = self.deserialize(data)
+                    yield key, value
+
+    def maintenance(self, force: bool = False, truncate: bool = False) -> bool:
+        """The values expire by their TTL in the Valkey DB, a maintenance is
+        only needed to ``truncate`` the cache."""
+        if truncate:
+            valkeylib.purge_by_prefix(self.client, self._prefix)
+        return True
+
+    def state(self) -> ExpireCacheStats:
+        client = self.client
+        now = int(time.time())
+        cached_items: dict[str, list[tuple[str, typing.Any, int]]] = {}
+        names = list(client.scan_iter(match=f"{self._prefix}*", count=500))
+        pipe = client.pipeline(transaction=False)
+        for name in names:
+            pipe.get(name)
+            pipe.ttl(name)
+        rows = pipe.execute() if names else []
+        for name, data, ttl in zip(names, rows[0::2], rows[1::2]):
+            if data is None:
+                continue
+            ctx = name.decode().rsplit(":", 2)[1]
+            key, value = self.deserialize(data)
+            cached_items.setdefault(ctx, []).append((key, value, now + max(ttl, 0)))
+        return ExpireCacheStats(cached_items=cached_items)
+
+
+class ExpireCacheL1(ExpireCache):
+    """Bounded in-process cache (L1) in front of another :py:obj:`ExpireCache`
+    (L2), e.g. a :py:obj:`ExpireCacheSQLite`.
+
+    - Values are evicted in LRU order when :py:obj:`ExpireCacheCfg.L1_MAX_ITEMS`
+      or :py:obj:`ExpireCacheCfg.L1_MAX_BYTES` is exceeded.
+    - A value is held at most :py:obj:`ExpireCacheCfg.L1_TTL` seconds and never
+      longer than its expire time.
+    - Writes go through to the L2.
+    - Keys not found in the L2 are cached for
+      :py:obj:`ExpireCacheCfg.L1_NEGATIVE_TTL` seconds.
+    - The L1 holds the values encoded by the L2
+      (:py:obj:`ExpireCache.encode_value`), a value is decoded on each hit.
+      The L1 returns the same (type of) values as the L2 and a value returned
+      to (or passed by) the caller is never shared with other callers.
+
+    Hits, misses and the time spent in each layer are counted in
+    :py:obj:`ExpireCacheL1.metrics`.  Attributes not implemented by the L1
+    (e.g. ``properties`` of a SQLite cache) are taken from the L2.
+    """
+
+    def __init__(self, cfg: ExpireCacheCfg, l2: ExpireCache):
+        self.cfg = cfg
+        self.l2 = l2
+        self.metrics = ExpireCacheL1Metrics()
+        # (ctx, key) --> (encoded value, expire, size)
+        self._data: OrderedDict[tuple[str, str], tuple[typing.Any, float, int]] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def __getattr__(self, name: str):
+        if name == "l2":
+            raise AttributeError(name)
+        return getattr(self.l2, name)
+
+    def _ctx(self, ctx: str | None) -> str:
+        return ctx or self.normalize_name(self.cfg.name)
+
+    def _put(self, l1_key: tuple[str, str], data: typing.Any, expire: float, size: int):
+        with self._lock:
+            old = self._data.pop(l1_key, None)
+            if old is not None:
+                self._bytes -= old[2]
+            if size > self.cfg.L1_MAX_BYTES:
+                return
+            self._data[l1_key] = (data, expire, size)
+            self._bytes += size
+            while len(self._data) > self.cfg.L1_MAX_ITEMS or self._bytes > self.cfg.L1_MAX_BYTES:
+                _, (_, _, evicted_size) = self._data.popitem(last=False)
+                self._bytes -= evicted_size
+                self.metrics.l1_evictions += 1
+
+    def _drop(self, l1_key: tuple[str, str]):
+        with self._lock:
+            old = self._data.pop(l1_key, None)
+            if old is not None:
+                self._bytes -= old[2]
+
+    def set(self, key: str, value: typing.Any, expire: int | None, ctx: str | None = None) -> bool:
+        l1_key = (self._ctx(ctx), key)
+        data = self.l2.encode_value(key, value, ctx)
+        if data is None or not self.l2.set_encoded(key, data, expire, ctx=ctx):
+            self._drop(l1_key)
+            return False
+        now = time.time()
+        l1_expire = min(now + (expire or self.cfg.MAXHOLD_TIME), now + self.cfg.L1_TTL)
+        self._put(l1_key, data, l1_expire, len(data))
+        return True
+
+    def get(self, key: str, default=None, ctx: str | None = None) -> typing.Any:
+        l1_key = (self._ctx(ctx), key)
+
+        start = time.perf_counter()
+        data = _MISSING
+        with self._lock:
+            item = self._data.get(l1_key)
+            if item is not None:
+                if item[1] > time.time():
+                    self._data.move_to_end(l1_key)
+                    self.metrics.l1_hits += 1
+                    data = item[0]
+                    if data is _MISSING:
+                        self.metrics.l1_negative_hits += 1
+                        self.metrics.l1_time += time.perf_counter() - start
+                        return default
+                else:
+                    # expired in L1
+                    self._data.pop(l1_key)
+                    self._bytes -= item[2]
+            if data is _MISSING:
+                self.metrics.l1_misses += 1
+        if data is not _MISSING:
+            value = self.l2.decode_value(data)
+            self.metrics.l1_time += time.perf_counter() - start
+            return value
+
+        l2_start = time.perf_counter()
+        self.metrics.l1_time += l2_start - start
+
+        data = self.l2.get_encoded(key, ctx=ctx)
+        self.metrics.l2_time += time.perf_counter() - l2_start
+
+        now = time.time()
+        if data is None:
+            self._put(l1_key, _MISSING, now + self.cfg.L1_NEGATIVE_TTL, 0)
+            return default
+        self._put(l1_key, data, now + self.cfg.L1_TTL, len(data))
+        return self.l2.decode_value(data)
+
+    def set_many(
+        self, items: Iterable[tuple[str, typing.Any]], ctx: str | None = None, expire: int | None = None
+    ) -> int:
+        """Bulk write to the L2, the values are not loaded into the L1 (to not
+        evict the hot values), outdated values are dropped from the L1."""
+        items = list(items)
+        l1_ctx = self._ctx(ctx)
+        for key, _ in items:
+            self._drop((l1_ctx, key))
+        return self.l2.set_many(items, ctx=ctx, expire=expire)
+
+    def pairs(self, ctx: str) -> Iterator[tuple[str, typing.Any]]:
+        """Iterate over key/value pairs of the L2 (see
+        :py:obj:`ExpireCacheSQLite.pairs`)."""
+        return self.l2.pairs(ctx)  # type: ignore
+
+    def clear(self):
+        """Drop all values from the L1 cache."""
+        with self._lock:
+            self._data.clear()
+            self._bytes = 0
+
+    def maintenance(self, force: bool = False, truncate: bool = False) -> bool:
+        if truncate:
+            self.clear()
+        else:
+            now = time.time()
+            with self._lock:
+                for l1_key in [k for k, item in self._data.items() if item[1] <= now]:
+                    self._bytes -= self._data.pop(l1_key)[2]
+        return self.l2.maintenance(force=force, truncate=truncate)
+
+    def state(self) -> ExpireCacheStats:
+        return self.l2.state()
@@ -12,7 +12,10 @@ import json
 import typing
 
 from .core import log, data_dir
+from . import artifacts
+from .ahmia_blacklist import AhmiaBlacklistDB
 from .currencies import CurrenciesDB
+from .external_bangs import ExternalBangsDB
 from .tracker_patterns import TrackerPatternsDB
 
 CURRENCIES: CurrenciesDB
@@ -20,6 +23,7 @@ USER_AGENTS: dict[str, typing.Any]
 EXTERNAL_URLS: dict[str, typing.Any]
 WIKIDATA_UNITS: dict[str, typing.Any]
 EXTERNAL_BANGS: dict[str, typing.Any]
+EXTERNAL_BANGS_DB: ExternalBangsDB
 OSM_KEYS_TAGS: dict[str, typing.Any]
 ENGINE_DESCRIPTIONS: dict[str, typing.Any]
 ENGINE_TRAITS: dict[str, typing.Any]
@@ -32,6 +36,7 @@ lazy_globals = {
     "EXTERNAL_URLS": None,
     "WIKIDATA_UNITS": None,
     "EXTERNAL_BANGS": None,
+    "EXTERNAL_BANGS_DB": ExternalBangsDB(),
     "OSM_KEYS_TAGS": None,
     "ENGINE_DESCRIPTIONS": None,
     "ENGINE_TRAITS": None,
@@ -62,20 +67,29 @@ def __getattr__(name):
 
     log.debug("init searx.data.%s", name)
 
-    with open(data_dir / data_json_files[name], encoding='utf-8') as f:
+    json_file = data_dir / data_json_files[name]
+    if name in artifacts.ARTIFACTS:
+        # precompiled artifact, only the entries accessed are decoded
+        data = artifacts.load_current(json_file)
+        if data is not None:
+            lazy_globals[name] = data
+            return data
+
+    with open(json_file, encoding='utf-8') as f:
         lazy_globals[name] = json.load(f)
 
     return lazy_globals[name]
 
 
-def ahmia_blacklist_loader():
-    """Load data from `ahmia_blacklist.txt` and return a list of MD5 values of onion
-    names.  The MD5 values are fetched by::
+def ahmia_blacklist_loader() -> AhmiaBlacklistDB:
+    """Load data from `ahmia_blacklist.txt` and return the set of MD5 values of
+    onion names (:py:obj:`AhmiaBlacklistDB`).  The MD5 values are fetched by::
 
       searxng_extra/update/update_ahmia_blacklist.py
 
     This function is used by :py:mod:`searx.plugins.ahmia_filter`.
 
     """
-    with open(data_dir / 'ahmia_blacklist.txt', encoding='utf-8') as f:
-        return f.read().split()
+    blacklist = AhmiaBlacklistDB()
+    blacklist.init()
+    return blacklist
@@ -0,0 +1,140 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+"""Static index of `Ahmia's blacklist`_.
+
+The index is a precompiled binary file :origin:`searx/data/ahmia_blacklist.idx`
+(compiled from :origin:`searx/data/ahmia_blacklist.txt` by
+:origin:`searxng_extra/update/update_ahmia_blacklist.py`), see
+:py:obj:`searx.data.artifacts.DataIndex`.  Nothing is decoded on load.
+
+Layout of the index (all integers are little-endian ``uint32``):
+
+- stamp of the text file (:py:obj:`searx.data.artifacts.STAMP`)
+- header: number of MD5 digests ``N``, number of bits ``M`` and number of hash
+  functions ``K`` of the Bloom filter (``M`` is 0 if the index has no Bloom
+  filter)
+- Bloom filter: ``ceil(M / 8)`` bytes, bit ``i`` is bit ``i % 8`` of byte ``i //
+  8``
+- ``N`` MD5 digests (16 bytes each), sorted bytewise
+
+A MD5 value is looked up in the Bloom filter first, most of the onion names are
+not in the blacklist and are rejected by the filter.  The values that pass the
+filter are looked up by bisection of the sorted digests.  The bit positions of
+a value in the Bloom filter are derived from the MD5 digest itself (double
+hashing of the two 64 bit halves).
+
+.. _Ahmia's blacklist: https://ahmia.fi/blacklist/
+"""
+
+from __future__ import annotations
+
+__all__ = ["AhmiaBlacklistDB"]
+
+import bisect
+import collections.abc
+import pathlib
+import struct
+import typing
+
+from .artifacts import DataIndex
+
+_DIGEST_SIZE = 16
+_HALVES = struct.Struct("<QQ")
+
+
+class _Digests(collections.abc.Sequence):
+    """Sorted sequence of the MD5 digests (``bytes``) in the index."""
+
+    def __init__(self, buf: memoryview):
+        self._buf = buf
+
+    def __getitem__(self, i):
+        if not 0 <= i < len(self):
+            raise IndexError("digest index out of range")
+        return bytes(self._buf[i * _DIGEST_SIZE : (i + 1) * _DIGEST_SIZE])
+
+    def __len__(self):
+        return len(self._buf) // _DIGEST_SIZE
+
+
+def _bloom_bits(digest: bytes, m: int, k: int) -> typing.Iterator[int]:
+    h1, h2 = _HALVES.unpack(digest)
+    for i in range(k):
+        yield (h1 + i * h2) % m
+
+
+class AhmiaBlacklistDB(DataIndex, collections.abc.Set):
+    """Memory-mapped, immutable set of the MD5 values of the onion names in
+    Ahmia's blacklist.  The members are the MD5 values as hex strings, a MD5
+    digest (``bytes``) can also be tested (``digest in db``)."""
+
+    MAGIC = b"SXNGAHM3"
+    HEADER = struct.Struct("<III")
+
+    BLOOM_BITS_PER_ENTRY = 10
+    """Size of the Bloom filter (bits per entry), with 7 hash functions the
+    false positive rate is about 1%."""
+    BLOOM_HASH_FUNCTIONS = 7
+
+    source_file = pathlib.Path(__file__).parent / "ahmia_blacklist.txt"
+    index_file = pathlib.Path(__file__).parent / "ahmia_blacklist.idx"
+
+    def __init__(self):
+        super().__init__()
+        self._buf: memoryview | None = None
+        self._digests: _Digests
+        self._bloom: memoryview
+        self._bloom_m = 0
+        self._bloom_k = 0
+
+    def load_index(self, buf: memoryview):
+        n, m, k = self.HEADER.unpack_from(buf, 0)
+
+        pos = self.HEADER.size
+        self._bloom = buf[pos : pos + (m + 7) // 8]
+        self._bloom_m, self._bloom_k = m, k
+        pos += (m + 7) // 8
+        self._digests = _Digests(buf[pos : pos + n * _DIGEST_SIZE])
+        self._buf = buf
+
+    @classmethod
+    def compile_index(cls, source: bytes, bloom_bits_per_entry: int = BLOOM_BITS_PER_ENTRY) -> bytes:
+        """Compiles the index from the text file, a ``bloom_bits_per_entry`` of
+        0 compiles an index without a Bloom filter."""
+        digests = sorted({bytes.fromhex(md5_hex) for md5_hex in source.decode("utf-8").split()})
+
+        m = len(digests) * bloom_bits_per_entry
+        k = cls.BLOOM_HASH_FUNCTIONS if m else 0
+        bloom = bytearray((m + 7) // 8)
+        for digest in digests if m else ():
+            for bit in _bloom_bits(digest, m, k):
+                bloom[bit >> 3] |= 1 << (bit & 7)
+
+        return b"".join([cls.HEADER.pack(len(digests), m, k), bytes(bloom), *digests])
+
+    def __contains__(self, value: object) -> bool:
+        self.init()
+
+        if isinstance(value, str):
+            try:
+                value = bytes.fromhex(value)
+            except ValueError:
+                return False
+        if not isinstance(value, bytes) or len(value) != _DIGEST_SIZE:
+            return False
+
+        if self._bloom_m:
+            bloom = self._bloom
+            for bit in _bloom_bits(value, self._bloom_m, self._bloom_k):
+                if not bloom[bit >> 3] & (1 << (bit & 7)):
+                    return False
+
+        i = bisect.bisect_left(self._digests, value)
+        return i < len(self._digests) and self._digests[i] == value
+
+    def __iter__(self) -> typing.Iterator[str]:
+        self.init()
+        return (digest.hex() for digest in self._digests)
+
+    def __len__(self) -> int:
+        self.init()
+        return len(self._digests)
@@ -0,0 +1,355 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+"""Precompiled binary artifacts of the JSON data files.
+
+The large JSON files in :origin:`searx/data` (e.g. ``osm_keys_tags.json``) are
+compiled into binary artifacts (``*.bin``).  An artifact is opened by
+:py:obj:`load` as a memory-mapped file, the returned :py:obj:`LazyMap` decodes
+only the entries that are accessed.  The pages of the file are shared by all
+worker processes through the page cache of the OS.
+
+An outdated artifact is not used (:py:obj:`load_current`), the JSON file is
+loaded instead.  Other data files are compiled into an index of their own
+format (:py:obj:`DataIndex`).
+
+All compiled files start with a stamp of their source file (:py:obj:`STAMP`).
+On load, only the size of the source file is compared with the stamp (a
+``stat``, the source file is not read).  Whether the compiled files are
+compiled from the current content of their source files (SHA-256 hash) is
+checked at build time::
+
+  $ python -m searx.data.artifacts check
+
+Layout of an artifact:
+
+- header: the stamp of the JSON file (:py:obj:`STAMP`), offset and length of
+  the root node (little-endian ``uint64``)
+- nodes: a node starts with a type byte
+
+  ``NODE_VALUE``:
+    The value encoded by msgpack.
+
+  ``NODE_MAP``:
+    A msgpack array ``[keys, offsets, lengths]``, the keys are in the order of
+    the JSON object, offsets and lengths address the nodes of the values.
+
+A JSON object is compiled into a ``NODE_MAP`` when its msgpack encoding is
+larger than :py:obj:`MAP_MIN_BYTES`, smaller objects are a ``NODE_VALUE`` (a
+``dict`` when decoded).
+
+To compile the artifacts and the indexes (the update scripts in
+:origin:`searxng_extra/update` do this after writing the source file)::
+
+  $ python -m searx.data.artifacts compile
+
+"""
+
+from __future__ import annotations
+
+__all__ = ["LazyMap", "DataIndex", "load", "load_current", "compile_json", "ARTIFACTS", "STAMP"]
+
+import collections.abc
+import hashlib
+import importlib
+import json
+import mmap
+import pathlib
+import struct
+import threading
+import typing
+
+import msgspec
+import typer
+
+from .core import log, data_dir
+
+STAMP = struct.Struct("<8sQ32s")
+"""Header of a compiled data file: the magic of the format, size (``uint64``)
+and SHA-256 hash of the source file."""
+
+MAGIC = b"SXNGDAT2"
+ROOT = struct.Struct("<QQ")
+
+NODE_VALUE = 0
+NODE_MAP = 1
+
+MAP_MIN_BYTES = 1024 * 4
+"""JSON objects smaller than this (msgpack encoded) are not split into a
+:py:obj:`LazyMap`."""
+
+ARTIFACTS: dict[str, str] = {
+    "OSM_KEYS_TAGS": "osm_keys_tags.json",
+    "ENGINE_DESCRIPTIONS": "engine_descriptions.json",
+}
+"""Data (name of the global in :py:obj:`searx.data`) compiled into an artifact
+and the JSON file it is compiled from.  The external bangs are not compiled
+into an artifact, they have their own index
+(:py:obj:`searx.data.external_bangs.ExternalBangsDB`)."""
+
+DATA_INDEXES: list[str] = [
+    "searx.data.ahmia_blacklist:AhmiaBlacklistDB",
+    "searx.data.currencies:CurrenciesDB",
+    "searx.data.external_bangs:ExternalBangsDB",
+]
+"""The :py:obj:`DataIndex` classes (``<module>:<class>``)."""
+
+_MISSING = object()
+
+
+def artifact_file(json_file: pathlib.Path) -> pathlib.Path:
+    return json_file.with_suffix(".bin")
+
+
+def stamp(magic: bytes, source: bytes) -> bytes:
+    """Returns the :py:obj:`STAMP` of the ``source`` (content of the source
+    file)."""
+    return STAMP.pack(magic, len(source), hashlib.sha256(source).digest())
+
+
+def is_current(path: pathlib.Path, source_file: pathlib.Path, magic: bytes, verify: bool = False) -> bool:
+    """Returns ``True`` if the compiled file ``path`` exists and its stamp
+    matches the ``source_file``.  Only the size of the source file is compared
+    (``stat``), with ``verify`` the SHA-256 hash of the source file is compared
+    (the source file is read)."""
+    try:
+        with open(path, "rb") as f:
+            header = f.read(STAMP.size)
+        size = source_file.stat().st_size
+    except FileNotFoundError:
+        return False
+    if len(header) < STAMP.size:
+        return False
+    file_magic, source_size, digest = STAMP.unpack(header)
+    if file_magic != magic or source_size != size:
+        return False
+    return not verify or digest == hashlib.sha256(source_file.read_bytes()).digest()
+
+
+def _map_file(path: pathlib.Path) -> mmap.mmap:
+    with open(path, "rb") as f:
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+class DataIndex:
+    """Base class of an index that is compiled from a data file
+    (:py:obj:`DataIndex.source_file`) into a binary file
+    (:py:obj:`DataIndex.index_file`), e.g. by the update script of the data
+    file (:py:obj:`DataIndex.write_index`).
+
+    The index file starts with the :py:obj:`STAMP` of the source file and is
+    memory-mapped on load.  If the index file does not exist or is outdated,
+    the index is compiled into memory from the source file.  The index is
+    loaded once per process, on first use (:py:obj:`DataIndex.init`)."""
+
+    MAGIC: typing.ClassVar[bytes]
+    source_file: typing.ClassVar[pathlib.Path]
+    index_file: typing.ClassVar[pathlib.Path]
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._loaded = False
+
+    def init(self):
+        if self._loaded:
+            return
+        with self._lock:
+            if not self._loaded:
+                self.load()
+                self._loaded = True
+
+    def load(self):
+        log.debug("init %s", self.__class__.__name__)
+        if self.is_current():
+            buf = memoryview(_map_file(self.index_file))
+        else:
+            if self.index_file.exists():
+                log.warning("%s is outdated, build index from %s", self.index_file.name, self.source_file.name)
+            else:
+                log.debug("%s does not exist, build index from %s", self.index_file.name, self.source_file.name)
+            buf = memoryview(self.compile())
+        self.load_index(buf[STAMP.size :])
+
+    def load_index(self, buf: memoryview):
+        """Loads the index from ``buf`` (the index file without the stamp)."""
+        raise NotImplementedError
+
+    @classmethod
+    def compile_index(cls, source: bytes) -> bytes:
+        """Compiles the index (without the stamp) from ``source`` (the content
+        of the source file)."""
+        raise NotImplementedError
+
+    @classmethod
+    def compile(cls, **kwargs) -> bytes:
+        """Compiles the index file from :py:obj:`DataIndex.source_file`, the
+        ``kwargs`` are passed to :py:obj:`DataIndex.compile_index`."""
+        source = cls.source_file.read_bytes()
+        return stamp(cls.MAGIC, source) + cls.compile_index(source, **kwargs)
+
+    @classmethod
+    def write_index(cls):
+        """Writes the compiled index (:py:obj:`DataIndex.compile`) to
+        :py:obj:`DataIndex.index_file`."""
+        cls.index_file.write_bytes(cls.compile())
+
+    @classmethod
+    def is_current(cls, verify: bool = False) -> bool:
+        """See :py:obj:`searx.data.artifacts.is_current`."""
+        return is_current(cls.index_file, cls.source_file, cls.MAGIC, verify=verify)
+
+
+def data_indexes() -> list[type[DataIndex]]:
+    """Returns the classes in :py:obj:`DATA_INDEXES`."""
+    ret_val = []
+    for name in DATA_INDEXES:
+        module_name, class_name = name.split(":")
+        ret_val.append(getattr(importlib.import_module(module_name), class_name))
+    return ret_val
+
+
+class LazyMap(collections.abc.Mapping):
+    """Read-only mapping of a ``NODE_MAP`` in an artifact, the values are
+    decoded on first access and then held in the map."""
+
+    __slots__ = ("_buf", "_keys", "_offsets", "_lengths", "_index", "_values")
+
+    def __init__(self, buf: memoryview, keys: list[str], offsets: list[int], lengths: list[int]):
+        self._buf = buf
+        self._keys = keys
+        self._offsets = offsets
+        self._lengths = lengths
+        self._index = {key: i for i, key in enumerate(keys)}
+        self._values: dict[str, typing.Any] = {}
+
+    def __getitem__(self, key: str) -> typing.Any:
+        value = self._values.get(key, _MISSING)
+        if value is _MISSING:
+            i = self._index[key]
+            value = _decode_node(self._buf, self._offsets[i], self._lengths[i])
+            self._values[key] = value
+        return value
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._index
+
+    def __iter__(self) -> typing.Iterator[str]:
+        return iter(self._keys)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def copy(self) -> dict[str, typing.Any]:
+        """Returns a (shallow) ``dict`` of the map."""
+        return dict(self.items())
+
+
+def _decode_node(buf: memoryview, offset: int, length: int) -> typing.Any:
+    node_type = buf[offset]
+    data = buf[offset + 1 : offset + length]
+    if node_type == NODE_MAP:
+        keys, offsets, lengths = msgspec.msgpack.decode(data)
+        return LazyMap(buf, keys, offsets, lengths)
+    return msgspec.msgpack.decode(data)
+
+
+_LOCK = threading.Lock()
+_MMAPS: dict[pathlib.Path, mmap.mmap] = {}
+
+
+def load(path: pathlib.Path) -> LazyMap:
+    """Opens the artifact ``path`` and returns the :py:obj:`LazyMap` of the
+    root node.  The file is mapped once per process."""
+    with _LOCK:
+        mm = _MMAPS.get(path)
+        if mm is None:
+            mm = _map_file(path)
+            _MMAPS[path] = mm
+    magic, _, _ = STAMP.unpack_from(mm, 0)
+    if magic != MAGIC:
+        raise ValueError(f"{path} is not a data artifact")
+    offset, length = ROOT.unpack_from(mm, STAMP.size)
+    root = _decode_node(memoryview(mm), offset, length)
+    if not isinstance(root, LazyMap):
+        raise ValueError(f"root of {path} is not a map")
+    return root
+
+
+def load_current(json_file: pathlib.Path) -> LazyMap | None:
+    """Returns the :py:obj:`LazyMap` of the artifact of the JSON file or
+    ``None`` if the artifact does not exist or is outdated (see
+    :py:obj:`is_current`)."""
+    path = artifact_file(json_file)
+    if not is_current(path, json_file, MAGIC):
+        if path.exists():
+            log.warning("%s is outdated, load %s", path.name, json_file.name)
+        return None
+    return load(path)
+
+
+def _compile_node(value: typing.Any, out: bytearray, as_map: bool = False) -> tuple[int, int]:
+    data = msgspec.msgpack.encode(value)
+    if isinstance(value, dict) and (as_map or len(data) >= MAP_MIN_BYTES):
+        keys = list(value.keys())
+        nodes = [_compile_node(value[key], out) for key in keys]
+        data = msgspec.msgpack.encode([keys, [n[0] for n in nodes], [n[1] for n in nodes]])
+        node_type = NODE_MAP
+    else:
+        node_type = NODE_VALUE
+    offset = len(out)
+    out.append(node_type)
+    out += data
+    return offset, len(data) + 1
+
+
+def compile_json(json_file: pathlib.Path) -> pathlib.Path:
+    """Compiles the JSON file into an artifact (in the same folder, suffix
+    ``.bin``), the root of the JSON file has to be an object."""
+    source = json_file.read_bytes()
+    value = json.loads(source)
+    out = bytearray(stamp(MAGIC, source) + bytes(ROOT.size))
+    offset, length = _compile_node(value, out, as_map=True)
+    ROOT.pack_into(out, STAMP.size, offset, length)
+    path = artifact_file(json_file)
+    path.write_bytes(bytes(out))
+    log.debug("compiled %s (%s bytes) into %s (%s bytes)", json_file.name, len(source), path.name, len(out))
+    return path
+
+
+app = typer.Typer()
+
+
+def outdated_files() -> list[str]:
+    """Returns the names of the source files whose artifact or index is missing
+    or not compiled from the current content of the source file."""
+    outdated = [
+        json_name
+        for json_name in ARTIFACTS.values()
+        if not is_current(artifact_file(data_dir / json_name), data_dir / json_name, MAGIC, verify=True)
+    ]
+    outdated += [cls.source_file.name for cls in data_indexes() if not cls.is_current(verify=True)]
+    return outdated
+
+
+@app.command("compile")
+def compile_all():
+    """Compile the artifacts and the indexes of all data files."""
+    for json_name in ARTIFACTS.values():
+        path = compile_json(data_dir / json_name)
+        print(f"{json_name} --> {path.name}")
+    for cls in data_indexes():
+        cls.write_index()
+        print(f"{cls.source_file.name} --> {cls.index_file.name}")
+
+
+@app.command()
+def check():
+    """Check if the artifacts and the indexes are compiled from the current
+    data files."""
+    outdated = outdated_files()
+    for name in outdated:
+        print(f"{name}: artifact / index is missing or outdated")
+    if outdated:
+        raise typer.Exit(1)
+
+
+if __name__ == "__main__":
+    app()
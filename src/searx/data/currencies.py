@@ -1,50 +1,95 @@
 # SPDX-License-Identifier: AGPL-3.0-or-later
-"""Simple implementation to store currencies data in a SQL database."""
+"""In-memory index of the currencies data.
+
+The index is built once per process from the precompiled binary file
+:origin:`searx/data/currencies.msgpack` (compiled from
+:origin:`searx/data/currencies.json` by
+:origin:`searxng_extra/update/update_currencies.py`), see
+:py:obj:`searx.data.artifacts.DataIndex`.  If the file does not exists or is
+outdated, the index is built from the JSON file.
+
+Layout of the index file:
+
+- stamp of the JSON file (:py:obj:`searx.data.artifacts.STAMP`)
+- msgpack map of the sorted (normalized) currency ``names``, the ``codes`` of
+  the names and the ``iso4217`` names of the currency codes
+"""
 
 from __future__ import annotations
 
 __all__ = ["CurrenciesDB"]
 
+import bisect
 import json
 import pathlib
+import sys
 
-from .core import get_cache, log
+import msgspec
 
+from .artifacts import DataIndex
 
-class CurrenciesDB:
-    # pylint: disable=missing-class-docstring
 
-    ctx_names = "data_currencies_names"
-    ctx_iso4217 = "data_currencies_iso4217"
+class CurrenciesDB(DataIndex):
+    """Immutable index of the currency names and the names of the ISO 4217
+    currency codes.
 
-    json_file = pathlib.Path(__file__).parent / "currencies.json"
+    The (normalized) currency names are held in a sorted array, a name is
+    looked up by bisection and all names starting with a prefix are in one
+    range of the array (:py:obj:`CurrenciesDB.complete`).  The names, the ISO
+    4217 codes and the language tags are interned, the codes and language tags
+    are repeated many times in the data.
+    """
+
+    MAGIC = b"SXNGCUR1"
+    source_file = pathlib.Path(__file__).parent / "currencies.json"
+    index_file = pathlib.Path(__file__).parent / "currencies.msgpack"
 
     def __init__(self):
-        self.cache = get_cache()
-
-    def init(self):
-        if self.cache.properties("currencies loaded") != "OK":
-            # To avoid parallel initializations, the property is set first
-            self.cache.properties.set("currencies loaded", "OK")
-            self.load()
-        # F I X M E:
-        #     do we need a maintenance .. rember: database is stored
-        #     in /tmp and will be rebuild during the reboot anyway
-
-    def load(self):
-        log.debug("init searx.data.CURRENCIES")
-        with open(self.json_file, encoding="utf-8") as f:
-            data_dict = json.load(f)
-        for key, value in data_dict["names"].items():
-            self.cache.set(key=key, value=value, ctx=self.ctx_names, expire=None)
-        for key, value in data_dict["iso4217"].items():
-            self.cache.set(key=key, value=value, ctx=self.ctx_iso4217, expire=None)
+        super().__init__()
+        self._names: list[str] = []
+        # ISO 4217 code of the name at the same position in self._names, if
+        # there are more alternatives, the tuple of the alternatives
+        self._codes: list[str | tuple[str, ...]] = []
+        self._iso4217: dict[str, dict[str, str]] = {}
+
+    def load_index(self, buf: memoryview):
+        data = msgspec.msgpack.decode(buf)
+
+        _intern = sys.intern
+        self._names = [_intern(name) for name in data["names"]]
+        self._codes = [
+            _intern(code) if isinstance(code, str) else tuple(_intern(c) for c in code) for code in data["codes"]
+        ]
+        self._iso4217 = {
+            _intern(iso4217): {_intern(lang): label for lang, label in labels.items()}
+            for iso4217, labels in data["iso4217"].items()
+        }
+
+    @classmethod
+    def compile_index(cls, source: bytes) -> bytes:
+        data_dict = json.loads(source)
+        names = sorted(data_dict["names"])
+        return msgspec.msgpack.encode(
+            {
+                "names": names,
+                "codes": [data_dict["names"][name] for name in names],
+                "iso4217": data_dict["iso4217"],
+            }
+        )
+
+    def _lookup(self, name: str) -> str | tuple[str, ...] | None:
+        i = bisect.bisect_left(self._names, name)
+        if i < len(self._names) and self._names[i] == name:
+            return self._codes[i]
+        return None
 
     def name_to_iso4217(self, name):
         self.init()
 
-        ret_val = self.cache.get(key=name, default=name, ctx=self.ctx_names)
-        if isinstance(ret_val, list):
+        ret_val = self._lookup(name)
+        if ret_val is None:
+            return name
+        if isinstance(ret_val, tuple):
             # if more alternatives, use the last in the list
             ret_val = ret_val[-1]
         return ret_val
@@ -52,5 +97,19 @@ class CurrenciesDB:
     def iso4217_to_name(self, iso4217, language):
         self.init()
 
-        iso4217_languages: dict = self.cache.get(key=iso4217, default={}, ctx=self.ctx_iso4217)
-        return iso4217_languages.get(language, iso4217)
+        return self._iso4217.get(iso4217, {}).get(language, iso4217)
+
+    def complete(self, prefix: str, limit: int = 10) -> list[tuple[str, str]]:
+        """Returns up to ``limit`` (name, ISO 4217 code) tuples of the currency
+        names starting with the (normalized) ``prefix``."""
+        self.init()
+        ret_val = []
+        i = bisect.bisect_left(self._names, prefix)
+        while i < len(self._names) and len(ret_val) < limit:
+            name = self._names[i]
+            if not name.startswith(prefix):
+                break
+            code = self._codes[i]
+            ret_val.append((name, code[-1] if isinstance(code, tuple) else code))
+            i += 1
+        return ret_val
@@ -0,0 +1,199 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+"""Static index of the external bangs.
+
+The index is a precompiled binary file :origin:`searx/data/external_bangs.idx`
+(compiled from the trie in :origin:`searx/data/external_bangs.json` by
+:origin:`searxng_extra/update/update_external_bangs.py`), see
+:py:obj:`searx.data.artifacts.DataIndex`.  Nothing is decoded on load.
+
+Layout of the index (all integers are little-endian ``uint32``):
+
+- stamp of the JSON file (:py:obj:`searx.data.artifacts.STAMP`)
+- header: number of bangs ``N`` and number of bang definitions ``D``
+- ``N + 1`` offsets of the bang names in the names blob
+- ``N`` numbers, the definition of the bang at the same position
+- ``D + 1`` offsets of the definitions in the definitions blob
+- ``D`` numbers, the rank of the definition at the same position
+- names blob: the UTF-8 encoded bang names, sorted bytewise
+- definitions blob: the UTF-8 encoded definitions (``<url> chr(1) <rank>``)
+
+A bang is looked up by bisection of the sorted names, all bangs starting with
+a prefix are in one range of the names (:py:obj:`ExternalBangsDB.complete`).
+"""
+
+from __future__ import annotations
+
+__all__ = ["ExternalBangsDB"]
+
+import bisect
+import collections.abc
+import json
+import pathlib
+import struct
+import sys
+import typing
+from array import array
+
+from .artifacts import DataIndex
+
+LEAF_KEY = chr(16)
+"""Key of a bang definition in the nodes of the trie in
+:origin:`searx/data/external_bangs.json`."""
+
+
+def _uint32_array(buf: memoryview) -> typing.Sequence[int]:
+    if sys.byteorder == "little":
+        return buf.cast("I")
+    a = array("I", buf)
+    a.byteswap()
+    return a
+
+
+class _Names(collections.abc.Sequence):
+    """Sorted sequence of the bang names (``bytes``) in the names blob.
+
+    Each :py:obj:`_Names.SAMPLE_STEP` name is held in a (small) list, a name is
+    located by bisection of this list first and then by bisection of the
+    block in the names blob."""
+
+    SAMPLE_STEP = 32
+
+    def __init__(self, blob: memoryview, offsets: typing.Sequence[int]):
+        self._blob = blob
+        self._offsets = offsets
+        self._sample = [self[i] for i in range(0, len(self), self.SAMPLE_STEP)]
+
+    def bisect_left(self, name: bytes) -> int:
+        k = bisect.bisect_left(self._sample, name)
+        if k == 0:
+            return 0
+        lo = (k - 1) * self.SAMPLE_STEP + 1
+        return bisect.bisect_left(self, name, lo, min(k * self.SAMPLE_STEP, len(self)))
+
+    def bisect_right(self, name: bytes) -> int:
+        k = bisect.bisect_right(self._sample, name)
+        if k == 0:
+            return 0
+        lo = (k - 1) * self.SAMPLE_STEP + 1
+        return bisect.bisect_right(self, name, lo, min(k * self.SAMPLE_STEP, len(self)))
+
+    def __getitem__(self, i):
+        return bytes(self._blob[self._offsets[i] : self._offsets[i + 1]])
+
+    def __len__(self):
+        return len(self._offsets) - 1
+
+
+class ExternalBangsDB(DataIndex):
+    """Memory-mapped, immutable index of the external bangs."""
+
+    MAGIC = b"SXNGBNG3"
+    HEADER = struct.Struct("<II")
+
+    source_file = pathlib.Path(__file__).parent / "external_bangs.json"
+    index_file = pathlib.Path(__file__).parent / "external_bangs.idx"
+
+    def __init__(self):
+        super().__init__()
+        self._buf: memoryview | None = None
+        self._names: _Names
+        self._name_defs: typing.Sequence[int]
+        self._def_offsets: typing.Sequence[int]
+        self._def_ranks: typing.Sequence[int]
+        self._defs: memoryview
+
+    def load_index(self, buf: memoryview):
+        n, d = self.HEADER.unpack_from(buf, 0)
+
+        pos = self.HEADER.size
+        sections = []
+        for size in (n + 1, n, d + 1, d):
+            sections.append(_uint32_array(buf[pos : pos + 4 * size]))
+            pos += 4 * size
+        name_offsets, self._name_defs, self._def_offsets, self._def_ranks = sections
+
+        names_end = pos + name_offsets[n]
+        self._names = _Names(buf[pos:names_end], name_offsets)
+        self._defs = buf[names_end : names_end + self._def_offsets[d]]
+        self._buf = buf
+
+    @classmethod
+    def compile_index(cls, source: bytes) -> bytes:
+        """Compiles the index from the trie in the JSON file."""
+        trie = json.loads(source)["trie"]
+
+        bangs: dict[bytes, str] = {}
+
+        def walk(node, prefix: str):
+            if isinstance(node, str):
+                bangs[prefix.encode()] = node
+                return
+            for key, value in node.items():
+                if key == LEAF_KEY:
+                    bangs[prefix.encode()] = value
+                else:
+                    walk(value, prefix + key)
+
+        walk(trie, "")
+
+        definitions: dict[str, int] = {}
+        for definition in bangs.values():
+            definitions.setdefault(definition, len(definitions))
+
+        names = sorted(bangs)
+        name_offsets = array("I", [0])
+        for name in names:
+            name_offsets.append(name_offsets[-1] + len(name))
+        name_defs = array("I", [definitions[bangs[name]] for name in names])
+
+        def_blobs = [definition.encode() for definition in definitions]
+        def_offsets = array("I", [0])
+        for blob in def_blobs:
+            def_offsets.append(def_offsets[-1] + len(blob))
+        def_ranks = array("I", [int(definition.split(chr(1))[1] or 0) for definition in definitions])
+
+        if sys.byteorder != "little":
+            for a in (name_offsets, name_defs, def_offsets, def_ranks):
+                a.byteswap()
+
+        return b"".join(
+            [
+                cls.HEADER.pack(len(names), len(definitions)),
+                name_offsets.tobytes(),
+                name_defs.tobytes(),
+                def_offsets.tobytes(),
+                def_ranks.tobytes(),
+                *names,
+                *def_blobs,
+            ]
+        )
+
+    def _definition(self, i: int) -> str:
+        d = self._name_defs[i]
+        return str(self._defs[self._def_offsets[d] : self._def_offsets[d + 1]], "utf-8")
+
+    def get(self, bang: str) -> str | None:
+        """Returns the definition of the ``bang`` (``<url> chr(1) <rank>``) or
+        ``None`` if there is no such bang."""
+        self.init()
+
+        name = bang.encode()
+        i = self._names.bisect_left(name)
+        if i < len(self._names) and self._names[i] == name:
+            return self._definition(i)
+        return None
+
+    def complete(self, prefix: str) -> list[str]:
+        """Returns the bangs starting with ``prefix`` (``prefix`` itself is not
+        included), sorted by rank (descending) and name."""
+        self.init()
+
+        name = prefix.encode()
+        # 0xff is not part of any UTF-8 encoded string
+        lo = self._names.bisect_right(name)
+        hi = self._names.bisect_left(name + b"\xff")
+        ranks = self._def_ranks
+        name_defs = self._name_defs
+        bangs = [(-ranks[name_defs[i]], str(self._names[i], "utf-8")) for i in range(lo, hi)]
+        bangs.sort()
+        return [bang for _, bang in bangs]
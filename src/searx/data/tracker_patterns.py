@@ -1,5 +1,9 @@
 # SPDX-License-Identifier: AGPL-3.0-or-later
-"""Simple implementation to store TrackerPatterns data in a SQL database."""
+"""Simple implementation to store TrackerPatterns data in a SQL database.
+
+The rules are stored in the SQL database, for the lookups the rules are
+compiled once per process into memory (:py:obj:`TrackerPatternsDB.compiled`).
+"""
 
 from __future__ import annotations
 import typing
@@ -7,6 +11,7 @@ import typing
 __all__ = ["TrackerPatternsDB"]
 
 import re
+import threading
 from collections.abc import Iterator
 from urllib.parse import urlparse, urlunparse, parse_qsl, urlencode
 
@@ -17,6 +22,121 @@ from searx.network import get as http_get
 
 RuleType = tuple[str, list[str], list[str]]
 
+# Most of the ClearURLs ``urlPattern`` have the form:
+#
+#   ^https?:\/\/(?:[a-z0-9-]+\.)*?amazon(?:\.[a-z]{2,}){1,}
+#
+# the literal (``amazon``) is a label of the host name in all URLs matching the
+# pattern, the rule can be indexed by this label.
+_HOST_PATTERN_PREFIX = re.compile(
+    r"\^https\?:(?:\\/|/){2}(?:\(\?:\[a-z0-9-\]\+\\\.\)\*\??|\(\?:www\\\.\)\?)?"
+)
+_HOST_PATTERN_LABEL = re.compile(r"[a-z0-9-]+")
+# a label is complete when it is followed by one of these (a pattern that ends
+# after the label also matches host names with a longer label, e.g. ``amazon``
+# matches ``amazonaws.com``)
+_HOST_PATTERN_LABEL_END = ("\\.", "(?:\\.", "\\/", "(?:\\/", "/", ":", "$")
+_URL_NETLOC_SPLIT = re.compile(r"[.@:]")
+
+
+class CompiledRule(typing.NamedTuple):
+    """A rule of the :py:obj:`TrackerPatternsDB` with compiled regular
+    expressions."""
+
+    pos: int
+    """Position of the rule in the rule list (the rules are applied in this
+    order)."""
+
+    url_regexp: re.Pattern
+    url_ignore: re.Pattern | None
+    """Alternation of all URL patterns to ignore."""
+
+    del_args: re.Pattern | None
+    """Alternation of all patterns of the URL arguments to delete."""
+
+
+class CompiledRules(typing.NamedTuple):
+    """The compiled rules of the :py:obj:`TrackerPatternsDB`, indexed by
+    host name labels."""
+
+    by_host: dict[str, list[CompiledRule]]
+    """Rules whose URL pattern requires a host name with this label
+    (e.g. ``amazon`` for ``www.amazon.de``)."""
+
+    other: list[CompiledRule]
+    """Rules that can't be indexed by a host name label (e.g. ``.*``), these
+    rules are tested for all URLs."""
+
+
+def _is_label_end(pattern: str) -> bool:
+    """Returns ``True`` if the ``pattern`` (the rest of an URL pattern after a
+    label of the host name) can't continue the label."""
+
+    end = next((end for end in _HOST_PATTERN_LABEL_END if pattern.startswith(end)), None)
+    if end is None:
+        return False
+    rest = pattern[len(end) :]
+    if end.startswith("(?:"):
+        # the group must not have an alternative that continues the label
+        depth = 0
+        escaped = False
+        for i, c in enumerate(pattern):
+            if escaped:
+                escaped = False
+            elif c == "\\":
+                escaped = True
+            elif c == "(":
+                depth += 1
+            elif c == ")":
+                depth -= 1
+                if depth == 0:
+                    rest = pattern[i + 1 :]
+                    break
+            elif c == "|" and depth == 1:
+                return False
+        else:
+            return False
+    # .. and must not be optional
+    return not rest.startswith(("?", "*", "{0", "{,"))
+
+
+def host_label(url_regexp: str) -> str | None:
+    """Returns the label of the host name required by the ``url_regexp``, or
+    ``None`` if no such label can be derived from the pattern."""
+
+    m = _HOST_PATTERN_PREFIX.match(url_regexp)
+    if not m:
+        return None
+    rest = url_regexp[m.end() :]
+    m = _HOST_PATTERN_LABEL.match(rest)
+    if not m:
+        return None
+    if not _is_label_end(rest[m.end() :]):
+        return None
+
+    # an alternation on the top level of the pattern ("..|..") can match URLs
+    # without this label
+    depth = 0
+    escaped = False
+    for c in url_regexp:
+        if escaped:
+            escaped = False
+        elif c == "\\":
+            escaped = True
+        elif c == "(":
+            depth += 1
+        elif c == ")":
+            depth -= 1
+        elif c == "|" and depth == 0:
+            return None
+    return m.group(0)
+
+
+def _alternation(patterns: list[str]) -> re.Pattern | None:
+    if not patterns:
+        return None
+    return re.compile("|".join(f"(?:{p})" for p in patterns))
+
 
 class TrackerPatternsDB:
     # pylint: disable=missing-class-docstring
@@ -38,6 +158,8 @@ class TrackerPatternsDB:
 
     def __init__(self):
         self.cache = get_cache()
+        self._compiled: CompiledRules | None = None
+        self._lock = threading.Lock()
 
     def init(self):
         if self.cache.properties("tracker_patterns loaded") != "OK":
@@ -50,18 +172,23 @@ class TrackerPatternsDB:
 
     def load(self):
         log.debug("init searx.data.TRACKER_PATTERNS")
-        for rule in self.iter_clear_list():
-            self.add(rule)
+        self.cache.set_many(
+            (self._cache_item(rule) for rule in self.iter_clear_list()),
+            ctx=self.ctx_name,
+            expire=None,
+        )
 
     def add(self, rule: RuleType):
-        self.cache.set(
-            key=rule[self.Fields.url_regexp],
-            value=(
+        key, value = self._cache_item(rule)
+        self.cache.set(key=key, value=value, ctx=self.ctx_name, expire=None)
+
+    def _cache_item(self, rule: RuleType) -> tuple[str, tuple[list[str], list[str]]]:
+        return (
+            rule[self.Fields.url_regexp],
+            (
                 rule[self.Fields.url_ignore],
                 rule[self.Fields.del_args],
             ),
-            ctx=self.ctx_name,
-            expire=None,
         )
 
     def rules(self) -> Iterator[RuleType]:
@@ -69,6 +196,39 @@ class TrackerPatternsDB:
         for key, value in self.cache.pairs(ctx=self.ctx_name):
             yield key, value[0], value[1]
 
+    def compiled(self) -> CompiledRules:
+        """Returns the :py:obj:`rules <TrackerPatternsDB.rules>` compiled into
+        :py:obj:`CompiledRules`, the rules are compiled once per process."""
+        if self._compiled is not None:
+            return self._compiled
+
+        with self._lock:
+            if self._compiled is None:
+                compiled = CompiledRules(by_host={}, other=[])
+                for pos, rule in enumerate(self.rules()):
+                    try:
+                        c_rule = CompiledRule(
+                            pos=pos,
+                            url_regexp=re.compile(rule[self.Fields.url_regexp]),
+                            url_ignore=_alternation(rule[self.Fields.url_ignore]),
+                            del_args=_alternation(rule[self.Fields.del_args]),
+                        )
+                    except re.error as exc:
+                        log.warning("TRACKER_PATTERNS: ignore rule %s: %s", rule[self.Fields.url_regexp], exc)
+                        continue
+                    label = host_label(rule[self.Fields.url_regexp])
+                    if label is None:
+                        compiled.other.append(c_rule)
+                    else:
+                        compiled.by_host.setdefault(label, []).append(c_rule)
+                log.debug(
+                    "TRACKER_PATTERNS: compiled %s host labels / %s other rules",
+                    len(compiled.by_host),
+                    len(compiled.other),
+                )
+                self._compiled = compiled
+        return self._compiled  # type: ignore
+
     def iter_clear_list(self) -> Iterator[RuleType]:
         resp = None
         for url in self.CLEAR_LIST_URL:
@@ -107,19 +267,23 @@ class TrackerPatternsDB:
         new_url = url
         parsed_new_url = urlparse(url=new_url)
 
-        for rule in self.rules():
+        compiled = self.compiled()
+        rules = compiled.other
+        host_rules = [
+            compiled.by_host[label]
+            for label in set(_URL_NETLOC_SPLIT.split(parsed_new_url.netloc))
+            if label in compiled.by_host
+        ]
+        if host_rules:
+            rules = sorted(rules + [rule for bucket in host_rules for rule in bucket])
 
-            if not re.match(rule[self.Fields.url_regexp], new_url):
+        for rule in rules:
+
+            if not rule.url_regexp.match(new_url):
                 # no match / ignore pattern
                 continue
 
-            do_ignore = False
-            for pattern in rule[self.Fields.url_ignore]:
-                if re.match(pattern, new_url):
-                    do_ignore = True
-                    break
-
-            if do_ignore:
+            if rule.url_ignore is not None and rule.url_ignore.match(new_url):
                 # pattern is in the list of exceptions / ignore pattern
                 # HINT:
                 #    we can't break the outer pattern loop since we have
@@ -131,10 +295,9 @@ class TrackerPatternsDB:
 
             for name, val in query_args.copy():
                 # remove URL arguments
-                for pattern in rule[self.Fields.del_args]:
-                    if re.match(pattern, name):
-                        log.debug("TRACKER_PATTERNS: %s remove tracker arg: %s='%s'", parsed_new_url.netloc, name, val)
-                        query_args.remove((name, val))
+                if rule.del_args is not None and rule.del_args.match(name):
+                    log.debug("TRACKER_PATTERNS: %s remove tracker arg: %s='%s'", parsed_new_url.netloc, name, val)
+                    query_args.remove((name, val))
 
             parsed_new_url = parsed_new_url._replace(query=urlencode(query_args))
             new_url = urlunparse(parsed_new_url)
@@ -39,13 +39,24 @@ if TYPE_CHECKING:
 ENGINES_CACHE = ExpireCache.build_cache(
     ExpireCacheCfg(
         name="ENGINES_CACHE",
+        BACKEND="auto",
         MAXHOLD_TIME=60 * 60 * 24 * 7,  # 7 days
         MAINTENANCE_PERIOD=60 * 60,  # 2h
+        L1_MAX_ITEMS=1024,
+        L1_MAX_BYTES=1024 * 1024,  # 1MB
+        WRITE_BEHIND_INTERVAL=2,
     )
 )
-"""Global :py:obj:`searx.cache.ExpireCacheSQLite` instance where the cached
-values from all engines are stored.  The `MAXHOLD_TIME` is 7 days and the
-`MAINTENANCE_PERIOD` is set to two hours."""
+"""Global :py:obj:`searx.cache.ExpireCache` instance where the cached values
+from all engines are stored.  The `MAXHOLD_TIME` is 7 days and the
+`MAINTENANCE_PERIOD` is set to two hours.  Values like startpage's ``SC_CODE``
+or duckduckgo's ``vqd`` are on the hot path of every search, an in-process
+:py:obj:`L1 <searx.cache.ExpireCacheL1>` holds up to 1024 values (1MB).  If a
+Valkey DB is configured, the values are shared by all instances
+(:py:obj:`searx.cache.ExpireCacheValkey`), otherwise they are stored in a
+local SQLite DB (:py:obj:`searx.cache.ExpireCacheSQLite`).  The writes to the
+SQLite DB are queued and written every 2 sec. by a background thread, the
+engine threads don't wait for the SQLite write lock."""
 
 app = typer.Typer()
 
@@ -58,11 +69,20 @@ def state():
     print(title)
     print("=" * len(title))
     print(ENGINES_CACHE.state().report())
-    print()
-    title = f"properties of {ENGINES_CACHE.cfg.name}"
-    print(title)
-    print("=" * len(title))
-    print(str(ENGINES_CACHE.properties))  # type: ignore
+    properties = getattr(ENGINES_CACHE, "properties", None)
+    if properties is not None:
+        print()
+        title = f"properties of {ENGINES_CACHE.cfg.name}"
+        print(title)
+        print("=" * len(title))
+        print(str(properties))
+    metrics = getattr(ENGINES_CACHE, "metrics", None)
+    if metrics is not None:
+        print()
+        title = f"L1 metrics of {ENGINES_CACHE.cfg.name}"
+        print(title)
+        print("=" * len(title))
+        print(metrics.report())
 
 
 @app.command()
@@ -0,0 +1,330 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+"""Registry of the engines whose module is imported on first use.
+
+To register an engine (:py:func:`searx.engines.load_engine`) only the
+attributes of the engine's namespace are needed (name, categories, shortcut,
+paging, timeout, traits, ..), most of them are set in the ``settings.yml`` or
+are literals in the engine module.  :py:obj:`module_info` collects the
+top-level names and the literal values of an engine module by a static
+analysis of its source code (without importing the module).  The engine is
+registered as a :py:obj:`LazyEngine`, the module is imported when a name that
+is not a literal is accessed (e.g. ``request`` / ``response`` by the
+processor).
+
+The results of the static analysis are stored in the
+:py:obj:`searx.enginelib.ENGINES_CACHE` (the key is the SHA-256 hash of the
+source code), the modules are analyzed only once.
+"""
+
+from __future__ import annotations
+
+__all__ = ["ModuleInfo", "LazyEngine", "module_info", "LOAD_ATTRIBUTES"]
+
+import ast
+import hashlib
+import threading
+import types
+import typing
+from collections.abc import Callable
+
+from searx import logger
+from . import ENGINES_CACHE
+
+logger = logger.getChild("engines.registry")
+
+CACHE_CTX = "engine_module_info_v2"
+
+LOAD_ATTRIBUTES = frozenset(
+    [
+        # searx.engines.ENGINE_DEFAULT_ARGS
+        "engine_type",
+        "paging",
+        "time_range_support",
+        "safesearch",
+        "categories",
+        "enable_http",
+        "shortcut",
+        "timeout",
+        "display_error_messages",
+        "disabled",
+        "inactive",
+        "about",
+        "using_tor_proxy",
+        "send_accept_language_header",
+        "tokens",
+        "max_page",
+        # traits, network and ranking
+        "language",
+        "region",
+        "network",
+        "weight",
+        "onion_url",
+        "search_path",
+        "verify",
+        "enable_http2",
+        "max_connections",
+        "max_keepalive_connections",
+        "keepalive_expiry",
+        "local_addresses",
+        "proxies",
+        "max_redirects",
+        "retries",
+        "retry_on_http_error",
+    ]
+)
+"""Attributes read while the engines are loaded and registered.  An engine
+module can only be imported lazily if these attributes are literals (or not
+defined) in the module."""
+
+
+class ModuleInfo(typing.NamedTuple):
+    """Result of the static analysis of an engine module."""
+
+    names: list[str]
+    """Names defined at the top-level of the module (assignments, functions,
+    classes and imports)."""
+
+    literals: dict[str, typing.Any]
+    """Top-level names with an (unconditional) literal value."""
+
+    lazy: bool
+    """``False`` if the module can't be analyzed reliably (e.g. ``import *``
+    or a module ``__getattr__``)."""
+
+    none_names: list[str]
+    """Names that are set to ``None`` by the module (in any block of the
+    module).  If such a name is not a literal, it may be ``None`` after the
+    import, a required attribute of the engine may be missing (see
+    :py:obj:`searx.engines.is_missing_required_attributes`)."""
+
+
+def _is_plain(value: typing.Any) -> bool:
+    # the values are stored in the cache (msgpack), tuples, sets and bytes
+    # would not survive the round trip
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return True
+    if isinstance(value, list):
+        return all(_is_plain(v) for v in value)
+    if isinstance(value, dict):
+        return all(isinstance(k, str) and _is_plain(v) for k, v in value.items())
+    return False
+
+
+def _analyze(source: bytes, filename: str) -> ModuleInfo:
+    tree = ast.parse(source, filename)
+    names: set[str] = set()
+    literals: dict[str, typing.Any] = {}
+    none_names: set[str] = set()
+    lazy = True
+
+    def bind(target: ast.expr):
+        for node in ast.walk(target):
+            if isinstance(node, ast.Name):
+                names.add(node.id)
+                literals.pop(node.id, None)
+
+    def visit(stmts: list[ast.stmt], top: bool):
+        nonlocal lazy
+        for stmt in stmts:
+            if isinstance(stmt, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+                names.add(stmt.name)
+                literals.pop(stmt.name, None)
+            elif isinstance(stmt, (ast.Import, ast.ImportFrom)):
+                for alias in stmt.names:
+                    if alias.name == "*":
+                        lazy = False
+                    name = alias.asname or alias.name.split(".")[0]
+                    names.add(name)
+                    literals.pop(name, None)
+            elif isinstance(stmt, (ast.Assign, ast.AnnAssign, ast.AugAssign)):
+                targets = stmt.targets if isinstance(stmt, ast.Assign) else [stmt.target]
+                for target in targets:
+                    bind(target)
+                    if (
+                        isinstance(target, ast.Name)
+                        and isinstance(stmt.value, ast.Constant)
+                        and stmt.value.value is None
+                    ):
+                        none_names.add(target.id)
+                for node in ast.walk(stmt.value) if stmt.value is not None else ():
+                    if isinstance(node, ast.Attribute) and isinstance(node.value, ast.Name):
+                        literals.pop(node.value.id, None)
+                if (
+                    top
+                    and not isinstance(stmt, ast.AugAssign)
+                    and stmt.value is not None
+                    and len(targets) == 1
+                    and isinstance(targets[0], ast.Name)
+                ):
+                    try:
+                        value = ast.literal_eval(stmt.value)
+                    except (ValueError, TypeError, SyntaxError, MemoryError, RecursionError):
+                        continue
+                    if _is_plain(value):
+                        literals[targets[0].id] = value
+            elif isinstance(stmt, (ast.If, ast.Try, ast.With, ast.For, ast.While)):
+                # names bound in blocks are conditional, they are not literals
+                for field in ("body", "orelse", "finalbody"):
+                    visit(getattr(stmt, field, []), False)
+                for handler in getattr(stmt, "handlers", []):
+                    if handler.name:
+                        names.add(handler.name)
+                    visit(handler.body, False)
+                if isinstance(stmt, ast.With):
+                    for item in stmt.items:
+                        if item.optional_vars is not None:
+                            bind(item.optional_vars)
+                if isinstance(stmt, ast.For):
+                    bind(stmt.target)
+            else:
+                # any other statement (e.g. ``categories.append(..)`` or a call
+                # like ``globals().update(..)``)
+                for node in ast.walk(stmt):
+                    if isinstance(node, ast.NamedExpr):
+                        bind(node.target)
+                    elif isinstance(node, ast.Attribute) and isinstance(node.value, ast.Name):
+                        literals.pop(node.value.id, None)
+                    elif isinstance(node, ast.Call) and isinstance(node.func, ast.Name):
+                        if node.func.id in ("globals", "setattr", "exec"):
+                            lazy = False
+
+    visit(tree.body, True)
+    # names that are rebound by a function (``global``) are not literals
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Global):
+            for name in node.names:
+                literals.pop(name, None)
+    if "__getattr__" in names:
+        lazy = False
+    return ModuleInfo(sorted(names), literals, lazy, sorted(none_names))
+
+
+_MODULE_INFO: dict[str, ModuleInfo] = {}
+_MODULE_INFO_LOCK = threading.Lock()
+
+
+def module_info(filename: str) -> ModuleInfo:
+    """Returns the :py:obj:`ModuleInfo` of the (engine) module ``filename``."""
+    with open(filename, "rb") as f:
+        source = f.read()
+    key = hashlib.sha256(source).hexdigest()
+
+    with _MODULE_INFO_LOCK:
+        info = _MODULE_INFO.get(key)
+        if info is not None:
+            return info
+
+        value = ENGINES_CACHE.get(key, ctx=CACHE_CTX)
+        if value is not None:
+            info = ModuleInfo(*value)
+        else:
+            info = _analyze(source, filename)
+            ENGINES_CACHE.set(key, list(info), expire=None, ctx=CACHE_CTX)
+        _MODULE_INFO[key] = info
+        return info
+
+
+class LazyEngine:
+    """Namespace of an engine whose module is imported on first use.
+
+    The attributes of the namespace (literals of the module, values from the
+    ``settings.yml``, defaults, traits, ..) are held in the object until the
+    module is imported.  An attribute that is not a literal is looked up in the
+    module, the module is imported by :py:obj:`LazyEngine.load` on the first
+    such access.  Names that are not defined in the module raise an
+    :py:obj:`AttributeError` (``hasattr`` does not import the module).  From
+    the import onwards, the module is the namespace of the engine.
+
+    The hooks (:py:obj:`LazyEngine.on_load`, e.g. the ``init`` function of the
+    engine) run in the thread that imports the module.  Other threads that
+    need the module wait until the hooks are done.
+    """
+
+    __slots__ = ("_attrs", "_names", "_loader", "_module", "_ready", "_lock", "_load_hooks")
+
+    def __init__(
+        self,
+        attrs: dict[str, typing.Any],
+        names: typing.Iterable[str],
+        loader: Callable[[dict[str, typing.Any]], types.ModuleType],
+    ):
+        object.__setattr__(self, "_attrs", attrs)
+        object.__setattr__(self, "_names", frozenset(names))
+        object.__setattr__(self, "_loader", loader)
+        object.__setattr__(self, "_module", None)
+        object.__setattr__(self, "_ready", False)
+        object.__setattr__(self, "_lock", threading.RLock())
+        object.__setattr__(self, "_load_hooks", [])
+
+    @property
+    def loaded(self) -> bool:
+        return self._ready
+
+    def load(self) -> types.ModuleType:
+        """Imports the module of the engine (if not already done), calls the
+        hooks and returns the module."""
+        if self._ready:
+            return self._module
+        with self._lock:
+            # the hooks of this thread can access the module (RLock)
+            if self._module is None:
+                logger.debug("import module of engine %s", self._attrs.get("name"))
+                module = self._loader(self._attrs)
+                object.__setattr__(self, "_module", module)
+                try:
+                    for hook in self._load_hooks:
+                        hook()
+                finally:
+                    self._load_hooks.clear()
+                    object.__setattr__(self, "_ready", True)
+        return self._module
+
+    def on_load(self, hook: Callable[[], None]):
+        """Calls ``hook`` when the module is imported (immediately if the
+        module is already imported)."""
+        with self._lock:
+            if not self._ready:
+                self._load_hooks.append(hook)
+                return
+        hook()
+
+    def has(self, name: str) -> bool:
+        """Same as ``hasattr(engine, name)`` but does not import the module."""
+        if self._module is not None:
+            return hasattr(self._module, name)
+        return name in self._attrs or name in self._names
+
+    def __getattr__(self, name: str) -> typing.Any:
+        module = self._module if self._ready else None
+        if module is None:
+            try:
+                return self._attrs[name]
+            except KeyError:
+                pass
+            if name not in self._names:
+                raise AttributeError(f"engine {self._attrs.get('name')!r} has no attribute {name!r}")
+            module = self.load()
+        return getattr(module, name)
+
+    def __setattr__(self, name: str, value: typing.Any):
+        with self._lock:
+            if self._module is None:
+                self._attrs[name] = value
+            else:
+                setattr(self._module, name, value)
+
+    def __delattr__(self, name: str):
+        with self._lock:
+            if self._module is None:
+                del self._attrs[name]
+            else:
+                delattr(self._module, name)
+
+    def __dir__(self):
+        if self._module is not None:
+            return dir(self._module)
+        return sorted(set(self._attrs) | self._names)
+
+    def __repr__(self):
+        state = "loaded" if self._module is not None else "not loaded"
+        return f"<{self.__class__.__name__} {self._attrs.get('name')!r} ({state})>"
@@ -14,6 +14,7 @@ from __future__ import annotations
 import os
 import json
 import dataclasses
+import threading
 import types
 from typing import Dict, Literal, Iterable, Union, Callable, Optional, TYPE_CHECKING
 
@@ -31,7 +32,7 @@ class EngineTraitsEncoder(json.JSONEncoder):
     def default(self, o):
         """Return dictionary of a :class:`EngineTraits` object."""
         if isinstance(o, EngineTraits):
-            return o.__dict__
+            return {f.name: getattr(o, f.name) for f in dataclasses.fields(o)}
         return super().default(o)
 
 
@@ -86,6 +87,33 @@ class EngineTraits:
     """A place to store engine's custom traits, not related to the SearXNG core.
     """
 
+    LOOKUP_TABLE_SIZE = 1024
+    """Maximum number of SearXNG locales in the lookup tables of
+    :py:obj:`EngineTraits.get_language` and :py:obj:`EngineTraits.get_region`."""
+
+    def __setattr__(self, name, value):
+        if name in ('languages', 'regions'):
+            # the lookup table was built from the old value
+            self.__dict__.pop('_lookup_' + name, None)
+        super().__setattr__(name, value)
+
+    def _lookup(self, name: str, searxng_locale: str) -> str | None:
+        # The result of locales.get_engine_locale (without a default) is stored
+        # in a lookup table, the next lookup of the SearXNG locale is a dict
+        # hit.  The table is not invalidated when the languages / regions dict
+        # is modified in place (only fetch_traits does this).
+        table = self.__dict__.get('_lookup_' + name)
+        if table is None:
+            table = self.__dict__.setdefault('_lookup_' + name, {})
+        try:
+            return table[searxng_locale]
+        except KeyError:
+            pass
+        engine_locale = locales.get_engine_locale(searxng_locale, getattr(self, name))
+        if len(table) < self.LOOKUP_TABLE_SIZE:
+            table[searxng_locale] = engine_locale
+        return engine_locale
+
     def get_language(self, searxng_locale: str, default=None):
         """Return engine's language string that *best fits* to SearXNG's locale.
 
@@ -100,7 +128,8 @@ class EngineTraits:
         """
         if searxng_locale == 'all' and self.all_locale is not None:
             return self.all_locale
-        return locales.get_engine_locale(searxng_locale, self.languages, default=default)
+        engine_locale = self._lookup('languages', searxng_locale)
+        return default if engine_locale is None else engine_locale
 
     def get_region(self, searxng_locale: str, default=None):
         """Return engine's region string that best fits to SearXNG's locale.
@@ -116,7 +145,8 @@ class EngineTraits:
         """
         if searxng_locale == 'all' and self.all_locale is not None:
             return self.all_locale
-        return locales.get_engine_locale(searxng_locale, self.regions, default=default)
+        engine_locale = self._lookup('regions', searxng_locale)
+        return default if engine_locale is None else engine_locale
 
     def is_locale_supported(self, searxng_locale: str) -> bool:
         """A *locale* (SearXNG's internal representation) is considered to be
@@ -170,7 +200,9 @@ class EngineTraits:
         #     language: it
         #     region: it-IT                                      # type: ignore
 
-        traits = self.copy()
+        # The dicts of the traits are shared with the traits of the
+        # EngineTraitsMap (read-only), a deep copy for each engine is expensive.
+        traits = dataclasses.replace(self)
 
         _msg = "settings.yml - engine: '%s' / %s: '%s' not supported"
 
@@ -205,11 +237,15 @@ class EngineTraitsMap(Dict[str, EngineTraits]):
 
     @classmethod
     def from_data(cls) -> 'EngineTraitsMap':
-        """Instantiate :class:`EngineTraitsMap` object from :py:obj:`ENGINE_TRAITS`"""
-        obj = cls()
-        for k, v in ENGINE_TRAITS.items():
-            obj[k] = EngineTraits(**v)
-        return obj
+        """Returns the :class:`EngineTraitsMap` of :py:obj:`ENGINE_TRAITS`.  The
+        map is built once per process and shared by all callers (don't modify
+        it), the :class:`EngineTraits` objects are built on first access."""
+        global _DATA_TRAITS_MAP  # pylint: disable=global-statement
+
+        with _DATA_TRAITS_LOCK:
+            if _DATA_TRAITS_MAP is None:
+                _DATA_TRAITS_MAP = _DataTraitsMap(ENGINE_TRAITS)
+        return _DATA_TRAITS_MAP
 
     @classmethod
     def fetch_traits(cls, log: Callable) -> 'EngineTraitsMap':
@@ -262,3 +298,28 @@ class EngineTraitsMap(Dict[str, EngineTraits]):
             engine_traits = self[engine.engine]
 
         engine_traits.set_traits(engine)
+
+
+class _DataTraitsMap(EngineTraitsMap):
+    """:class:`EngineTraitsMap` of :py:obj:`ENGINE_TRAITS`, the values are JSON
+    objects until they are accessed the first time."""
+
+    def __getitem__(self, key: str) -> EngineTraits:
+        value = super().__getitem__(key)
+        if not isinstance(value, EngineTraits):
+            value = EngineTraits(**value)
+            super().__setitem__(key, value)
+        return value
+
+    def get(self, key, default=None):
+        return self[key] if key in self else default
+
+    def values(self):  # type: ignore[override]
+        return [self[key] for key in self]
+
+    def items(self):  # type: ignore[override]
+        return [(key, self[key]) for key in self]
+
+
+_DATA_TRAITS_MAP: EngineTraitsMap | None = None
+_DATA_TRAITS_LOCK = threading.Lock()
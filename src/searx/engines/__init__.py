@@ -6,20 +6,26 @@ usage::
 
     load_engines( settings['engines'] )
 
+With ``load_engines(settings['engines'], lazy=True)`` the engine modules are
+imported on first use, see :py:obj:`searx.enginelib.registry`.
+
 """
 
 from __future__ import annotations
 
 import sys
 import copy
-from os.path import realpath, dirname
+import functools
+import threading
+from os.path import realpath, dirname, join
 
-from typing import TYPE_CHECKING, Dict
+from typing import TYPE_CHECKING, Dict, Iterable
 import types
 import inspect
 
-from searx import logger, settings
+from searx import logger, settings, locales
 from searx.utils import load_module
+from searx.enginelib.registry import LazyEngine, ModuleInfo, LOAD_ATTRIBUTES, module_info
 
 if TYPE_CHECKING:
     from searx.enginelib import Engine
@@ -53,7 +59,7 @@ DEFAULT_CATEGORY = 'other'
 # Defaults for the namespace of an engine module, see :py:func:`load_engine`
 
 categories = {'general': []}
-engines: Dict[str, Engine | types.ModuleType] = {}
+engines: Dict[str, Engine | types.ModuleType | LazyEngine] = {}
 engine_shortcuts = {}
 """Simple map of registered *shortcuts* to name of the engine (or ``None``).
 
@@ -77,16 +83,21 @@ def check_engine_module(module: types.ModuleType):
         raise TypeError(msg)
 
 
-def load_engine(engine_data: dict) -> Engine | types.ModuleType | None:
+def load_engine(engine_data: dict, lazy: bool = False) -> Engine | types.ModuleType | LazyEngine | None:
     """Load engine from ``engine_data``.
 
     :param dict engine_data:  Attributes from YAML ``settings:engines/<engine>``
+    :param bool lazy: import the module of the engine on first use
     :return: initialized namespace of the ``<engine>``.
 
     1. create a namespace and load module of the ``<engine>``
     2. update namespace with the defaults from :py:obj:`ENGINE_DEFAULT_ARGS`
     3. update namespace with values from ``engine_data``
 
+    If ``lazy`` is set and the namespace can be created from the literals of the
+    module (:py:obj:`searx.enginelib.registry.module_info`), the namespace is a
+    :py:obj:`LazyEngine` and the module is not imported here.
+
     If engine *is active*, return namespace of the engine, otherwise return
     ``None``.
 
@@ -118,16 +129,21 @@ def load_engine(engine_data: dict) -> Engine | types.ModuleType | None:
     if module_name is None:
         logger.error('The "engine" field is missing for the engine named "{}"'.format(engine_name))
         return None
-    try:
-        engine = load_module(module_name + '.py', ENGINE_DIR)
-    except (SyntaxError, KeyboardInterrupt, SystemExit, SystemError, ImportError, RuntimeError):
-        logger.exception('Fatal exception in engine "{}"'.format(module_name))
-        sys.exit(1)
-    except BaseException:
-        logger.exception('Cannot load engine "{}"'.format(module_name))
-        return None
+    info = lazy_engine_info(module_name, engine_data) if lazy else None
+    if info is not None:
+        engine = types.SimpleNamespace(**copy.deepcopy(info.literals))
+    else:
+        try:
+            engine = load_module(module_name + '.py', ENGINE_DIR)
+        except (SyntaxError, KeyboardInterrupt, SystemExit, SystemError, ImportError, RuntimeError):
+            logger.exception('Fatal exception in engine "{}"'.format(module_name))
+            sys.exit(1)
+        except BaseException:
+            logger.exception('Cannot load engine "{}"'.format(module_name))
+            return None
+
+        check_engine_module(engine)
 
-    check_engine_module(engine)
     update_engine_attributes(engine, engine_data)
     update_attributes_for_tor(engine)
 
@@ -144,14 +160,99 @@ def load_engine(engine_data: dict) -> Engine | types.ModuleType | None:
     if is_missing_required_attributes(engine):
         return None
 
-    set_loggers(engine, engine_name)
+    if info is not None:
+        # nothing is imported, the loggers of the modules are set on import
+        engine.logger = logger.getChild(engine_name)
+    else:
+        set_loggers(engine, engine_name)
 
     if not any(cat in settings['categories_as_tabs'] for cat in engine.categories):
         engine.categories.append(DEFAULT_CATEGORY)
 
+    if info is not None:
+        return LazyEngine(vars(engine), info.names, functools.partial(import_engine, module_name, engine_name))
     return engine
 
 
+def lazy_engine_info(module_name: str, engine_data: dict) -> ModuleInfo | None:
+    """Returns the :py:obj:`ModuleInfo <searx.enginelib.registry.ModuleInfo>`
+    of the engine module if the engine can be loaded lazily, otherwise
+    ``None``.
+
+    The namespace of a lazy engine is build from the literals of the module, all
+    attributes needed to load and register the engine (:py:obj:`LOAD_ATTRIBUTES
+    <searx.enginelib.registry.LOAD_ATTRIBUTES>`) have to be literals of the
+    module or set in ``engine_data``.
+    """
+    if settings['outgoing'].get('using_tor_proxy') or engine_data.get('using_tor_proxy'):
+        return None
+    try:
+        info = module_info(join(ENGINE_DIR, module_name + '.py'))
+    except (OSError, SyntaxError, ValueError):
+        return None
+    if not info.lazy:
+        return None
+    for name in LOAD_ATTRIBUTES.intersection(info.names):
+        if name not in info.literals and (name not in engine_data or name == 'about'):
+            return None
+    # required attributes (is_missing_required_attributes) that may be None
+    # after the import have to be checked on the module
+    for name in info.none_names:
+        if not name.startswith('_') and name not in info.literals and engine_data.get(name) is None:
+            return None
+    return info
+
+
+def import_engine(module_name: str, engine_name: str, attrs: dict) -> types.ModuleType:
+    """Imports the module of a :py:obj:`LazyEngine` and sets the attributes of
+    the engine's namespace (``attrs``) in the module."""
+    module = load_module(module_name + '.py', ENGINE_DIR)
+    check_engine_module(module)
+    for name, value in attrs.items():
+        setattr(module, name, value)
+    set_loggers(module, engine_name)
+    if is_missing_required_attributes(module):
+        raise ValueError('engine "{}": missing engine config attribute'.format(engine_name))
+    return module
+
+
+def preload_engines(engine_names: Iterable[str]) -> threading.Thread:
+    """Imports the modules of the (lazy) engines ``engine_names`` in a
+    background thread."""
+
+    def _preload():
+        for engine_name in engine_names:
+            engine = engines.get(engine_name)
+            if isinstance(engine, LazyEngine):
+                try:
+                    engine.load()
+                except Exception:  # pylint: disable=broad-except
+                    logger.exception('Cannot preload engine "{}"'.format(engine_name))
+
+    thread = threading.Thread(target=_preload, name='preload_engines', daemon=True)
+    thread.start()
+    return thread
+
+
+def precompute_locales(locale_tags: Iterable[str] = locales.COMMON_LOCALES):
+    """Resolves the SearXNG locales ``locale_tags`` for the traits of each
+    enabled engine (:py:obj:`EngineTraits.get_language` and
+    :py:obj:`EngineTraits.get_region`).  The results are held in the lookup
+    tables of the traits (the parsed locales in the memo cache of
+    :py:obj:`searx.locales.parse_locale`), the requests in these locales don't
+    have to resolve them."""
+    locale_tags = list(locale_tags)
+    for tag in locale_tags:
+        locales.get_locale(tag)
+    for engine in engines.values():
+        traits = getattr(engine, 'traits', None)
+        if engine.disabled or traits is None:
+            continue
+        for tag in locale_tags:
+            traits.get_language(tag)
+            traits.get_region(tag)
+
+
 def set_loggers(engine, engine_name):
     # set the logger for engine
     engine.logger = logger.getChild(engine_name)
@@ -240,14 +341,14 @@ def register_engine(engine: Engine | types.ModuleType):
         categories.setdefault(category_name, []).append(engine)
 
 
-def load_engines(engine_list):
+def load_engines(engine_list, lazy: bool = False):
     """usage: ``engine_list = settings['engines']``"""
     engines.clear()
     engine_shortcuts.clear()
     categories.clear()
     categories['general'] = []
     for engine_data in engine_list:
-        engine = load_engine(engine_data)
+        engine = load_engine(engine_data, lazy=lazy)
         if engine:
             register_engine(engine)
     return engines
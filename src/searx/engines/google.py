@@ -25,7 +25,7 @@ import babel.core
 import babel.languages
 
 from searx.utils import extract_text, eval_xpath, eval_xpath_list, eval_xpath_getindex
-from searx.locales import language_tag, region_tag, get_official_locales
+from searx.locales import language_tag, region_tag, get_official_locales, parse_locale
 from searx.network import get  # see https://github.com/searxng/searxng/issues/762
 from searx.exceptions import SearxEngineCaptchaException
 from searx.enginelib.traits import EngineTraits
@@ -166,7 +166,7 @@ def get_google_info(params, eng_traits):
 
     sxng_locale = params.get('searxng_locale', 'all')
     try:
-        locale = babel.Locale.parse(sxng_locale, sep='-')
+        locale = parse_locale(sxng_locale, sep='-')
     except babel.core.UnknownLocaleError:
         locale = None
 
@@ -94,7 +94,7 @@ import babel.localedata
 from searx.utils import extr, extract_text, eval_xpath, gen_useragent, html_to_text, humanize_bytes, remove_pua_from_str
 from searx.network import get  # see https://github.com/searxng/searxng/issues/762
 from searx.exceptions import SearxEngineCaptchaException
-from searx.locales import region_tag
+from searx.locales import region_tag, parse_locale
 from searx.enginelib.traits import EngineTraits
 from searx.enginelib import EngineCache
 
@@ -200,7 +200,7 @@ def get_sc_code(searxng_locale, params):
     # add Accept-Language header
     if searxng_locale == 'all':
         searxng_locale = 'en-US'
-    locale = babel.Locale.parse(searxng_locale, sep='-')
+    locale = parse_locale(searxng_locale, sep='-')
 
     if send_accept_language_header:
         ac_lang = locale.language
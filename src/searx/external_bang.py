@@ -1,10 +1,10 @@
 # SPDX-License-Identifier: AGPL-3.0-or-later
 # pylint: disable=missing-module-docstring
 
+from collections.abc import Mapping
 from urllib.parse import quote_plus, urlparse
-from searx.data import EXTERNAL_BANGS
-
-LEAF_KEY = chr(16)
+from searx.data import EXTERNAL_BANGS_DB
+from searx.data.external_bangs import LEAF_KEY
 
 
 def get_node(external_bangs_db, bang):
@@ -13,7 +13,7 @@ def get_node(external_bangs_db, bang):
     before = ''
     for bang_letter in bang:
         after += bang_letter
-        if after in node and isinstance(node, dict):
+        if after in node and isinstance(node, Mapping):
             node = node[after]
             before += after
             after = ''
@@ -29,7 +29,7 @@ def get_bang_definition_and_ac(external_bangs_db, bang):
         for k in node:
             if k.startswith(after):
                 bang_ac_list.append(before + k)
-    elif isinstance(node, dict):
+    elif isinstance(node, Mapping):
         bang_definition = node.get(LEAF_KEY)
         bang_ac_list = [before + k for k in node.keys() if k != LEAF_KEY]
     elif isinstance(node, str):
@@ -56,7 +56,8 @@ def resolve_bang_definition(bang_definition, query):
 
 def get_bang_definition_and_autocomplete(bang, external_bangs_db=None):  # pylint: disable=invalid-name
     if external_bangs_db is None:
-        external_bangs_db = EXTERNAL_BANGS
+        # static index of the bangs, the autocomplete list is already sorted
+        return EXTERNAL_BANGS_DB.get(bang), EXTERNAL_BANGS_DB.complete(bang)
 
     bang_definition, bang_ac_list = get_bang_definition_and_ac(external_bangs_db, bang)
 
@@ -89,11 +90,11 @@ def get_bang_url(search_query, external_bangs_db=None):
     """
     ret_val = None
 
-    if external_bangs_db is None:
-        external_bangs_db = EXTERNAL_BANGS
-
     if search_query.external_bang:
-        bang_definition, _ = get_bang_definition_and_ac(external_bangs_db, search_query.external_bang)
+        if external_bangs_db is None:
+            bang_definition = EXTERNAL_BANGS_DB.get(search_query.external_bang)
+        else:
+            bang_definition, _ = get_bang_definition_and_ac(external_bangs_db, search_query.external_bang)
         if bang_definition and isinstance(bang_definition, str):
             ret_val = resolve_bang_definition(bang_definition, search_query.query)[0]
 
@@ -10,6 +10,10 @@
 :py:obj:`FaviconCacheSQLite`:
   Favicon cache that manages the favicon BLOBs in a SQLite DB.
 
+:py:obj:`FaviconCacheMEM`:
+  Favicon cache in the memory of the process, with a byte budget; can be used
+  as L1 in front of the :py:obj:`FaviconCacheSQLite`.
+
 :py:obj:`FaviconCacheNull`:
   Fallback solution if the configured cache cannot be used for system reasons.
 
@@ -22,11 +26,13 @@ from typing import Literal
 
 import os
 import abc
+from collections import OrderedDict
 import dataclasses
 import hashlib
 import logging
 import sqlite3
 import tempfile
+import threading
 import time
 import typer
 
@@ -34,6 +40,7 @@ import msgspec
 
 from searx import sqlitedb
 from searx import logger
+from searx.cache import WriteBehindQueue
 from searx.utils import humanize_bytes, humanize_number
 
 CACHE: "FaviconCache"
@@ -81,10 +88,13 @@ def init(cfg: "FaviconCacheConfig"):
                 sqlite3.sqlite_version,
             )
             CACHE = FaviconCacheNull(cfg)
+        elif cfg.MEM_LIMIT_BYTES > 0:
+            CACHE = FaviconCacheMEM(cfg, l2=FaviconCacheSQLite(cfg))
         else:
             CACHE = FaviconCacheSQLite(cfg)
     elif cfg.db_type == "mem":
-        logger.error("Favicons are cached in memory, don't use this in production!")
+        if cfg.MEM_LIMIT_BYTES <= 0:
+            raise ValueError("favicons db_type 'mem' requires MEM_LIMIT_BYTES > 0")
         CACHE = FaviconCacheMEM(cfg)
     else:
         raise NotImplementedError(f"favicons db_type '{cfg.db_type}' is unknown")
@@ -97,10 +107,12 @@ class FaviconCacheConfig(msgspec.Struct):  # pylint: disable=too-few-public-meth
     """Type of the database:
 
     ``sqlite``:
-      :py:obj:`.cache.FaviconCacheSQLite`
+      :py:obj:`.cache.FaviconCacheSQLite`, if :py:obj:`MEM_LIMIT_BYTES` is set
+      with a :py:obj:`.cache.FaviconCacheMEM` in front of it (L1).
 
     ``mem``:
-      :py:obj:`.cache.FaviconCacheMEM` (not recommended)
+      :py:obj:`.cache.FaviconCacheMEM`, the favicons are lost when the process
+      ends.
     """
 
     db_url: str = tempfile.gettempdir() + os.sep + "faviconcache.db"
@@ -116,6 +128,11 @@ class FaviconCacheConfig(msgspec.Struct):  # pylint: disable=too-few-public-meth
     the maintenance period is *too long* or maintenance is switched off
     completely, the cache grows uncontrollably."""
 
+    MEM_LIMIT_BYTES: int = 1024 * 1024 * 4  # 4 MB
+    """Maximum of bytes held by the :py:obj:`.cache.FaviconCacheMEM` (per
+    process), when exceeded, the least recently used favicons are evicted.  Set
+    to ``0`` to disable the in-memory cache in front of the SQLite DB."""
+
     BLOB_MAX_BYTES: int = 1024 * 20  # 20 KB
     """The maximum BLOB size in bytes that a favicon may have so that it can be
     saved in the cache.  If the favicon is larger, it is not saved in the cache
@@ -125,6 +142,17 @@ class FaviconCacheConfig(msgspec.Struct):  # pylint: disable=too-few-public-meth
     """Maintenance period in seconds / when :py:obj:`MAINTENANCE_MODE` is set to
     ``auto``."""
 
+    WRITE_BEHIND_INTERVAL: float = 0
+    """If set, the favicons are not written immediately to the SQLite DB, they
+    are queued in memory (:py:obj:`searx.cache.WriteBehindQueue`) and written
+    in batches by a background thread, at the latest after this interval in
+    sec.  If set to ``0`` (default), the favicons are written immediately."""
+
+    WRITE_BEHIND_MAX_BYTES: int = 1024 * 1024 * 2  # 2 MB
+    """Maximum of bytes of the favicons queued for writing (per process), when
+    reached, the queued favicons are written without waiting for the
+    :py:obj:`WRITE_BEHIND_INTERVAL`."""
+
     MAINTENANCE_MODE: Literal["auto", "off"] = "auto"
     """Type of maintenance mode
 
@@ -146,12 +174,18 @@ class FaviconCacheStats:
     bytes: int | None = None
     domains: int | None = None
     resolvers: int | None = None
+    hits: int | None = None
+    misses: int | None = None
+    evictions: int | None = None
 
     field_descr = (
         ("favicons", "number of favicons in cache", humanize_number),
         ("bytes", "total size (approx. bytes) of cache", humanize_bytes),
         ("domains", "total number of domains in cache", humanize_number),
         ("resolvers", "number of resolvers", str),
+        ("hits", "number of lookups found in memory", humanize_number),
+        ("misses", "number of lookups not found in memory", humanize_number),
+        ("evictions", "number of favicons evicted from memory", humanize_number),
     )
 
     def __sub__(self, other) -> FaviconCacheStats:
@@ -250,10 +284,15 @@ class FaviconCacheSQLite(sqlitedb.SQLiteAppl, FaviconCache):
     - :py:obj:`FaviconCacheConfig.BLOB_MAX_BYTES`
     - :py:obj:`MAINTENANCE_PERIOD`
     - :py:obj:`MAINTENANCE_MODE`
+    - :py:obj:`WRITE_BEHIND_INTERVAL`
     """
 
     DB_SCHEMA = 1
 
+    SQLITE_PRAGMAS = sqlitedb.SQLiteAppl.SQLITE_PERFORMANCE_PROFILE
+
+    SQLITE_CONNECT_ARGS = {**sqlitedb.SQLiteAppl.SQLITE_CONNECT_ARGS, "cached_statements": 128}
+
     DDL_BLOBS = """\
 CREATE TABLE IF NOT EXISTS blobs (
   sha256     TEXT,
@@ -314,9 +353,26 @@ CREATE TABLE IF NOT EXISTS blob_map (
             logger.critical("don't use SQLite DB in :memory: in production!!")
         super().__init__(cfg.db_url)
         self.cfg = cfg
+        self.write_behind: WriteBehindQueue | None = None
+        if cfg.WRITE_BEHIND_INTERVAL > 0:
+            self.write_behind = WriteBehindQueue(
+                name="favicons",
+                write=self._write_pending,
+                interval=cfg.WRITE_BEHIND_INTERVAL,
+                max_bytes=cfg.WRITE_BEHIND_MAX_BYTES,
+                sizeof=lambda value: value[1],  # (sha256, bytes_c, mime, data)
+            )
 
     def __call__(self, resolver: str, authority: str) -> None | tuple[None | bytes, None | str]:
 
+        if self.write_behind is not None:
+            pending = self.write_behind.get((resolver, authority))
+            if pending is not None:
+                sha256, _, mime, data = pending
+                if sha256 == FALLBACK_ICON:
+                    return None, None
+                return data, mime
+
         sql = "SELECT sha256 FROM blob_map WHERE resolver = ? AND authority = ?"
         res = self.DB.execute(sql, (resolver, authority)).fetchone()
         if res is None:
@@ -335,9 +391,8 @@ CREATE TABLE IF NOT EXISTS blob_map (
 
     def set(self, resolver: str, authority: str, mime: str | None, data: bytes | None) -> bool:
 
-        if self.cfg.MAINTENANCE_MODE == "auto" and int(time.time()) > self.next_maintenance_time:
-            # Should automatic maintenance be moved to a new thread?
-            self.maintenance()
+        if self.write_behind is None:
+            self._auto_maintenance()
 
         if data is not None and mime is None:
             logger.error(
@@ -359,6 +414,10 @@ CREATE TABLE IF NOT EXISTS blob_map (
         else:
             sha256 = hashlib.sha256(data).hexdigest()
 
+        if self.write_behind is not None:
+            self.write_behind.put((resolver, authority), (sha256, bytes_c, mime, data))
+            return True
+
         with self.connect() as conn:
             if sha256 != FALLBACK_ICON:
                 conn.execute(self.SQL_INSERT_BLOBS, (sha256, bytes_c, mime, data))
@@ -370,6 +429,27 @@ CREATE TABLE IF NOT EXISTS blob_map (
 
         return True
 
+    def _auto_maintenance(self):
+        if self.cfg.MAINTENANCE_MODE == "auto" and int(time.time()) > self.next_maintenance_time:
+            # Should automatic maintenance be moved to a new thread?
+            self.maintenance()
+
+    def _write_pending(self, pending: dict[tuple[str, str], tuple[str | bytes, int, str | None, bytes | None]]):
+        # all pending favicons are written in one transaction
+        blobs = []
+        blob_map = []
+        for (resolver, authority), (sha256, bytes_c, mime, data) in pending.items():
+            if sha256 != FALLBACK_ICON:
+                blobs.append((sha256, bytes_c, mime, data))
+            blob_map.append((sha256, resolver, authority))
+        with self.connect() as conn:
+            conn.execute("BEGIN")
+            conn.executemany(self.SQL_INSERT_BLOBS, blobs)
+            conn.executemany(self.SQL_INSERT_BLOB_MAP, blob_map)
+            conn.execute("COMMIT")
+        conn.close()
+        self._auto_maintenance()
+
     @property
     def next_maintenance_time(self) -> int:
         """Returns (unix epoch) time of the next maintenance."""
@@ -378,6 +458,9 @@ CREATE TABLE IF NOT EXISTS blob_map (
 
     def maintenance(self, force=False):
 
+        if self.write_behind is not None:
+            self.write_behind.flush()
+
         # Prevent parallel DB maintenance cycles from other DB connections
         # (e.g. in multi thread or process environments).
 
@@ -433,6 +516,8 @@ CREATE TABLE IF NOT EXISTS blob_map (
         return val
 
     def state(self) -> FaviconCacheStats:
+        if self.write_behind is not None:
+            self.write_behind.flush()
         return FaviconCacheStats(
             favicons=self._query_val("SELECT count(*) FROM blobs", 0),
             bytes=self._query_val("SELECT SUM(bytes_c) FROM blobs", 0),
@@ -442,38 +527,116 @@ CREATE TABLE IF NOT EXISTS blob_map (
 
 
 class FaviconCacheMEM(FaviconCache):
-    """Favicon cache in process' memory.  Its just a POC that stores the
-    favicons in the memory of the process.
+    """Favicon cache in process' memory.
+
+    The size of the cache is limited by :py:obj:`FaviconCacheConfig.MEM_LIMIT_BYTES`,
+    if the limit is exceeded, the least recently used (resolver, authority)
+    entries are evicted.  The BLOBs are stored by their sha256 hash values, a
+    favicon used by several domains is held only once in memory.
 
-    .. attention::
+    If a ``l2`` cache is given (e.g. a :py:obj:`FaviconCacheSQLite`), the
+    memory cache is a L1 in front of it: lookups not found in memory are passed
+    to the L2 and the favicons are written through to the L2.
 
-       Don't use it in production, it will blow up your memory!!
+    Each entry expires after the :py:obj:`FaviconCacheConfig.HOLD_TIME`.  In
+    front of a L2, an entry expires at the latest after the
+    :py:obj:`FaviconCacheConfig.MAINTENANCE_PERIOD`; the maintenance of the L2
+    may have deleted the favicon in the meantime.
 
+    The number of hits, misses and evictions are reported in the
+    :py:obj:`FaviconCacheStats`.
     """
 
-    def __init__(self, cfg):
+    ENTRY_BYTES = 128
+    """Approximate size (in bytes) of a (resolver, authority) entry, added to the
+    size of the BLOBs."""
+
+    def __init__(self, cfg: FaviconCacheConfig, l2: FaviconCache | None = None):
 
         self.cfg = cfg
-        self._data = {}
-        self._sha_mime = {}
+        self.l2 = l2
+        # (resolver, authority) --> (sha256, mime, expire)
+        self._map: OrderedDict[tuple[str, str], tuple[str | bytes, str | None, float]] = OrderedDict()
+        # sha256 --> [data, number of entries in self._map]
+        self._blobs: dict[str | bytes, list] = {}
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
 
     def __call__(self, resolver: str, authority: str) -> None | tuple[bytes | None, str | None]:
 
-        sha, mime = self._sha_mime.get(f"{resolver}:{authority}", (None, None))
-        if sha is None:
+        key = (resolver, authority)
+        with self._lock:
+            entry = self._map.get(key)
+            if entry is not None and entry[2] <= time.time():
+                self._drop(key)
+                entry = None
+            if entry is not None:
+                self._map.move_to_end(key)
+                self.hits += 1
+                sha256, mime, _ = entry
+                if sha256 == FALLBACK_ICON:
+                    return None, None
+                return self._blobs[sha256][0], mime
+            self.misses += 1
+
+        if self.l2 is None:
             return None
-        data = self._data.get(sha)
-        if data == FALLBACK_ICON:
-            data = None
-        return data, mime
+        data_mime = self.l2(resolver, authority)
+        if data_mime is not None:
+            self._put(key, data_mime[1], data_mime[0])
+        return data_mime
 
-    def set(self, resolver: str, authority: str, mime: str | None, data: bytes | None) -> bool:
+    @property
+    def ttl(self) -> int:
+        """Time (in sec.) after which an entry expires."""
+        if self.l2 is None:
+            return self.cfg.HOLD_TIME
+        return min(self.cfg.HOLD_TIME, self.cfg.MAINTENANCE_PERIOD)
+
+    def _put(self, key: tuple[str, str], mime: str | None, data: bytes | None):
 
         if data is None:
-            data = FALLBACK_ICON
+            sha256: str | bytes = FALLBACK_ICON
             mime = None
+        else:
+            sha256 = hashlib.sha256(data).hexdigest()
 
-        elif mime is None:
+        with self._lock:
+            self._drop(key)
+            self._map[key] = (sha256, mime, time.time() + self.ttl)
+            self._bytes += self.ENTRY_BYTES
+            if sha256 != FALLBACK_ICON:
+                blob = self._blobs.get(sha256)
+                if blob is None:
+                    self._blobs[sha256] = [data, 1]
+                    self._bytes += len(data)  # type: ignore
+                else:
+                    blob[1] += 1
+            while self._bytes > self.cfg.MEM_LIMIT_BYTES and self._map:
+                self._drop(next(iter(self._map)))
+                self.evictions += 1
+
+    def _drop(self, key: tuple[str, str]):
+        # hint: the caller has to hold the lock
+        entry = self._map.pop(key, None)
+        if entry is None:
+            return
+        self._bytes -= self.ENTRY_BYTES
+        sha256 = entry[0]
+        if sha256 == FALLBACK_ICON:
+            return
+        blob = self._blobs[sha256]
+        blob[1] -= 1
+        if blob[1] <= 0:
+            del self._blobs[sha256]
+            self._bytes -= len(blob[0])
+
+    def set(self, resolver: str, authority: str, mime: str | None, data: bytes | None) -> bool:
+
+        if data is not None and mime is None:
             logger.error(
                 "favicon resolver %s tries to cache mime-type None for authority %s",
                 resolver,
@@ -481,13 +644,38 @@ class FaviconCacheMEM(FaviconCache):
             )
             return False
 
-        digest = hashlib.sha256(data).hexdigest()
-        self._data[digest] = data
-        self._sha_mime[f"{resolver}:{authority}"] = (digest, mime)
+        if self.l2 is not None:
+            if not self.l2.set(resolver, authority, mime, data):
+                return False
+        elif len(data or b"") > self.cfg.BLOB_MAX_BYTES:
+            logger.info(
+                "favicon of resolver: %s / authority: %s to big to cache (bytes: %s) ", resolver, authority, len(data)  # type: ignore
+            )
+            return False
+
+        self._put((resolver, authority), mime, data)
         return True
 
     def state(self):
-        return FaviconCacheStats(favicons=len(self._data.keys()))
+        if self.l2 is not None:
+            stats = self.l2.state()
+        else:
+            with self._lock:
+                stats = FaviconCacheStats(
+                    favicons=len(self._blobs),
+                    bytes=self._bytes,
+                    domains=len({authority for _, authority in self._map}),
+                    resolvers=len({resolver for resolver, _ in self._map}),
+                )
+        stats.hits = self.hits
+        stats.misses = self.misses
+        stats.evictions = self.evictions
+        return stats
 
     def maintenance(self, force=False):
-        pass
+        now = time.time()
+        with self._lock:
+            for key in [key for key, entry in self._map.items() if entry[2] <= now]:
+                self._drop(key)
+        if self.l2 is not None:
+            self.l2.maintenance(force=force)
@@ -28,6 +28,7 @@ SearXNG’s locale implementations
 
 from __future__ import annotations
 
+import functools
 from pathlib import Path
 
 import babel
@@ -61,6 +62,36 @@ RTL_LOCALES: set[str] = set()
 """List of *Right-To-Left* locales e.g. 'he' or 'fa-IR' (see
 :py:obj:`locales_initialize`)."""
 
+LOCALE_CACHE_SIZE = 4096
+"""Maximum number of entries in each of the memo caches of
+:py:obj:`parse_locale` and :py:obj:`match_locale`.
+The arguments of these functions come from a small set of locales, the caches
+are bounded to not grow on arbitrary input."""
+
+COMMON_LOCALES = (
+    'all',
+    'en',
+    'en-US',
+    'en-GB',
+    'de',
+    'de-DE',
+    'fr',
+    'fr-FR',
+    'es',
+    'es-ES',
+    'it',
+    'pt',
+    'pt-BR',
+    'nl',
+    'pl',
+    'ru',
+    'ja',
+    'zh',
+    'zh-CN',
+)
+"""SearXNG locales resolved for each engine before the first request (see
+:py:obj:`searx.engines.precompute_locales`)."""
+
 ADDITIONAL_TRANSLATIONS = {
     "dv": "ދިވެހި (Dhivehi)",
     "oc": "Occitan",
@@ -167,11 +198,33 @@ def language_tag(locale: babel.Locale) -> str:
     return sxng_lang
 
 
+@functools.lru_cache(maxsize=LOCALE_CACHE_SIZE)
+def _parse_locale(locale_tag: str, sep: str) -> babel.Locale | babel.core.UnknownLocaleError:
+    try:
+        return babel.Locale.parse(locale_tag, sep=sep)
+    except babel.core.UnknownLocaleError as exc:
+        # an unknown locale is the most expensive case of babel.Locale.parse
+        # (all locales are scanned), it is cached as well
+        return exc.with_traceback(None)
+
+
+def parse_locale(locale_tag: str, sep: str = '_') -> babel.Locale:
+    """Memoized :py:obj:`babel.Locale.parse`, raises a
+    :py:obj:`babel.core.UnknownLocaleError` if the locale is unknown by babel.
+
+    The returned :py:obj:`babel.Locale` object is shared, it must not be
+    modified."""
+    locale = _parse_locale(locale_tag, sep)
+    if isinstance(locale, babel.core.UnknownLocaleError):
+        raise babel.core.UnknownLocaleError(locale.identifier)
+    return locale
+
+
 def get_locale(locale_tag: str) -> babel.Locale | None:
     """Returns a :py:obj:`babel.Locale` object parsed from argument
     ``locale_tag``"""
     try:
-        locale = babel.Locale.parse(locale_tag, sep='-')
+        locale = parse_locale(locale_tag, sep='-')
         return locale
 
     except babel.core.UnknownLocaleError:
@@ -246,6 +299,11 @@ def get_engine_locale(searxng_locale, engine_locales, default=None):
     engine's language (locale).  If no value can be determined by these
     approximation attempts the ``default`` value is returned.
 
+    The results for the languages and regions of an engine are held in the
+    lookup tables of its traits (:py:obj:`EngineTraits.get_language
+    <searx.enginelib.traits.EngineTraits.get_language>`), this function is not
+    memoized.
+
     Assumptions:
 
     A. When user select a language the results should be optimized according to
@@ -279,10 +337,10 @@ def get_engine_locale(searxng_locale, engine_locales, default=None):
         return engine_locale
 
     try:
-        locale = babel.Locale.parse(searxng_locale, sep='-')
+        locale = parse_locale(searxng_locale, sep='-')
     except babel.core.UnknownLocaleError:
         try:
-            locale = babel.Locale.parse(searxng_locale.split('-')[0])
+            locale = parse_locale(searxng_locale.split('-')[0])
         except babel.core.UnknownLocaleError:
             return default
 
@@ -384,6 +442,8 @@ def match_locale(searxng_locale: str, locale_tag_list: list[str], fallback: str
        The *SearXNG locale* string and the members of ``locale_tag_list`` has to
        be known by babel!  The :py:obj:`ADDITIONAL_TRANSLATIONS` are used in the
        UI and are not known by babel --> will be ignored.
+
+    The results are held in a bounded memo cache.
     """
 
     # searxng_locale = 'es'
@@ -391,7 +451,11 @@ def match_locale(searxng_locale: str, locale_tag_list: list[str], fallback: str
 
     if not searxng_locale:
         return fallback
+    return _match_locale(searxng_locale, tuple(locale_tag_list), fallback)
+
 
+@functools.lru_cache(maxsize=LOCALE_CACHE_SIZE)
+def _match_locale(searxng_locale: str, locale_tag_list: tuple[str, ...], fallback: str | None) -> str | None:
     locale = get_locale(searxng_locale)
     if locale is None:
         return fallback
@@ -89,6 +89,17 @@ class Plugin(abc.ABC):
 
     fqn: str = ""
 
+    typed_results: typing.ClassVar[bool] = False
+    """The :py:obj:`Plugin.on_result` of the plugin only sets keys of a result
+    that are fields of :py:obj:`MainResult
+    <searx.result_types._base.MainResult>`.  Only then the url-results of the
+    engines that still return a ``dict`` are converted into a typed result
+    (:py:obj:`LegacyMainResult <searx.result_types._base.LegacyMainResult>`),
+    a typed result can't hold other keys.  If one of the active plugins does
+    not set this (e.g. a plugin not maintained in this repository), the
+    ``dict`` results are passed as :py:obj:`LegacyResult
+    <searx.result_types.LegacyResult>` to the plugins."""
+
     def __init__(self, plg_cfg: PluginCfg) -> None:
         super().__init__()
         if not self.fqn:
@@ -262,6 +273,17 @@ class PluginStorage:
                 break
         return ret
 
+    def typed_results(self, user_plugins: list[str]) -> bool:
+        """Returns ``True`` if the :py:obj:`Plugin.on_result` hooks of all
+        plugins in ``user_plugins`` can be called with typed results (see
+        :py:obj:`Plugin.typed_results`)."""
+
+        return all(
+            p.typed_results or type(p).on_result is Plugin.on_result
+            for p in self.plugin_list
+            if p.id in user_plugins
+        )
+
     def on_result(self, request: SXNG_Request, search: "SearchWithPlugins", result: Result) -> bool:
 
         ret = True
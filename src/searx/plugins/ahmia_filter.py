@@ -6,7 +6,7 @@ from hashlib import md5
 
 from flask_babel import gettext
 
-from searx.data import ahmia_blacklist_loader
+from searx.data import ahmia_blacklist_loader, AhmiaBlacklistDB
 from searx import get_setting
 from searx.plugins import Plugin, PluginInfo
 
@@ -17,13 +17,14 @@ if typing.TYPE_CHECKING:
     from searx.result_types import Result
     from searx.plugins import PluginCfg
 
-ahmia_blacklist: list = []
+ahmia_blacklist: AhmiaBlacklistDB | frozenset = frozenset()
 
 
 class SXNGPlugin(Plugin):
     """Filter out onion results that appear in Ahmia's blacklist (See https://ahmia.fi/blacklist)."""
 
     id = "ahmia_filter"
+    typed_results = True
 
     def __init__(self, plg_cfg: "PluginCfg") -> None:
         super().__init__(plg_cfg)
@@ -39,7 +40,7 @@ class SXNGPlugin(Plugin):
     ) -> bool:  # pylint: disable=unused-argument
         if not getattr(result, "is_onion", False) or not getattr(result, "parsed_url", False):
             return True
-        result_hash = md5(result["parsed_url"].hostname.encode()).hexdigest()
+        result_hash = md5(result["parsed_url"].hostname.encode()).digest()
         return result_hash not in ahmia_blacklist
 
     def init(self, app: "flask.Flask") -> bool:  # pylint: disable=unused-argument
@@ -115,6 +115,7 @@ class SXNGPlugin(Plugin):
     """Rewrite hostnames, remove results or prioritize them."""
 
     id = "hostnames"
+    typed_results = True
 
     def __init__(self, plg_cfg: "PluginCfg") -> None:
         super().__init__(plg_cfg)
@@ -35,7 +35,7 @@ def filter_url_field(result: "Result|LegacyResult", field_name: str, url_src: st
         for suffix in ("/", ".pdf", ".xml", "/full", "/meta", "/abstract"):
             doi = doi.removesuffix(suffix)
         new_url = get_doi_resolver() + doi
-        if "doi" not in result:
+        if not result.get("doi"):
             result["doi"] = doi
         log.debug("oa_doi_rewrite: [URL field: %s] %s -> %s", field_name, url_src, new_url)
         return new_url  # use new url
@@ -47,6 +47,7 @@ class SXNGPlugin(Plugin):
     """Avoid paywalls by redirecting to open-access."""
 
     id = "oa_doi_rewrite"
+    typed_results = True
 
     def __init__(self, plg_cfg: "PluginCfg") -> None:
         super().__init__(plg_cfg)
@@ -27,6 +27,7 @@ class SXNGPlugin(Plugin):
     """Remove trackers arguments from the returned URL."""
 
     id = "tracker_url_remover"
+    typed_results = True
 
     def __init__(self, plg_cfg: "PluginCfg") -> None:
 
@@ -2,11 +2,13 @@
 """A plugin for converting measured values from one unit to another unit (a
 unit converter).
 
-The plugin looks up the symbols (given in the query term) in a list of
-converters, each converter is one item in the list (compare
+The plugin looks up the symbols (given in the query term) in the index of the
+converters (:py:obj:`searx.wikidata_units.units_by_symbol`), each converter is
+one item in the :py:obj:`list of unit converters<symbol_to_si>` (compare
 :py:obj:`ADDITIONAL_UNITS`).  If the symbols are ambiguous, the matching units
-of measurement are evaluated.  The weighting in the evaluation results from the
-sorting of the :py:obj:`list of unit converters<symbol_to_si>`.
+of measurement are evaluated (:py:obj:`searx.wikidata_units.find_conversion`).
+The weighting in the evaluation results from the sorting of the list of unit
+converters.
 """
 from __future__ import annotations
 import typing
@@ -15,11 +17,12 @@ import babel.numbers
 
 from flask_babel import gettext, get_locale
 
-from searx.wikidata_units import symbol_to_si
+from searx.wikidata_units import symbol_to_si, find_conversion, pos_from_si, pos_to_si, pos_symbol
 from searx.plugins import Plugin, PluginInfo
 from searx.result_types import EngineResults
 
 if typing.TYPE_CHECKING:
+    import flask
     from searx.search import SearchWithPlugins
     from searx.extended_types import SXNG_Request
     from searx.plugins import PluginCfg
@@ -65,15 +68,19 @@ class SXNGPlugin(Plugin):
             return results
 
         for query_part in query_parts:
-            for keyword in CONVERT_KEYWORDS:
-                if query_part == keyword:
-                    from_query, to_query = query.split(keyword, 1)
-                    target_val = _parse_text_and_convert(from_query.strip(), to_query.strip())
-                    if target_val:
-                        results.add(results.types.Answer(answer=target_val))
+            if query_part in CONVERT_KEYWORDS:
+                from_query, to_query = query.split(query_part, 1)
+                target_val = _parse_text_and_convert(from_query.strip(), to_query.strip())
+                if target_val:
+                    results.add(results.types.Answer(answer=target_val))
 
         return results
 
+    def init(self, app: "flask.Flask") -> bool:  # pylint: disable=unused-argument
+        # build the index of the unit converters once, not on the first query
+        symbol_to_si()
+        return True
+
 
 # inspired from https://stackoverflow.com/a/42475086
 RE_MEASURE = r'''
@@ -88,8 +95,6 @@ RE_MEASURE = r'''
 
 def _parse_text_and_convert(from_query, to_query) -> str | None:
 
-    # pylint: disable=too-many-branches, too-many-locals
-
     if not (from_query and to_query):
         return None
 
@@ -101,30 +106,14 @@ def _parse_text_and_convert(from_query, to_query) -> str | None:
     # the correct one must be determined by comparing it with the to-unit
     # https://github.com/searxng/searxng/pull/3378#issuecomment-2080974863
 
-    # first: collecting possible units
-
-    source_list, target_list = [], []
-
-    for symbol, si_name, from_si, to_si, orig_symbol in symbol_to_si():
-
-        if symbol == measured.group('unit'):
-            source_list.append((si_name, to_si))
-        if symbol == to_query:
-            target_list.append((si_name, from_si, orig_symbol))
-
-    if not (source_list and target_list):
+    conversion = find_conversion(measured.group('unit'), to_query)
+    if conversion is None:
         return None
 
-    source_to_si = target_from_si = target_symbol = None
-
-    # second: find the right unit by comparing list of from-units with list of to-units
-
-    for source in source_list:
-        for target in target_list:
-            if source[0] == target[0]:  # compare si_name
-                source_to_si = source[1]
-                target_from_si = target[1]
-                target_symbol = target[2]
+    source, target = conversion
+    source_to_si = source[pos_to_si]
+    target_from_si = target[pos_from_si]
+    target_symbol = target[pos_symbol]
 
     if not (source_to_si and target_from_si):
         return None
@@ -4,6 +4,7 @@
 
 - :py:obj:`Result` base class
 - :py:obj:`LegacyResult` for internal use only
+- :py:obj:`LegacyMainResult` for internal use only
 
 ----
 
@@ -14,6 +15,11 @@
 
 .. autoclass:: LegacyResult
    :members:
+
+.. autoclass:: LegacyMainResult
+   :members:
+
+.. autofunction:: main_result_from_legacy
 """
 
 
@@ -38,10 +44,7 @@ WHITESPACE_REGEX = re.compile('( |\t|\n)+', re.M | re.U)
 UNKNOWN = object()
 
 
-def _normalize_url_fields(result: Result | LegacyResult):
-
-    # As soon we need LegacyResult not any longer, we can move this function to
-    # method Result.normalize_result_fields
+def _parse_url_field(result: Result | LegacyResult):
 
     if result.url and not result.parsed_url:
         if not isinstance(result.url, str):
@@ -51,6 +54,14 @@ def _normalize_url_fields(result: Result | LegacyResult):
         else:
             result.parsed_url = urllib.parse.urlparse(result.url)
 
+
+def _normalize_url_fields(result: Result | LegacyResult):
+
+    # As soon we need LegacyResult not any longer, we can move this function to
+    # method Result.normalize_result_fields
+
+    _parse_url_field(result)
+
     if result.parsed_url:
         result.parsed_url = result.parsed_url._replace(
             # if the result has no scheme, use http as default
@@ -261,6 +272,21 @@ class Result(msgspec.Struct, kw_only=True):
         """
         _normalize_url_fields(self)
 
+    def normalize_key_fields(self):
+        """Cheap part of :py:obj:`Result.normalize_result_fields`, only the
+        fields needed to compute the hash value and to merge the results are
+        initialized (``parsed_url`` from ``url``, title and content of a
+        :py:obj:`MainResult`).  Used by the lazy normalization of the
+        :py:obj:`searx.results.ResultContainer`, which calls
+        :py:obj:`Result.normalize_deferred_fields` only for the results that are
+        returned."""
+        _parse_url_field(self)
+
+    def normalize_deferred_fields(self):
+        """The part of :py:obj:`Result.normalize_result_fields` that is not done
+        by :py:obj:`Result.normalize_key_fields` (URL fields)."""
+        _normalize_url_fields(self)
+
     def __post_init__(self):
         pass
 
@@ -323,6 +349,12 @@ class Result(msgspec.Struct, kw_only=True):
             raise KeyError(f"{field_name}")
         return getattr(self, field_name)
 
+    def get(self, field_name, default=None):
+
+        if field_name not in self.__struct_fields__:
+            return default
+        return getattr(self, field_name)
+
     def __iter__(self):
 
         return iter(self.__struct_fields__)
@@ -337,7 +369,7 @@ class Result(msgspec.Struct, kw_only=True):
         for field_name in self.__struct_fields__:
             self_val = getattr(self, field_name, False)
             other_val = getattr(other, field_name, False)
-            if self_val:
+            if not self_val and other_val:
                 setattr(self, field_name, other_val)
 
 
@@ -411,6 +443,17 @@ class MainResult(Result):  # pylint: disable=missing-class-docstring
         if self.engine:
             self.engines.add(self.engine)
 
+    def normalize_key_fields(self):
+        super().normalize_key_fields()
+        # the merge of two results compares title and content
+        _normalize_text_fields(self)
+        if self.engine:
+            self.engines.add(self.engine)
+
+    def normalize_deferred_fields(self):
+        super().normalize_deferred_fields()
+        _normalize_date_fields(self)
+
 
 class LegacyResult(dict):
     """A wrapper around a legacy result item.  The SearXNG core uses this class
@@ -550,11 +593,61 @@ class LegacyResult(dict):
         if self.engine:
             self.engines.add(self.engine)
 
-    def defaults_from(self, other: LegacyResult):
-        for k, v in other.items():
+    def defaults_from(self, other: Result | LegacyResult):
+        for k, v in other.as_dict().items():
             if not self.get(k):
                 self[k] = v
 
     def filter_urls(self, filter_func: Callable[[Result | LegacyResult, str, str], str | bool]):
         """See :py:obj:`Result.filter_urls`"""
         _filter_urls(self, filter_func=filter_func)
+
+
+class LegacyMainResult(MainResult, gc=False):
+    """Typed replacement of a :py:obj:`LegacyResult` for the ordinary
+    url-results of engines that still return a ``dict``.
+
+    The fields of :py:obj:`MainResult` only hold strings, numbers, dates and
+    containers of them, a reference cycle is not possible and the instances
+    can be excluded from the garbage collector (``gc=False``).
+
+    .. attention::
+
+       Do not use this class in your own implementations!
+    """
+
+    doi: str = ""
+    """DOI of the publication, set by the plugin :py:mod:`searx.plugins.oa_doi_rewrite`
+    (the plugins can't add keys to a struct, the keys they set have to be
+    fields)."""
+
+
+LEGACY_MAIN_RESULT_FIELDS = frozenset(LegacyMainResult.__struct_fields__)
+
+LEGACY_DYNAMIC_TEMPLATES = frozenset(["images.html", "keyvalue.html"])
+"""Templates of legacy results that are not converted to a
+:py:obj:`LegacyMainResult` (the hash of these results is computed
+differently)."""
+
+
+def main_result_from_legacy(result: dict) -> LegacyMainResult | None:
+    """Converts the ``dict`` of an ordinary url-result into a
+    :py:obj:`LegacyMainResult`.
+
+    Returns ``None`` if the ``dict`` has keys that are not a field of
+    :py:obj:`MainResult` (infobox, answer, suggestion, .. or any other engine
+    specific key) or if a :py:obj:`LegacyResult` is needed for other reasons.
+    In these cases the caller has to fall back to :py:obj:`LegacyResult`.
+    """
+    if not LEGACY_MAIN_RESULT_FIELDS.issuperset(result):
+        return None
+    if result.get("template") in LEGACY_DYNAMIC_TEMPLATES:
+        return None
+
+    kwargs = {k: v for k, v in result.items() if v is not None or k in ("url", "parsed_url", "publishedDate")}
+    if not isinstance(kwargs.get("engines", set()), set):
+        kwargs["engines"] = set(kwargs["engines"])
+    if not isinstance(kwargs.get("positions", []), list):
+        # LegacyResult uses an empty string to init field "positions"
+        del kwargs["positions"]
+    return LegacyMainResult(**kwargs)
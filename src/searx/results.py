@@ -2,6 +2,7 @@
 # pylint: disable=missing-module-docstring, missing-class-docstring
 from __future__ import annotations
 
+import heapq
 import warnings
 from collections import defaultdict
 from threading import RLock
@@ -11,6 +12,7 @@ from searx import logger as log
 import searx.engines
 from searx.metrics import histogram_observe, counter_add
 from searx.result_types import Result, LegacyResult, MainResult
+from searx.result_types._base import main_result_from_legacy
 from searx.result_types.answer import AnswerSet, BaseAnswer
 
 
@@ -35,6 +37,93 @@ def calculate_score(result, priority) -> float:
     return score
 
 
+def _engine_weight(engine_name: str | None) -> float:
+    engine = searx.engines.engines.get(engine_name or "")
+    return float(getattr(engine, "weight", 1.0))
+
+
+class RankFusion:
+    """Base class of the rank-fusion strategies of the :py:obj:`ResultContainer`.
+
+    The score of a main result is maintained incrementally: each time an engine
+    reports a result (at ``position`` in its result list), :py:obj:`update` is
+    called with the (merged) result.  A strategy only has to update the score of
+    this one result, the scores of all other results are not touched.
+    """
+
+    name: str = ""
+
+    def update(self, result: MainResult | LegacyResult, engine_name: str, position: int):
+        raise NotImplementedError()
+
+
+class LegacyRankFusion(RankFusion):
+    """The traditional SearXNG scoring, see :py:obj:`calculate_score`:
+    ``weight * len(positions) / position`` summed up over all positions."""
+
+    name = "legacy"
+
+    def update(self, result: MainResult | LegacyResult, engine_name: str, position: int):
+        result.score = calculate_score(result, result.priority)
+
+
+class ReciprocalRankFusion(RankFusion):
+    """Reciprocal rank fusion (RRF): ``weight / (k + position)`` summed up over
+    the engines that found the result."""
+
+    name = "rrf"
+
+    def __init__(self, k: int = 60):
+        self.k = k
+
+    def update(self, result: MainResult | LegacyResult, engine_name: str, position: int):
+        if result.priority == "low":
+            result.score = 0
+            return
+        if result.priority == "high":
+            position = 1
+        result.score += _engine_weight(engine_name) / (self.k + position)
+
+
+class BordaRankFusion(RankFusion):
+    """Weighted Borda count: an engine gives ``depth + 1 - position`` points
+    (multiplied by the engine weight) to each of its first ``depth`` results."""
+
+    name = "borda"
+
+    def __init__(self, depth: int = 100):
+        self.depth = depth
+
+    def update(self, result: MainResult | LegacyResult, engine_name: str, position: int):
+        if result.priority == "low":
+            result.score = 0
+            return
+        if result.priority == "high":
+            position = 1
+        result.score += _engine_weight(engine_name) * max(self.depth + 1 - position, 0)
+
+
+RANK_FUSION: dict[str, type[RankFusion]] = {
+    LegacyRankFusion.name: LegacyRankFusion,
+    ReciprocalRankFusion.name: ReciprocalRankFusion,
+    BordaRankFusion.name: BordaRankFusion,
+}
+"""Available rank-fusion strategies, the key is the name of the strategy."""
+
+DEFAULT_RANK_FUSION = LegacyRankFusion.name
+
+
+def get_rank_fusion(name: str | None) -> RankFusion:
+    """Returns a new instance of the rank-fusion strategy ``name``, if ``name``
+    is unset the :py:obj:`DEFAULT_RANK_FUSION` is returned.  Raises a
+    :py:obj:`ValueError` if the strategy is unknown."""
+
+    cls = RANK_FUSION.get(name or DEFAULT_RANK_FUSION)
+    if cls is None:
+        raise ValueError(f"unknown rank fusion: {name} (available: {', '.join(RANK_FUSION)})")
+    return cls()
+
+
 class Timing(NamedTuple):
     engine: str
     total: float
@@ -49,7 +138,16 @@ class UnresponsiveEngine(NamedTuple):
 
 class ResultContainer:
     """In the result container, the results are collected, sorted and duplicates
-    will be merged."""
+    will be merged.
+
+    With :py:obj:`ResultContainer.lazy_normalization` the main results are
+    processed in two phases: on ingestion only the fields needed for the
+    deduplication and the merge are normalized
+    (:py:obj:`Result.normalize_key_fields`), the remaining fields (URL and date)
+    are normalized by :py:obj:`ResultContainer.normalize_results` for the
+    results that are returned.  The ``on_result`` hooks of the plugins are
+    called on ingestion in both modes.
+    """
 
     # pylint: disable=too-many-statements
 
@@ -59,7 +157,7 @@ class ResultContainer:
     answers: AnswerSet
     corrections: set[str]
 
-    def __init__(self):
+    def __init__(self, rank_fusion: RankFusion | None = None):
         self.main_results_map = {}
         self.infoboxes = []
         self.suggestions = set()
@@ -74,8 +172,20 @@ class ResultContainer:
         self.timings: List[Timing] = []
         self.redirect_url: str | None = None
         self.on_result = lambda _: True
+        self.lazy_normalization: bool = False
+        self.typed_legacy_results: bool = True
         self._lock = RLock()
         self._main_results_sorted: list[MainResult | LegacyResult] = None  # type: ignore
+        self.rank_fusion: RankFusion = rank_fusion or get_rank_fusion(None)
+
+    def set_rank_fusion(self, rank_fusion: RankFusion):
+        """Selects the rank-fusion strategy, has to be called before the first
+        result is added to the container (scores are maintained
+        incrementally)."""
+        with self._lock:
+            if self.main_results_map:
+                raise RuntimeError("rank fusion can't be changed once results have been added")
+            self.rank_fusion = rank_fusion
 
     def extend(self, engine_name: str | None, results):  # pylint: disable=too-many-branches
         if self._closed:
@@ -85,9 +195,19 @@ class ResultContainer:
 
         for result in list(results):
 
+            if not isinstance(result, Result) and self.typed_legacy_results:
+                # ordinary url-results of engines that still return a dict are
+                # converted into a typed (compact) result, LegacyResult is only
+                # used for the dynamic cases (infobox, answer, ..) and when a
+                # plugin needs it (see Plugin.typed_results)
+                result = main_result_from_legacy(result) or result
+
             if isinstance(result, Result):
                 result.engine = result.engine or engine_name
-                result.normalize_result_fields()
+                if self.lazy_normalization and isinstance(result, MainResult):
+                    result.normalize_key_fields()
+                else:
+                    result.normalize_result_fields()
                 if not self.on_result(result):
                     continue
 
@@ -152,6 +272,18 @@ class ResultContainer:
             if not self.paging and eng.paging:
                 self.paging = True
 
+    def normalize_results(self, results: list[MainResult | LegacyResult]) -> list[MainResult | LegacyResult]:
+        """Second phase of the lazy normalization: normalizes the fields of the
+        given (returned) results.  Without
+        :py:obj:`ResultContainer.lazy_normalization` the results are already
+        normalized.  Returns the list of results."""
+
+        if self.lazy_normalization:
+            for result in results:
+                if isinstance(result, MainResult):
+                    result.normalize_deferred_fields()
+        return results
+
     def _merge_infobox(self, new_infobox: LegacyResult):
         add_infobox = True
 
@@ -174,18 +306,20 @@ class ResultContainer:
             if not merged:
                 # if there is no duplicate in the merged results, append result
                 result.positions = [position]
+                result.score = 0
                 self.main_results_map[result_hash] = result
+                self.rank_fusion.update(result, result.engine or "", position)
                 return
 
             merge_two_main_results(merged, result)
             # add the new position
             merged.positions.append(position)
+            self.rank_fusion.update(merged, result.engine or "", position)
 
     def close(self):
         self._closed = True
 
         for result in self.main_results_map.values():
-            result.score = calculate_score(result, result.priority)
             for eng_name in result.engines:
                 counter_add(result.score, 'engine', eng_name, 'score')
 
@@ -203,49 +337,27 @@ class ResultContainer:
         results = sorted(self.main_results_map.values(), key=lambda x: x.score, reverse=True)
 
         # pass 2 : group results by category and template
-        gresults = []
-        categoryPositions = {}
-        max_count = 8
-        max_distance = 20
-
-        for res in results:
-            # do we need to handle more than one category per engine?
-            engine = searx.engines.engines.get(res.engine or "")
-            if engine:
-                res.category = engine.categories[0] if len(engine.categories) > 0 else ""
-
-            # do we need to handle more than one category per engine?
-            category = f"{res.category}:{res.template}:{'img_src' if (res.thumbnail or res.img_src) else ''}"
-            grp = categoryPositions.get(category)
-
-            # group with previous results using the same category, if the group
-            # can accept more result and is not too far from the current
-            # position
-
-            if (grp is not None) and (grp["count"] > 0) and (len(gresults) - grp["index"] < max_distance):
-                # group with the previous results using the same category with
-                # this one
-                index = grp["index"]
-                gresults.insert(index, res)
-
-                # update every index after the current one (including the
-                # current one)
-                for item in categoryPositions.values():
-                    v = item["index"]
-                    if v >= index:
-                        item["index"] = v + 1
-
-                # update this category
-                grp["count"] -= 1
+        self._main_results_sorted = group_results(results)
+        return self._main_results_sorted
 
-            else:
-                gresults.append(res)
-                # update categoryIndex
-                categoryPositions[category] = {"index": len(gresults), "count": max_count}
-                continue
+    def get_top_results(self, k: int) -> list[MainResult | LegacyResult]:
+        """Returns the first ``k`` results of :py:obj:`get_ordered_results`
+        without sorting all results.
 
-        self._main_results_sorted = gresults
-        return self._main_results_sorted
+        The grouping pass moves a result at most ``GROUP_MAX_DISTANCE`` places
+        forward, only the ``k + GROUP_MAX_DISTANCE`` results with the highest
+        score can be in the first ``k`` places.  These candidates are selected
+        by a partial selection (:py:obj:`heapq.nlargest`) and grouped."""
+
+        if not self._closed:
+            self.close()
+
+        if self._main_results_sorted:
+            return self._main_results_sorted[:k]
+
+        with self._lock:
+            results = heapq.nlargest(k + GROUP_MAX_DISTANCE, self.main_results_map.values(), key=lambda x: x.score)
+        return group_results(results)[:k]
 
     @property
     def number_of_results(self) -> int:
@@ -262,7 +374,7 @@ class ResultContainer:
                 return 0
 
             average = int(resultnum_sum / len(self._number_of_results))
-            if average < len(self.get_ordered_results()):
+            if average < len(self.main_results_map):
                 average = 0
             return average
 
@@ -289,6 +401,59 @@ class ResultContainer:
             return self.timings
 
 
+GROUP_MAX_COUNT = 8
+"""Maximum number of results grouped with the first result of a category."""
+
+GROUP_MAX_DISTANCE = 20
+"""A result is only grouped with the results of its category if the group is
+not further away than this distance."""
+
+
+def group_results(results: list[MainResult | LegacyResult]) -> list[MainResult | LegacyResult]:
+    """Groups the results (sorted by score) by category and template."""
+
+    gresults = []
+    categoryPositions = {}
+
+    for res in results:
+        # do we need to handle more than one category per engine?
+        engine = searx.engines.engines.get(res.engine or "")
+        if engine:
+            res.category = engine.categories[0] if len(engine.categories) > 0 else ""
+
+        # do we need to handle more than one category per engine?
+        category = f"{res.category}:{res.template}:{'img_src' if (res.thumbnail or res.img_src) else ''}"
+        grp = categoryPositions.get(category)
+
+        # group with previous results using the same category, if the group
+        # can accept more result and is not too far from the current
+        # position
+
+        if (grp is not None) and (grp["count"] > 0) and (len(gresults) - grp["index"] < GROUP_MAX_DISTANCE):
+            # group with the previous results using the same category with
+            # this one
+            index = grp["index"]
+            gresults.insert(index, res)
+
+            # update every index after the current one (including the
+            # current one)
+            for item in categoryPositions.values():
+                v = item["index"]
+                if v >= index:
+                    item["index"] = v + 1
+
+            # update this category
+            grp["count"] -= 1
+
+        else:
+            gresults.append(res)
+            # update categoryIndex
+            categoryPositions[category] = {"index": len(gresults), "count": GROUP_MAX_COUNT}
+            continue
+
+    return gresults
+
+
 def merge_two_infoboxes(origin: LegacyResult, other: LegacyResult):
     """Merges the values from ``other`` into ``origin``."""
     # pylint: disable=too-many-branches
@@ -361,10 +526,7 @@ def merge_two_main_results(origin: MainResult | LegacyResult, other: MainResult
         origin.title = other.title
 
     # merge all result's parameters not found in origin
-    if isinstance(other, MainResult) and isinstance(origin, MainResult):
-        origin.defaults_from(other)
-    elif isinstance(other, LegacyResult) and isinstance(origin, LegacyResult):
-        origin.defaults_from(other)
+    origin.defaults_from(other)
 
     # add engine to list of result-engines
     origin.engines.add(other.engine or "")
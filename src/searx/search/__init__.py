@@ -29,9 +29,11 @@ from .models import EngineRef, SearchQuery
 logger = logger.getChild('search')
 
 
-def initialize(settings_engines=None, enable_checker=False, check_network=False, enable_metrics=True):
+def initialize(
+    settings_engines=None, enable_checker=False, check_network=False, enable_metrics=True, lazy_engines=False
+):
     settings_engines = settings_engines or settings['engines']
-    load_engines(settings_engines)
+    load_engines(settings_engines, lazy=lazy_engines)
     initialize_network(settings_engines, settings['outgoing'])
     if check_network:
         check_network_configuration()
@@ -193,6 +195,7 @@ class SearchWithPlugins(Search):
         super().__init__(search_query)
         self.user_plugins = user_plugins
         self.result_container.on_result = self._on_result
+        self.result_container.typed_legacy_results = searx.plugins.STORAGE.typed_results(user_plugins)
         # pylint: disable=line-too-long
         # get the "real" request to use it outside the Flask context.
         # see
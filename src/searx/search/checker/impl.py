@@ -14,7 +14,7 @@ import re
 import httpx
 
 from searx import network, logger
-from searx.utils import gen_useragent, detect_language
+from searx.utils import gen_useragent, detect_languages
 from searx.results import ResultContainer
 from searx.search.models import SearchQuery, EngineRef
 from searx.search.processors import EngineProcessor
@@ -206,11 +206,12 @@ class ResultContainerTests:  # pylint: disable=missing-class-docstring
         sqstr = ' '.join(['{}={!r}'.format(k, v) for k, v in sq.items()])
         self.test_results.add_error(self.test_name, message, *args, '(' + sqstr + ')')
 
-    def _add_language(self, text: str) -> typing.Optional[str]:
-        langStr = detect_language(text)
-        if langStr:
-            self.languages.add(langStr)
-            self.test_results.add_language(langStr)
+    def _add_language(self, texts: typing.Iterable[str]) -> None:
+        # the languages of all texts are detected by one call of the model
+        for langStr in detect_languages(texts):
+            if langStr:
+                self.languages.add(langStr)
+                self.test_results.add_language(langStr)
 
     def _check_result(self, result):
         if not _check_no_html(result.get('title', '')):
@@ -220,9 +221,6 @@ class ResultContainerTests:  # pylint: disable=missing-class-docstring
         if result.get('url') is None:
             self._record_error('url is None')
 
-        self._add_language(result.get('title', ''))
-        self._add_language(result.get('content', ''))
-
         template = result.get('template', 'default.html')
         if template == 'default.html':
             return
@@ -243,8 +241,12 @@ class ResultContainerTests:  # pylint: disable=missing-class-docstring
             self._record_error('thumbnail URL is invalid', result.get('img_src'))
 
     def _check_results(self, results: list):
+        texts = []
         for result in results:
             self._check_result(result)
+            texts.append(result.get('title', ''))
+            texts.append(result.get('content', ''))
+        self._add_language(texts)
 
     def _check_answers(self, answers):
         for answer in answers:
@@ -255,7 +257,7 @@ class ResultContainerTests:  # pylint: disable=missing-class-docstring
         for infobox in infoboxes:
             if not _check_no_html(infobox.get('content', '')):
                 self._record_error('HTML in infobox content', infobox.get('content', ''))
-            self._add_language(infobox.get('content', ''))
+            self._add_language([infobox.get('content', '')])
             for attribute in infobox.get('attributes', {}):
                 if not _check_no_html(attribute.get('value', '')):
                     self._record_error('HTML in infobox attribute value', attribute.get('value', ''))
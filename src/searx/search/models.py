@@ -4,6 +4,8 @@
 import typing
 import babel
 
+from searx.locales import parse_locale
+
 
 class EngineRef:
     """Reference by names to an engine and category"""
@@ -68,7 +70,7 @@ class SearchQuery:
         self.locale = None
         if self.lang:
             try:
-                self.locale = babel.Locale.parse(self.lang, sep='-')
+                self.locale = parse_locale(self.lang, sep='-')
             except babel.core.UnknownLocaleError:
                 pass
 
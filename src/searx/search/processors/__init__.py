@@ -61,11 +61,17 @@ def get_processor(engine, engine_name):
 def initialize_processor(processor):
     """Initialize one processor
 
-    Call the init function of the engine
+    Call the init function of the engine, the init function of a
+    :py:obj:`LazyEngine <searx.enginelib.registry.LazyEngine>` is called when
+    its module is imported, in the thread that imports the module (the first
+    request of the engine waits for the init).
     """
     if processor.has_initialize_function:
-        t = threading.Thread(target=processor.initialize, daemon=True)
-        t.start()
+        if isinstance(processor.engine, engines.LazyEngine) and not processor.engine.loaded:
+            processor.engine.on_load(processor.initialize)
+        else:
+            t = threading.Thread(target=processor.initialize, daemon=True)
+            t.start()
 
 
 def initialize(engine_list):
@@ -10,6 +10,7 @@ from typing import Dict, Union
 
 from searx import settings, logger
 from searx.engines import engines
+from searx.enginelib.registry import LazyEngine
 from searx.network import get_time_for_thread, get_network
 from searx.metrics import histogram_observe, counter_inc, count_exception, count_error
 from searx.exceptions import SearxEngineAccessDeniedException, SearxEngineResponseException
@@ -80,6 +81,8 @@ class EngineProcessor(ABC):
 
     @property
     def has_initialize_function(self):
+        if isinstance(self.engine, LazyEngine):
+            return self.engine.has('init')
         return hasattr(self.engine, 'init')
 
     def handle_exception(self, result_container, exception_or_message, suspend=False):
@@ -135,6 +135,19 @@ def apply_schema(settings, schema, path_list):
     return error
 
 
+def environ_names(schema) -> typing.List[str]:
+    """Returns the names of the environment variables that override a value of
+    the settings in the ``schema``."""
+    names = []
+    for value in schema.values():
+        if isinstance(value, SettingsValue):
+            if value.environ_name:
+                names.append(value.environ_name)
+        elif isinstance(value, dict):
+            names.extend(environ_names(value))
+    return names
+
+
 SCHEMA = {
     'general': {
         'debug': SettingsValue(bool, False, 'SEARXNG_DEBUG'),
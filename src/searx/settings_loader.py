@@ -15,16 +15,23 @@ to be loaded. The rules used for this can be found in the
 - By default, customized :ref:`SearXNG appl <searxng settings.yml>` settings are
   expected in a file named ``settings.yml``.
 
+The validated settings are stored in a cache (see
+:py:obj:`get_settings_cache_file`), a process that starts with unchanged YAML
+files does not have to parse them.
+
 """
 
 from __future__ import annotations
 
+import hashlib
+import os
 import os.path
-from collections.abc import Mapping
+import tempfile
+from collections.abc import Iterable, Mapping
 from itertools import filterfalse
 from pathlib import Path
 
-import yaml
+import msgspec
 
 from searx.exceptions import SearxSettingsException
 
@@ -34,9 +41,17 @@ SETTINGS_YAML = Path("settings.yml")
 DEFAULT_SETTINGS_FILE = Path(searx_dir) / SETTINGS_YAML
 """The :origin:`searx/settings.yml` file with all the default settings."""
 
+SETTINGS_CACHE_MAGIC = b"SXNGSET1"
+
+# the implementation of the settings, a modification invalidates the cache
+_SETTINGS_SOURCES = (Path(searx_dir) / "settings_loader.py", Path(searx_dir) / "settings_defaults.py")
+
 
 def load_yaml(file_name: str | Path):
     """Load YAML config from a file."""
+    # imported on demand, the settings are usually loaded from the cache
+    import yaml  # pylint: disable=import-outside-toplevel
+
     try:
         with open(file_name, 'r', encoding='utf-8') as settings_yaml:
             return yaml.safe_load(settings_yaml) or {}
@@ -189,16 +204,13 @@ def is_use_default_settings(user_settings):
     raise ValueError('Invalid value for use_default_settings')
 
 
-def load_settings(load_user_settings=True) -> tuple[dict, str]:
-    """Function for loading the settings of the SearXNG application
-    (:ref:`settings.yml <searxng settings.yml>`)."""
+def get_user_settings_file() -> Path | None:
+    """Returns the file of the user settings in the :py:obj:`get_user_cfg_folder`
+    or ``None`` if there is no such file."""
 
-    msg = f"load the default settings from {DEFAULT_SETTINGS_FILE}"
-    cfg = load_yaml(DEFAULT_SETTINGS_FILE)
     cfg_folder = get_user_cfg_folder()
-
-    if not load_user_settings or not cfg_folder:
-        return cfg, msg
+    if not cfg_folder:
+        return None
 
     settings_yml = os.environ.get("SEARXNG_SETTINGS_PATH")
     if settings_yml and Path(settings_yml).is_file():
@@ -210,6 +222,19 @@ def load_settings(load_user_settings=True) -> tuple[dict, str]:
 
     cfg_file = cfg_folder / settings_yml
     if not cfg_file.exists():
+        return None
+    return cfg_file
+
+
+def load_settings(load_user_settings=True) -> tuple[dict, str]:
+    """Function for loading the settings of the SearXNG application
+    (:ref:`settings.yml <searxng settings.yml>`)."""
+
+    msg = f"load the default settings from {DEFAULT_SETTINGS_FILE}"
+    cfg = load_yaml(DEFAULT_SETTINGS_FILE)
+    cfg_file = get_user_settings_file()
+
+    if not load_user_settings or not cfg_file:
         return cfg, msg
 
     msg = f"load the user settings from {cfg_file}"
@@ -223,3 +248,101 @@ def load_settings(load_user_settings=True) -> tuple[dict, str]:
         cfg = user_cfg
 
     return cfg, msg
+
+
+def get_settings_cache_file() -> Path | None:
+    """Returns the file of the settings cache or ``None`` if the cache is
+    disabled.
+
+    The file is set by the environment ``SEARXNG_SETTINGS_CACHE``, the value
+    ``false`` (or an empty value) disables the cache.  The default is
+    ``sxng_settings_cache.msgpack`` in the folder for temporary files (e.g.
+    ``/tmp``)."""
+
+    cache_file = os.environ.get("SEARXNG_SETTINGS_CACHE")
+    if cache_file is None:
+        return Path(tempfile.gettempdir()) / "sxng_settings_cache.msgpack"
+    if cache_file.strip().lower() in ("", "0", "false", "off"):
+        return None
+    return Path(cache_file)
+
+
+def settings_cache_key(environ_names: Iterable[str], load_user_settings=True) -> bytes:
+    """Returns the key of the settings in the cache: the SHA-256 hash of the
+    path, mtime and content of all files contributing to the settings (YAML
+    files and the implementation of the settings) and of the environment
+    variables ``environ_names`` (the settings that can be overridden by the
+    environment)."""
+
+    files = [DEFAULT_SETTINGS_FILE, *_SETTINGS_SOURCES]
+    if load_user_settings:
+        cfg_file = get_user_settings_file()
+        if cfg_file:
+            files.append(cfg_file)
+
+    h = hashlib.sha256(searx_dir.encode())
+    for file_name in files:
+        with open(file_name, 'rb') as f:
+            content = f.read()
+            h.update(f"\0{os.path.abspath(file_name)}\0{os.fstat(f.fileno()).st_mtime_ns}\0".encode())
+        h.update(hashlib.sha256(content).digest())
+    for name in sorted(set(environ_names)):
+        value = os.environ.get(name)
+        h.update(f"\0{name}\0{'' if value is None else '=' + value}".encode())
+    return h.digest()
+
+
+def read_settings_cache(cache_file: Path, key: bytes) -> tuple[dict, str] | None:
+    """Returns the validated settings and the load message from the cache or
+    ``None`` if the file does not contain the settings of ``key``.
+
+    A cache file that is not owned by the user of the process or that can be
+    modified by other users is ignored."""
+
+    try:
+        with open(cache_file, 'rb') as f:
+            st = os.fstat(f.fileno())
+            if hasattr(os, "getuid") and (st.st_uid != os.getuid() or st.st_mode & 0o022):
+                return None
+            data = f.read()
+    except OSError:
+        return None
+
+    header = SETTINGS_CACHE_MAGIC + key
+    if not data.startswith(header):
+        return None
+    try:
+        cfg, msg = msgspec.msgpack.decode(memoryview(data)[len(header) :])
+    except (msgspec.DecodeError, ValueError, TypeError):
+        return None
+    return cfg, msg
+
+
+def write_settings_cache(cache_file: Path, key: bytes, cfg: dict, msg: str) -> bool:
+    """Writes the validated settings to the cache (atomically), returns
+    ``False`` if the settings can't be stored in the cache.
+
+    The settings are only cached when they survive the round trip through
+    msgpack unchanged (e.g. a tuple or a set would be decoded as a list)."""
+
+    try:
+        data = msgspec.msgpack.encode([cfg, msg])
+        if msgspec.msgpack.decode(data) != [cfg, msg]:
+            return False
+    except (msgspec.EncodeError, TypeError, ValueError):
+        return False
+
+    tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+    try:
+        fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, 'wb') as f:
+            f.write(SETTINGS_CACHE_MAGIC + key)
+            f.write(data)
+        os.replace(tmp_file, cache_file)
+    except OSError:
+        try:
+            os.unlink(tmp_file)
+        except OSError:
+            pass
+        return False
+    return True
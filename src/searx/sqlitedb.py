@@ -119,6 +119,36 @@ class SQLiteAppl(abc.ABC):
 
     .. _WAL: https://sqlite.org/wal.html
     """
+    SQLITE_PRAGMAS: dict[str, str | int] = {}
+    """PRAGMAs_ set on each new DB connection (see :py:obj:`SQLiteAppl._connect`),
+    e.g. the :py:obj:`SQLITE_PERFORMANCE_PROFILE`.
+
+    .. _PRAGMAs: https://sqlite.org/pragma.html
+    """
+
+    SQLITE_PERFORMANCE_PROFILE: dict[str, str | int] = {
+        "synchronous": "NORMAL",
+        "mmap_size": 1024 * 1024 * 64,  # 64 MB
+        "cache_size": -1024 * 8,  # 8 MB
+        "temp_store": "MEMORY",
+        "busy_timeout": 5000,  # 5 sec.
+    }
+    """PRAGMAs of a performance profile, suitable for caches (use it as
+    :py:obj:`SQLITE_PRAGMAS`):
+
+    ``synchronous=NORMAL``:
+      In WAL mode the DB stays consistent, a transaction committed shortly
+      before a power loss may be rolled back.
+
+    ``mmap_size``, ``cache_size``, ``temp_store=MEMORY``:
+      Read the DB via memory-mapped I/O and hold more pages (and temporary
+      tables) in memory.
+
+    ``busy_timeout``:
+      Wait for the write lock of another connection instead of failing with
+      ``database is locked``.
+    """
+
     SQLITE_CONNECT_ARGS = {
         # "timeout": 5.0,
         # "detect_types": 0,
@@ -146,13 +176,20 @@ class SQLiteAppl(abc.ABC):
       - https://github.com/python/cpython/issues/123873
 
       The workaround for SQLite3 multithreading cache inconsistency is to set
-      option ``cached_statements`` to ``0`` by default.
+      option ``cached_statements`` to ``0`` by default.  Applications that use
+      a connection only in the thread that created it (:py:obj:`SQLiteAppl.DB`
+      is thread local / :py:obj:`DBSession`) can enable the cache of prepared
+      statements.
     """
 
     def __init__(self, db_url):
 
         self.db_url = db_url
         self.properties = SQLiteProperties(db_url)
+        # the properties may open the (thread local) connection of the DB
+        # session, which is then shared with this application
+        self.properties.SQLITE_PRAGMAS = self.SQLITE_PRAGMAS
+        self.properties.SQLITE_CONNECT_ARGS = self.SQLITE_CONNECT_ARGS
         self._init_done = False
         self._compatibility()
         # atexit.register(self.tear_down)
@@ -188,6 +225,8 @@ class SQLiteAppl(abc.ABC):
     def _connect(self) -> sqlite3.Connection:
         conn = sqlite3.Connection(self.db_url, **self.SQLITE_CONNECT_ARGS)  # type: ignore
         conn.execute(f"PRAGMA journal_mode={self.SQLITE_JOURNAL_MODE}")
+        for name, value in self.SQLITE_PRAGMAS.items():
+            conn.execute(f"PRAGMA {name}={value}")
         self.register_functions(conn)
         return conn
 
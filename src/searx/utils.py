@@ -4,12 +4,15 @@
 from __future__ import annotations
 
 import re
+import hashlib
 import importlib
 import importlib.util
 import json
+import threading
 import types
 
-from typing import Optional, Union, Any, Set, List, Dict, MutableMapping, Tuple, Callable
+from typing import Optional, Union, Any, Set, List, Dict, MutableMapping, Tuple, Callable, Iterable
+from collections import OrderedDict
 from numbers import Number
 from os.path import splitext, join
 from random import choice
@@ -48,6 +51,15 @@ _LANG_TO_LC_CACHE: Dict[str, Dict[str, str]] = {}
 
 _FASTTEXT_MODEL: Optional["fasttext.FastText._FastText"] = None  # type: ignore
 """fasttext model to predict language of a search term"""
+_FASTTEXT_LOCK = threading.Lock()
+
+# fastText splits the words at these characters
+_FASTTEXT_WHITESPACE_RE = re.compile(r'[\t\n\v\f\r\0]')
+
+LANGUAGE_CACHE_SIZE = 8192
+"""Maximum number of predictions held by :py:obj:`detect_languages`."""
+_LANGUAGE_CACHE: OrderedDict[Tuple[bytes, float], Optional[str]] = OrderedDict()
+_LANGUAGE_CACHE_LOCK = threading.Lock()
 
 SEARCH_LANGUAGE_CODES = frozenset([searxng_locale[0].split('-')[0] for searxng_locale in sxng_locales])
 """Languages supported by most searxng engines (:py:obj:`searx.sxng_locales.sxng_locales`)."""
@@ -621,13 +633,17 @@ def eval_xpath_getindex(elements: ElementBase, xpath_spec: XPathSpecType, index:
 
 
 def _get_fasttext_model() -> "fasttext.FastText._FastText":  # type: ignore
+    # The model is loaded once per process, concurrent callers wait for the
+    # first one.
     global _FASTTEXT_MODEL  # pylint: disable=global-statement
     if _FASTTEXT_MODEL is None:
-        import fasttext  # pylint: disable=import-outside-toplevel
+        with _FASTTEXT_LOCK:
+            if _FASTTEXT_MODEL is None:
+                import fasttext  # pylint: disable=import-outside-toplevel
 
-        # Monkey patch: prevent fasttext from showing a (useless) warning when loading a model.
-        fasttext.FastText.eprint = lambda x: None
-        _FASTTEXT_MODEL = fasttext.load_model(str(data_dir / 'lid.176.ftz'))
+                # Monkey patch: prevent fasttext from showing a (useless) warning when loading a model.
+                fasttext.FastText.eprint = lambda x: None
+                _FASTTEXT_MODEL = fasttext.load_model(str(data_dir / 'lid.176.ftz'))
     return _FASTTEXT_MODEL
 
 
@@ -753,15 +769,82 @@ def detect_language(text: str, threshold: float = 0.3, only_search_languages: bo
     .. _`FastText.zip: Compressing text classification models`: https://arxiv.org/abs/1612.03651
 
     """
-    if not isinstance(text, str):
-        raise ValueError('text must a str')
-    r = _get_fasttext_model().predict(text.replace('\n', ' '), k=1, threshold=threshold)
-    if isinstance(r, tuple) and len(r) == 2 and len(r[0]) > 0 and len(r[1]) > 0:
-        language = r[0][0].split('__label__')[1]
+    return detect_languages([text], threshold=threshold, only_search_languages=only_search_languages)[0]
+
+
+def _predict_languages(texts: List[str], threshold: float) -> List[Optional[str]]:
+    model = _get_fasttext_model()
+    # the batch API of the (C++) model is not part of the public API of
+    # fasttext-predict, if it is missing the texts are predicted one by one
+    multiline_predict = getattr(getattr(model, 'f', None), 'multilinePredict', None)
+    if multiline_predict is not None:
+        # returns the labels only, the threshold is applied by the model
+        labels = multiline_predict([text + '\n' for text in texts], 1, threshold, 'strict')
+        return [label[0].split('__label__')[1] if label else None for label in labels]
+
+    languages: List[Optional[str]] = []
+    for text in texts:
+        r = model.predict(text, k=1, threshold=threshold)
+        if isinstance(r, tuple) and len(r) == 2 and len(r[0]) > 0 and len(r[1]) > 0:
+            languages.append(r[0][0].split('__label__')[1])
+        else:
+            languages.append(None)
+    return languages
+
+
+def detect_languages(
+    texts: Iterable[str], threshold: float = 0.3, only_search_languages: bool = False
+) -> List[Optional[str]]:
+    """Detect the language of each string in ``texts``, the result at position
+    ``i`` is the language of ``texts[i]`` (see :py:obj:`detect_language` for the
+    arguments and the returned language codes).
+
+    :raises ValueError: If a member of ``texts`` is not a string.
+
+    The texts that are not in the cache are predicted by one call of the model.
+    The predictions are cached (:py:obj:`LANGUAGE_CACHE_SIZE`), the key is the
+    hash of the text with normalized whitespace (fastText splits the words at
+    the whitespace, the prediction does not depend on it) and the threshold.
+    fastText predicts the texts of a batch one by one, the batch saves the
+    predictions of the cached texts.
+    """
+    keys: List[Tuple[bytes, float]] = []
+    missing: Dict[Tuple[bytes, float], str] = {}
+    languages: Dict[Tuple[bytes, float], Optional[str]] = {}
+
+    for text in texts:
+        if not isinstance(text, str):
+            raise ValueError('text must a str')
+        text = _FASTTEXT_WHITESPACE_RE.sub(' ', text).strip(' ')
+        key = (hashlib.blake2b(text.encode(), digest_size=16).digest(), threshold)
+        keys.append(key)
+        missing[key] = text
+
+    with _LANGUAGE_CACHE_LOCK:
+        for key in list(missing):
+            language = _LANGUAGE_CACHE.get(key, _NOTSET)
+            if language is not _NOTSET:
+                _LANGUAGE_CACHE.move_to_end(key)
+                languages[key] = language
+                del missing[key]
+
+    if missing:
+        predicted = _predict_languages(list(missing.values()), threshold)
+        with _LANGUAGE_CACHE_LOCK:
+            for key, language in zip(missing, predicted):
+                languages[key] = language
+                _LANGUAGE_CACHE[key] = language
+                _LANGUAGE_CACHE.move_to_end(key)
+            while len(_LANGUAGE_CACHE) > LANGUAGE_CACHE_SIZE:
+                _LANGUAGE_CACHE.popitem(last=False)
+
+    result = []
+    for key in keys:
+        language = languages[key]
         if only_search_languages and language not in SEARCH_LANGUAGE_CODES:
-            return None
-        return language
-    return None
+            language = None
+        result.append(language)
+    return result
 
 
 def js_variable_to_python(js_variable):
@@ -47,8 +47,12 @@ def get_WEATHER_DATA_CACHE():
         WEATHER_DATA_CACHE = ExpireCache.build_cache(
             ExpireCacheCfg(
                 name="WEATHER_DATA_CACHE",
+                BACKEND="auto",
                 MAX_VALUE_LEN=1024 * 200,  # max. 200kB per icon (icons have most often 10-20kB)
                 MAXHOLD_TIME=60 * 60 * 24 * 7 * 4,  # 4 weeks
+                L1_MAX_ITEMS=256,
+                L1_MAX_BYTES=1024 * 1024 * 4,  # 4MB
+                L1_TTL=60 * 10,
             )
         )
     return WEATHER_DATA_CACHE
@@ -7,9 +7,10 @@ Coordinates`_
 """
 from __future__ import annotations
 
-__all__ = ["convert_from_si", "convert_to_si", "symbol_to_si"]
+__all__ = ["convert_from_si", "convert_to_si", "symbol_to_si", "units_by_symbol", "find_conversion"]
 
 import collections
+import threading
 
 from searx import data
 from searx.engines import wikidata
@@ -116,6 +117,14 @@ ALIAS_SYMBOLS = {
 SYMBOL_TO_SI = []
 UNITS_BY_SI_NAME: dict = {}
 
+UNITS_BY_SYMBOL: dict[str, dict[str, tuple]] = {}
+"""Index of the :py:obj:`list of unit converters<symbol_to_si>` by (alias)
+symbol.  The value is a ``dict`` of the units by their SI name, for a SI name
+the last unit in the list wins.  The SI names are in the order of their last
+unit in the list (see :py:obj:`find_conversion`)."""
+
+_INDEX_LOCK = threading.Lock()
+
 
 def convert_from_si(si_name: str, symbol: str, value: float | int) -> float:
     from_si = units_by_si_name(si_name)[symbol][pos_from_si]
@@ -136,24 +145,34 @@ def convert_to_si(si_name: str, symbol: str, value: float | int) -> float:
 
 
 def units_by_si_name(si_name):
+    symbol_to_si()
+    return UNITS_BY_SI_NAME[si_name]
 
-    global UNITS_BY_SI_NAME  # pylint: disable=global-statement,global-variable-not-assigned
-    if UNITS_BY_SI_NAME:
-        return UNITS_BY_SI_NAME[si_name]
 
-    # build the catalog ..
-    for item in symbol_to_si():
+def units_by_symbol(symbol: str) -> dict[str, tuple]:
+    """Returns the units of the (alias) ``symbol`` by their SI name (see
+    :py:obj:`UNITS_BY_SYMBOL`), an empty ``dict`` if the symbol is unknown."""
+    symbol_to_si()
+    return UNITS_BY_SYMBOL.get(symbol, {})
 
-        item_si_name = item[pos_si_name]
-        item_symbol = item[pos_symbol]
 
-        by_symbol = UNITS_BY_SI_NAME.get(item_si_name)
-        if by_symbol is None:
-            by_symbol = {}
-            UNITS_BY_SI_NAME[item_si_name] = by_symbol
-        by_symbol[item_symbol] = item
+def find_conversion(source_symbol: str, target_symbol: str) -> tuple[tuple, tuple] | None:
+    """Returns the units ``(source, target)`` of the symbols which can be
+    converted into each other (same SI name) or ``None``.
 
-    return UNITS_BY_SI_NAME[si_name]
+    Symbols are not unique, if there are several units for a symbol, the last
+    source unit in the :py:obj:`list of unit converters<symbol_to_si>` which
+    shares its SI name with a target unit is chosen and the last target unit of
+    this SI name."""
+    sources = units_by_symbol(source_symbol)
+    if not sources:
+        return None
+    targets = units_by_symbol(target_symbol)
+    for si_name in reversed(sources):
+        target = targets.get(si_name)
+        if target is not None:
+            return sources[si_name], target
+    return None
 
 
 pos_symbol = 0  # (alias) symbol
@@ -186,19 +205,32 @@ def symbol_to_si():
     symbols from the :py:obj:`ADDITIONAL_UNITS` and the lowest weighting is
     given to the symbols resulting from the aliases :py:obj:`ALIAS_SYMBOLS`.
 
+    The list is built once, together with its indexes :py:obj:`UNITS_BY_SYMBOL`
+    and ``UNITS_BY_SI_NAME``.
     """
 
-    global SYMBOL_TO_SI  # pylint: disable=global-statement
+    global SYMBOL_TO_SI, UNITS_BY_SI_NAME, UNITS_BY_SYMBOL  # pylint: disable=global-statement
     if SYMBOL_TO_SI:
         return SYMBOL_TO_SI
 
+    with _INDEX_LOCK:
+        if not SYMBOL_TO_SI:
+            units = _build_symbol_to_si()
+            UNITS_BY_SI_NAME, UNITS_BY_SYMBOL = _build_index(units)
+            SYMBOL_TO_SI = units
+    return SYMBOL_TO_SI
+
+
+def _build_symbol_to_si() -> list[tuple]:
+    units = []
+
     # filter out units which can't be normalized to a SI unit and filter out
     # units without a symbol / arcsecond does not have a symbol
     # https://www.wikidata.org/wiki/Q829073
 
     for item in data.WIKIDATA_UNITS.values():
         if item['to_si_factor'] and item['symbol']:
-            SYMBOL_TO_SI.append(
+            units.append(
                 (
                     item['symbol'],
                     item['si_name'],
@@ -209,7 +241,7 @@ def symbol_to_si():
             )
 
     for item in ADDITIONAL_UNITS:
-        SYMBOL_TO_SI.append(
+        units.append(
             (
                 item['symbol'],
                 item['si_name'],
@@ -220,7 +252,7 @@ def symbol_to_si():
         )
 
     alias_items = []
-    for item in SYMBOL_TO_SI:
+    for item in units:
         for alias in ALIAS_SYMBOLS.get(item[0], ()):
             alias_items.append(
                 (
@@ -231,8 +263,23 @@ def symbol_to_si():
                     item[0],  # origin unit
                 )
             )
-    SYMBOL_TO_SI = SYMBOL_TO_SI + alias_items
-    return SYMBOL_TO_SI
+    return units + alias_items
+
+
+def _build_index(units: list[tuple]) -> tuple[dict, dict]:
+    units_by_si_name: dict[str, dict[str, tuple]] = {}
+    units_by_symbol: dict[str, dict[str, tuple]] = {}
+
+    for item in units:
+        units_by_si_name.setdefault(item[pos_si_name], {})[item[pos_symbol]] = item
+
+        by_si_name = units_by_symbol.setdefault(item[0], {})
+        # move the SI name to the end, the SI names are in the order of their
+        # last unit
+        by_si_name.pop(item[pos_si_name], None)
+        by_si_name[item[pos_si_name]] = item
+
+    return units_by_si_name, units_by_symbol
 
 
 # the response contains duplicate ?item with the different ?symbol
@@ -3,7 +3,8 @@
 """This script saves `Ahmia's blacklist`_ for onion sites.
 
 Output file: :origin:`searx/data/ahmia_blacklist.txt` (:origin:`CI Update data
-...  <.github/workflows/data-update.yml>`).
+...  <.github/workflows/data-update.yml>`) and the index
+:origin:`searx/data/ahmia_blacklist.idx`.
 
 .. _Ahmia's blacklist: https://ahmia.fi/blacklist/
 
@@ -12,6 +13,7 @@ Output file: :origin:`searx/data/ahmia_blacklist.txt` (:origin:`CI Update data
 
 import requests
 from searx.data import data_dir
+from searx.data.ahmia_blacklist import AhmiaBlacklistDB
 
 DATA_FILE = data_dir / 'ahmia_blacklist.txt'
 URL = 'https://ahmia.fi/blacklist/banned/'
@@ -30,3 +32,4 @@ if __name__ == '__main__':
     blacklist.sort()
     with DATA_FILE.open("w", encoding='utf-8') as f:
         f.write('\n'.join(blacklist))
+    AhmiaBlacklistDB.write_index()
@@ -2,7 +2,8 @@
 # SPDX-License-Identifier: AGPL-3.0-or-later
 """Fetch currencies from :origin:`searx/engines/wikidata.py` engine.
 
-Output file: :origin:`searx/data/currencies.json` (:origin:`CI Update data ...
+Output files: :origin:`searx/data/currencies.json` and the compiled index
+:origin:`searx/data/currencies.msgpack` (:origin:`CI Update data ...
 <.github/workflows/data-update.yml>`).
 
 """
@@ -147,8 +148,9 @@ def main():
         if len(db['names'][name]) == 1:
             db['names'][name] = db['names'][name][0]
 
-    with CurrenciesDB.json_file.open('w', encoding='utf8') as f:
+    with CurrenciesDB.source_file.open('w', encoding='utf8') as f:
         json.dump(db, f, indent=4, sort_keys=True, ensure_ascii=False)
+    CurrenciesDB.write_index()
 
 
 if __name__ == '__main__':
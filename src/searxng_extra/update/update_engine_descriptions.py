@@ -22,7 +22,7 @@ from searx import searx_dir
 from searx.utils import gen_useragent, detect_language
 import searx.search
 import searx.network
-from searx.data import data_dir
+from searx.data import data_dir, artifacts
 
 DATA_FILE = data_dir / 'engine_descriptions.json'
 
@@ -365,6 +365,7 @@ def main():
     output = get_output()
     with DATA_FILE.open('w', encoding='utf8') as f:
         f.write(json.dumps(output, indent=1, separators=(',', ':'), sort_keys=True, ensure_ascii=False))
+    artifacts.compile_json(DATA_FILE)
 
 
 if __name__ == "__main__":
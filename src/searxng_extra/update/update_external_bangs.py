@@ -9,8 +9,8 @@ from :py:obj:`BANGS_URL`.
 
 import json
 
-from searx.external_bang import LEAF_KEY
 from searx.data import data_dir
+from searx.data.external_bangs import LEAF_KEY, ExternalBangsDB
 from searx.network import get as http_get
 
 DATA_FILE = data_dir / 'external_bangs.json'
@@ -34,6 +34,7 @@ def main():
     }
     with DATA_FILE.open('w', encoding="utf8") as f:
         json.dump(output, f, indent=4, sort_keys=True, ensure_ascii=False)
+    ExternalBangsDB.write_index()
 
 
 def merge_when_no_leaf(node):
@@ -49,7 +49,7 @@ from searx.network import set_timeout_for_thread
 from searx.engines import wikidata, set_loggers
 from searx.sxng_locales import sxng_locales
 from searx.engines.openstreetmap import get_key_rank, VALUE_TO_LINK
-from searx.data import data_dir
+from searx.data import data_dir, artifacts
 
 DATA_FILE = data_dir / 'osm_keys_tags.json'
 
@@ -212,3 +212,4 @@ if __name__ == '__main__':
     }
     with DATA_FILE.open('w', encoding="utf8") as f:
         json.dump(result, f, indent=4, sort_keys=True, ensure_ascii=False)
+    artifacts.compile_json(DATA_FILE)
@@ -0,0 +1,12 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# pylint: disable=missing-module-docstring
+
+import pytest
+
+import searx.metrics
+
+
+@pytest.fixture(autouse=True, scope="session")
+def metrics():
+    """The result container counts the results (:py:obj:`searx.metrics`)."""
+    searx.metrics.initialize([], enabled=False)
@@ -0,0 +1,48 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+"""Tests of the static index of Ahmia's blacklist (:py:obj:`AhmiaBlacklistDB`)."""
+
+import hashlib
+
+import pytest
+
+from searx.data.ahmia_blacklist import AhmiaBlacklistDB
+
+BLACKLIST = [hashlib.md5(f"blacklisted{i}.onion".encode()).hexdigest() for i in range(200)]
+OTHERS = [hashlib.md5(f"other{i}.onion".encode()).hexdigest() for i in range(1000)]
+
+
+@pytest.fixture(name="db", params=[AhmiaBlacklistDB.BLOOM_BITS_PER_ENTRY, 0], ids=["bloom", "no bloom"])
+def _db(request, tmp_path, monkeypatch):
+    compile_index = AhmiaBlacklistDB.compile_index
+    monkeypatch.setattr(AhmiaBlacklistDB, "source_file", tmp_path / "ahmia_blacklist.txt")
+    monkeypatch.setattr(AhmiaBlacklistDB, "index_file", tmp_path / "ahmia_blacklist.idx")
+    monkeypatch.setattr(
+        AhmiaBlacklistDB, "compile_index", classmethod(lambda cls, source: compile_index(source, request.param))
+    )
+    # upper case and duplicates in the text file
+    AhmiaBlacklistDB.source_file.write_text("\n".join(BLACKLIST + [BLACKLIST[0].upper()]) + "\n")
+    AhmiaBlacklistDB.write_index()
+    return AhmiaBlacklistDB()
+
+
+def test_hex_members(db):
+    assert all(md5_hex in db for md5_hex in BLACKLIST)
+    assert BLACKLIST[1].upper() in db
+    assert not any(md5_hex in db for md5_hex in OTHERS)
+
+
+def test_digest_members(db):
+    assert all(bytes.fromhex(md5_hex) in db for md5_hex in BLACKLIST)
+    assert not any(bytes.fromhex(md5_hex) in db for md5_hex in OTHERS)
+
+
+@pytest.mark.parametrize("value", ["", "not hex", BLACKLIST[0][:-2], BLACKLIST[0] + "00", b"", None, 42])
+def test_no_md5_value(db, value):
+    assert value not in db
+
+
+def test_set(db):
+    assert len(db) == len(BLACKLIST)
+    assert list(db) == sorted(BLACKLIST)
+    assert db == set(BLACKLIST)
+
@@ -0,0 +1,36 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+"""Tests of the autocompleter of the currency names
+(:py:obj:`searx.autocomplete.currencies`)."""
+
+import pytest
+
+from searx import autocomplete
+
+
+@pytest.mark.parametrize(
+    "query, completion",
+    [
+        ("10 us dol", "10 us dollar"),
+        ("10 usd in eur", "10 usd in euro"),
+        ("1.5 chf to swiss fr", "1.5 chf to swiss franc"),
+    ],
+)
+def test_currencies(query, completion):
+    assert completion in autocomplete.currencies(query)
+
+
+@pytest.mark.parametrize("query", ["hello world", "10 e", "usd in eur"])
+def test_currencies_no_conversion(query):
+    assert not autocomplete.currencies(query)
+
+
+def test_search_autocomplete_without_backend():
+    assert autocomplete.search_autocomplete("", "10 usd in eur", "en")[0].startswith("10 usd in eur")
+    assert not autocomplete.search_autocomplete("", "hello world", "en")
+
+
+def test_search_autocomplete_with_backend(monkeypatch):
+    monkeypatch.setitem(autocomplete.backends, "dummy", lambda query, sxng_locale: [query + " rate"])
+    results = autocomplete.search_autocomplete("dummy", "10 usd in euro", "en")
+    assert results[0] == "10 usd in euro"
+    assert results[-1] == "10 usd in euro rate"
@@ -0,0 +1,175 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+"""Tests of the in-process L1 in front of an :py:obj:`ExpireCacheSQLite`, of
+the :py:obj:`ExpireCacheValkey` and of the :py:obj:`WriteBehindQueue`."""
+
+import time
+
+from searx import valkeydb
+from searx.cache import ExpireCache, ExpireCacheCfg, ExpireCacheL1, ExpireCacheValkey, WriteBehindQueue
+
+
+def _cache(tmp_path, **kwargs) -> ExpireCacheL1:
+    cfg = ExpireCacheCfg(
+        name="test", db_url=str(tmp_path / "cache.db"), L1_MAX_ITEMS=100, password=b"secret", **kwargs
+    )
+    cache = ExpireCache.build_cache(cfg)
+    assert isinstance(cache, ExpireCacheL1)
+    return cache
+
+
+def test_l1_values_are_independent(tmp_path):
+    cache = _cache(tmp_path)
+    value = {"a": [1, 2]}
+    assert cache.set("key", value, expire=60)
+
+    value["a"].append(3)  # changed by the caller after set()
+    first = cache.get("key")
+    assert first == {"a": [1, 2]}
+
+    first["a"].append(4)  # changed by the caller after get()
+    assert cache.get("key") == {"a": [1, 2]}
+
+
+def test_l1_returns_l2_values(tmp_path):
+    cache = _cache(tmp_path)
+    cache.set("key", ("a", "b"), expire=60)
+    from_l1 = cache.get("key")
+    cache.clear()
+    from_l2 = cache.get("key")
+    assert from_l1 == from_l2 == ["a", "b"]
+    assert cache.metrics.l1_hits == 1 and cache.metrics.l1_misses == 1
+    assert cache.get("unset", default="x") == "x"
+    assert cache.get("unset", default="y") == "y"
+    assert cache.metrics.l1_negative_hits == 1
+
+
+
+class _Clock:
+    """Replaces :py:obj:`time.time`, the time goes on by :py:obj:`_Clock.sleep`."""
+
+    def __init__(self, monkeypatch):
+        self.now = time.time()
+        monkeypatch.setattr(time, "time", lambda: self.now)
+
+    def sleep(self, seconds: float):
+        self.now += seconds
+
+
+def test_l1_miss_after_expire(tmp_path, monkeypatch):
+    cache = _cache(tmp_path, MAINTENANCE_MODE="off", L1_TTL=60)
+    clock = _Clock(monkeypatch)
+    cache.set("key", "value", expire=10)
+    assert cache.get("key") == "value"
+    clock.sleep(11)
+    # the L1 does not hold a value longer than its expire time
+    assert cache.get("key", default="miss") == "miss"
+    assert cache.l2.get("key", default="miss") == "miss"
+
+
+def test_l1_ttl(tmp_path, monkeypatch):
+    cache = _cache(tmp_path, MAINTENANCE_MODE="off", L1_TTL=5)
+    clock = _Clock(monkeypatch)
+    cache.set("key", "value", expire=60)
+    cache.l2.set("key", "new value", expire=60)  # e.g. set by another process
+    assert cache.get("key") == "value"
+    clock.sleep(6)
+    assert cache.get("key") == "new value"
+
+
+def test_l1_miss_after_delete(tmp_path, monkeypatch):
+    cache = _cache(tmp_path, MAINTENANCE_MODE="off")
+    clock = _Clock(monkeypatch)
+    cache.set("key", "value", expire=10)
+    cache.set("other", "value", expire=60)
+    clock.sleep(11)
+    # the maintenance deletes the expired values in the L1 and in the L2
+    assert cache.maintenance(force=True)
+    assert list(cache._data) == [("test", "other")]  # pylint: disable=protected-access
+    assert cache.get("key") is None
+
+    assert cache.get("other") == "value"
+    assert cache.maintenance(force=True, truncate=True)
+    assert not cache._data  # pylint: disable=protected-access
+    assert cache.get("other") is None
+
+
+def test_l1_miss_after_failed_set(tmp_path, monkeypatch):
+    cache = _cache(tmp_path, MAINTENANCE_MODE="off")
+    cache.set("key", "value", expire=60)
+    assert cache.get("key") == "value"
+    monkeypatch.setattr(cache.l2, "set_encoded", lambda *args, **kwargs: False)
+    assert cache.set("key", "new value", expire=60) is False
+    # the old value is dropped from the L1 and read from the L2 again
+    assert cache.get("key") == "value" and cache.metrics.l1_misses == 1
+
+    cache.set_many([("key", "bulk value")])
+    assert cache.get("key") == "bulk value"
+
+
+class _UnavailableValkey:
+    """Valkey client of a DB that does not answer."""
+
+    def __getattr__(self, name):
+        def command(*args, **kwargs):
+            raise valkeydb.valkey.exceptions.TimeoutError("Timeout reading from socket")
+
+        return command
+
+
+def test_valkey_errors_are_cache_misses(monkeypatch):
+    monkeypatch.setattr(valkeydb, "client", _UnavailableValkey)
+    cache = ExpireCacheValkey(ExpireCacheCfg(name="test", password=b"secret"))
+
+    assert cache.set("key", "value", expire=60) is False
+    assert cache.get("key", default="miss") == "miss"
+    assert cache.set_many([("a", 1), ("b", 2)]) == 0
+    assert cache.get_many(["a", "b"]) == [None, None]
+
+
+def test_valkey_not_configured(monkeypatch):
+    monkeypatch.setattr(valkeydb, "client", lambda: None)
+    monkeypatch.setattr(valkeydb, "initialize", lambda: False)
+    cache = ExpireCacheValkey(ExpireCacheCfg(name="test", password=b"secret"))
+
+    assert cache.set("key", "value", expire=60) is False
+    assert cache.get("key") is None
+
+
+def test_write_behind_requeues_failed_batch(monkeypatch):
+    # no background thread, the queue is flushed by the test
+    monkeypatch.setattr(WriteBehindQueue, "_start", lambda self: None)
+    batches: list[dict] = []
+
+    def write(pending: dict):
+        if not batches:
+            batches.append({})
+            raise OSError("disk full")
+        batches.append(dict(pending))
+
+    queue = WriteBehindQueue("test", write, interval=60, max_pending=3)
+    queue.put("a", 1)
+    queue.put("b", 2)
+    queue.flush()  # fails, the values are queued again
+    assert queue.get("a") == 1 and len(queue) == 2
+
+    queue.put("b", 22)  # the newer value is not replaced by the failed one
+    queue.flush()
+    assert batches[-1] == {"a": 1, "b": 22}
+    assert len(queue) == 0
+
+
+def test_write_behind_requeue_is_limited(monkeypatch):
+    monkeypatch.setattr(WriteBehindQueue, "_start", lambda self: None)
+    def write(pending: dict):
+        raise OSError("disk full")
+
+    queue = WriteBehindQueue("test", write, interval=60, max_bytes=10, sizeof=len)
+    for key in "abc":
+        queue.put(key, "x" * 4)
+    queue.flush()
+    # the values up to the byte limit are kept, the others are dropped
+    assert len(queue) == 3
+    queue.put("d", "x" * 4)
+    queue.flush()
+    assert len(queue) == 3
+    assert queue.get("d") is None
@@ -0,0 +1,91 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+"""Tests of the precompiled data files (:py:obj:`searx.data`)."""
+
+import json
+
+from searx.data import artifacts
+from searx.data.ahmia_blacklist import AhmiaBlacklistDB
+from searx.data.currencies import CurrenciesDB
+from searx.data.external_bangs import LEAF_KEY, ExternalBangsDB
+
+
+def test_data_files_are_current():
+    # the build time check of the compiled files (python -m searx.data.artifacts check)
+    assert not artifacts.outdated_files()
+
+
+def test_outdated_artifact_is_not_loaded(tmp_path):
+    json_file = tmp_path / "data.json"
+    json_file.write_text(json.dumps({"a": 1}))
+    artifacts.compile_json(json_file)
+    assert dict(artifacts.load_current(json_file)) == {"a": 1}
+
+    json_file.write_text(json.dumps({"a": 22}))
+    assert artifacts.load_current(json_file) is None
+
+
+def test_same_size_change_is_found_by_verify(tmp_path):
+    json_file = tmp_path / "data.json"
+    json_file.write_text(json.dumps({"a": 1}))
+    artifacts.compile_json(json_file)
+    json_file.write_text(json.dumps({"a": 2}))
+
+    path = artifacts.artifact_file(json_file)
+    # on load only the size is compared
+    assert artifacts.is_current(path, json_file, artifacts.MAGIC)
+    assert not artifacts.is_current(path, json_file, artifacts.MAGIC, verify=True)
+
+
+def test_outdated_bangs_index_is_rebuilt(tmp_path, monkeypatch):
+    monkeypatch.setattr(ExternalBangsDB, "source_file", tmp_path / "external_bangs.json")
+    monkeypatch.setattr(ExternalBangsDB, "index_file", tmp_path / "external_bangs.idx")
+
+    def write_bangs(url: str):
+        trie = {"e": {"x": {LEAF_KEY: url + chr(1) + "1"}}}
+        ExternalBangsDB.source_file.write_text(json.dumps({"version": 0, "trie": trie}))
+
+    write_bangs("https://old.example.org")
+    ExternalBangsDB.write_index()
+    write_bangs("https://newer.example.org")
+
+    db = ExternalBangsDB()
+    assert db.get("ex") == "https://newer.example.org" + chr(1) + "1"
+
+
+def test_outdated_ahmia_index_is_rebuilt(tmp_path, monkeypatch):
+    monkeypatch.setattr(AhmiaBlacklistDB, "source_file", tmp_path / "ahmia_blacklist.txt")
+    monkeypatch.setattr(AhmiaBlacklistDB, "index_file", tmp_path / "ahmia_blacklist.idx")
+
+    old, new = "0" * 32, "f" * 32
+    AhmiaBlacklistDB.source_file.write_text(old)
+    AhmiaBlacklistDB.write_index()
+    AhmiaBlacklistDB.source_file.write_text(f"{new}\n{'e' * 32}")
+
+    db = AhmiaBlacklistDB()
+    assert new in db
+    assert old not in db
+
+
+def test_outdated_currencies_index_is_rebuilt(tmp_path, monkeypatch):
+    monkeypatch.setattr(CurrenciesDB, "source_file", tmp_path / "currencies.json")
+    monkeypatch.setattr(CurrenciesDB, "index_file", tmp_path / "currencies.msgpack")
+
+    def write_currencies(names: dict):
+        CurrenciesDB.source_file.write_text(json.dumps({"names": names, "iso4217": {"EUR": {"en": "Euro"}}}))
+
+    write_currencies({"euro": "EUR"})
+    CurrenciesDB.write_index()
+    write_currencies({"euro": "EUR", "us dollar": ["USN", "USD"]})
+
+    db = CurrenciesDB()
+    assert db.name_to_iso4217("us dollar") == "USD"
+    assert db.iso4217_to_name("EUR", "en") == "Euro"
+
+
+def test_currencies_complete():
+    db = CurrenciesDB()
+    completions = db.complete("us dollar", limit=3)
+    assert completions[0] == ("us dollar", "USD")
+    assert len(completions) == 3
+    assert all(name.startswith("us dollar") for name, _ in completions)
+    assert db.complete("no such currency") == []
@@ -0,0 +1,54 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+"""Tests of the static index of the external bangs: :py:obj:`ExternalBangsDB`
+gives the same definitions and completions as the trie in the JSON file."""
+
+import json
+
+import pytest
+
+from searx import external_bang
+from searx.data.external_bangs import LEAF_KEY, ExternalBangsDB, _Names
+
+# a (compressed) trie as in the JSON file: multi-letter keys and plain string
+# leaves for the bangs which are not a prefix of another bang
+TRIE = {
+    "e": {
+        LEAF_KEY: "https://e.example.org/?q=\x02\x015",
+        "x": {
+            LEAF_KEY: "https://example.org/?q=\x02\x0110",
+            "am": "//exam.example.org/\x02\x01",
+            "pl": {LEAF_KEY: "https://explain.example.org/\x02\x0110", "ain": "https://plain.example.org/\x01100"},
+        },
+    },
+    "wiki": {"de": "https://de.wikipedia.org/?q=\x02\x0150", "en": "https://en.wikipedia.org/?q=\x02\x0150"},
+    "wü": "https://wü.example.org/\x02\x011",
+}
+
+
+def _db(tmp_path, monkeypatch, trie) -> ExternalBangsDB:
+    monkeypatch.setattr(ExternalBangsDB, "source_file", tmp_path / "external_bangs.json")
+    monkeypatch.setattr(ExternalBangsDB, "index_file", tmp_path / "external_bangs.idx")
+    ExternalBangsDB.source_file.write_text(json.dumps({"version": 0, "trie": trie}))
+    ExternalBangsDB.write_index()
+    return ExternalBangsDB()
+
+
+@pytest.mark.parametrize(
+    "bang", ["e", "ex", "exa", "exam", "expl", "explain", "explains", "w", "wiki", "wikide", "wü", "x", "", "ü"]
+)
+def test_index_equals_trie(tmp_path, monkeypatch, bang):
+    db = _db(tmp_path, monkeypatch, TRIE)
+    definition, completions = external_bang.get_bang_definition_and_autocomplete(bang, {"trie": TRIE})
+    assert db.get(bang) == definition
+    assert db.complete(bang) == completions
+
+
+def test_index_equals_trie_of_data_file(monkeypatch):
+    # the matches of a prefix are in more than one block of the sampled names
+    monkeypatch.setattr(_Names, "SAMPLE_STEP", 4)
+    db = ExternalBangsDB()
+    trie = json.loads(db.source_file.read_bytes())["trie"]
+    for bang in ["g", "gh", "ddg", "wiki", "wikipedia", "yt", "amazon", "xkcd", "zzzzzz", "ö"]:
+        definition, completions = external_bang.get_bang_definition_and_autocomplete(bang, {"trie": trie})
+        assert db.get(bang) == definition, bang
+        assert db.complete(bang) == completions, bang
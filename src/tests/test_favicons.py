@@ -0,0 +1,52 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+"""Tests of the in-memory favicon cache (:py:obj:`FaviconCacheMEM`), also as
+L1 in front of the :py:obj:`FaviconCacheSQLite`."""
+
+import time
+
+from searx.favicons.cache import FaviconCacheConfig, FaviconCacheMEM, FaviconCacheSQLite
+
+ICON = b"<svg/>"
+
+
+def _later(monkeypatch, seconds: float):
+    now = time.time()
+    monkeypatch.setattr(time, "time", lambda: now + seconds)
+
+
+def test_mem_entry_expires_after_hold_time(monkeypatch):
+    cache = FaviconCacheMEM(FaviconCacheConfig(db_type="mem", HOLD_TIME=60))
+    assert cache.set("resolver", "example.org", "image/svg+xml", ICON)
+    assert cache("resolver", "example.org") == (ICON, "image/svg+xml")
+
+    _later(monkeypatch, 61)
+    assert cache("resolver", "example.org") is None
+    assert cache.state().favicons == 0
+
+
+def test_mem_maintenance_drops_expired_entries(monkeypatch):
+    cache = FaviconCacheMEM(FaviconCacheConfig(db_type="mem", HOLD_TIME=60))
+    cache.set("resolver", "a.example.org", "image/svg+xml", ICON)
+    cache.set("resolver", "b.example.org", None, None)
+
+    _later(monkeypatch, 61)
+    cache.maintenance()
+    stats = cache.state()
+    assert stats.favicons == 0 and stats.domains == 0
+
+
+def test_l1_entry_expires_after_maintenance_period(tmp_path, monkeypatch):
+    cfg = FaviconCacheConfig(db_url=str(tmp_path / "favicons.db"), HOLD_TIME=3600, MAINTENANCE_PERIOD=60)
+    l2 = FaviconCacheSQLite(cfg)
+    cache = FaviconCacheMEM(cfg, l2=l2)
+    cache.set("resolver", "example.org", "image/svg+xml", ICON)
+
+    # deleted from the L2 (e.g. by its maintenance), the L1 still holds it ..
+    with l2.connect() as conn:
+        conn.execute("DELETE FROM blob_map")
+    conn.close()
+    assert cache("resolver", "example.org") == (ICON, "image/svg+xml")
+
+    # .. until the maintenance period has passed
+    _later(monkeypatch, 61)
+    assert cache("resolver", "example.org") is None
@@ -0,0 +1,89 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+"""Tests of the language detection (:py:obj:`searx.utils.detect_languages`) and
+of the ``lang`` annotation of the results in :py:mod:`websearch.service`."""
+
+import collections
+import types
+
+import pytest
+
+from searx import utils
+from searx.result_types._base import MainResult
+from websearch import service
+
+EN = "The quick brown fox jumps over the lazy dog"
+FR = "Le vif renard brun saute par-dessus le chien paresseux"
+DE = "Der schnelle braune Fuchs springt über den faulen Hund"
+
+
+@pytest.fixture(name="cache")
+def _cache(monkeypatch):
+    cache: collections.OrderedDict = collections.OrderedDict()
+    monkeypatch.setattr(utils, "_LANGUAGE_CACHE", cache)
+    return cache
+
+
+def _count_predictions(monkeypatch) -> list[list[str]]:
+    batches: list[list[str]] = []
+    predict = utils._predict_languages
+
+    def counting(texts, threshold):
+        batches.append(list(texts))
+        return predict(texts, threshold)
+
+    monkeypatch.setattr(utils, "_predict_languages", counting)
+    return batches
+
+
+def test_batch_order(cache):  # pylint: disable=unused-argument
+    texts = [EN, FR, "", DE, EN]
+    assert utils.detect_languages(texts) == ["en", "fr", None, "de", "en"]
+    assert [utils.detect_language(text) for text in texts] == ["en", "fr", None, "de", "en"]
+
+
+def test_cache(cache, monkeypatch):
+    batches = _count_predictions(monkeypatch)
+    assert utils.detect_languages([EN, FR]) == ["en", "fr"]
+    # the whitespace is normalized in the key of the cache
+    assert utils.detect_languages([FR, f"  {EN}\n", DE]) == ["fr", "en", "de"]
+    assert batches == [[EN, FR], [DE]]
+    assert len(cache) == 3
+
+    # the threshold is part of the key
+    utils.detect_languages([EN], threshold=0.5)
+    assert batches[-1] == [EN]
+
+
+def test_cache_is_bounded(cache, monkeypatch):
+    monkeypatch.setattr(utils, "LANGUAGE_CACHE_SIZE", 2)
+    utils.detect_languages([EN, FR, DE])
+    assert len(cache) == 2
+
+
+@pytest.mark.parametrize("texts", [[EN, None], [b"bytes"], [EN, 42]])
+def test_non_str_input(cache, texts):  # pylint: disable=unused-argument
+    with pytest.raises(ValueError):
+        utils.detect_languages(texts)
+
+
+def test_only_search_languages(cache, monkeypatch):  # pylint: disable=unused-argument
+    monkeypatch.setattr(utils, "SEARCH_LANGUAGE_CODES", frozenset(["fr"]))
+    assert utils.detect_languages([EN, FR], only_search_languages=True) == [None, "fr"]
+
+
+def test_without_batch_api(cache, monkeypatch):  # pylint: disable=unused-argument
+    model = utils._get_fasttext_model()
+    # a model without the (private) binding of the batch API
+    monkeypatch.setattr(utils, "_get_fasttext_model", lambda: types.SimpleNamespace(predict=model.predict))
+    assert utils.detect_languages([EN, FR, "", DE]) == ["en", "fr", None, "de"]
+
+
+def test_annotate_languages(cache):  # pylint: disable=unused-argument
+    results = [
+        MainResult(url="https://example.org/en", title="fox", content=EN),
+        {"url": "https://example.org/fr", "title": FR, "content": None},
+        {"url": "https://example.org/none", "title": None},
+    ]
+    results_json = [service._project_result(r, ("url",), None) for r in results]
+    service._annotate_languages(results, results_json)
+    assert [rd["lang"] for rd in results_json] == ["en", "fr", None]
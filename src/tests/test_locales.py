@@ -0,0 +1,36 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+"""Tests of the memo caches of :py:obj:`searx.locales`."""
+
+import babel.core
+import pytest
+
+from searx import locales
+
+
+def test_parse_locale_is_memoized():
+    assert locales.parse_locale("de-CH", sep="-") is locales.parse_locale("de-CH", sep="-")
+    for _ in range(2):
+        with pytest.raises(babel.core.UnknownLocaleError):
+            locales.parse_locale("xx", sep="-")
+    assert locales.get_locale("all") is None
+
+
+def test_get_engine_locale_is_not_memoized():
+    engine_locales = {"de": "de_DE"}
+    assert locales.get_engine_locale("de-CH", engine_locales) == "de_DE"
+    engine_locales["de-CH"] = "de_CH"  # modified in place
+    assert locales.get_engine_locale("de-CH", engine_locales) == "de_CH"
+
+
+@pytest.mark.parametrize(
+    "tag, tag_list, expected",
+    [
+        ("es", ["es-AR", "es-ES", "es-MX"], "es-ES"),
+        ("de-CH", ["de", "fr"], "de"),
+        ("", ["de"], "fallback"),
+        ("xx", ["de"], "fallback"),
+    ],
+)
+def test_match_locale(tag, tag_list, expected):
+    for _ in range(2):
+        assert locales.match_locale(tag, tag_list, fallback="fallback") == expected
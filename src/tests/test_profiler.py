@@ -0,0 +1,79 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+"""Tests of the cold start profiler (:py:mod:`websearch.profiler`)."""
+
+import threading
+
+import pytest
+
+from websearch import profiler
+
+IMPORTTIME = """\
+import time: self [us] | cumulative | imported package
+import time:       120 |        120 |     _io
+import time:      2500 |       3100 | searx
+import time:       600 |        600 |   searx.data
+garbage line
+"""
+
+
+def test_parse_importtime():
+    imports = profiler._parse_importtime(IMPORTTIME)
+    assert [i["module"] for i in imports] == ["_io", "searx", "searx.data"]
+    assert [i["depth"] for i in imports] == [2, 0, 1]
+    assert imports[1]["self_ms"] == 2.5
+    assert imports[1]["cumulative_ms"] == 3.1
+
+
+class _Owner:
+    def method(self, value):
+        return value
+
+    @classmethod
+    def create(cls, value):
+        return cls, value
+
+
+def test_patch_records_calls():
+    recorder = profiler._Recorder()
+    profiler._patch(recorder, _Owner, "method", "calls")
+    profiler._patch(recorder, _Owner, "create", "init", lambda cls, value: value)
+
+    assert _Owner().method(1) == 1
+    assert _Owner.create("x") == (_Owner, "x")
+    assert list(recorder.calls["calls"]) == [f"{__name__}._Owner.method"]
+    assert list(recorder.calls["init"]) == ["x"]
+
+
+def test_recorder_wait():
+    recorder = profiler._Recorder()
+    assert not recorder.wait("init", 1, timeout=0.01)
+    threading.Timer(0.05, recorder.add, ("init", "engine", 1.0)).start()
+    assert recorder.wait("init", 1, timeout=5)
+
+
+def test_profile_process_needs_fresh_process():
+    import searx  # pylint: disable=unused-import,import-outside-toplevel
+
+    with pytest.raises(RuntimeError):
+        profiler._profile_process()
+
+
+def test_format_report():
+    profile = {
+        "python": "3.11.7",
+        "total_ms": 1234.5,
+        "phases": {"import": 1000.0, "initialize": 234.5},
+        "imports": profiler._parse_importtime(IMPORTTIME),
+        "load_engine": {"slow": 20.0, "fast": 1.0},
+        "engine_import": {},
+        "engine_init": {"slow": 5.0},
+        "engine_init_complete": False,
+        "calls": {"searx.network.initialize": {"count": 1, "total_ms": 12.0}},
+    }
+    report = profiler.format_report(profile, top=1)
+    assert report.startswith("cold start of the search core: 1234.5 ms (Python 3.11.7)")
+    assert "load_engine (2 engines, total 21.0 ms, top 1)\n  slow" in report
+    assert "  fast" not in report
+    assert "not all engines completed their init" in report
+    # top 1 by self time: searx
+    assert "imports (top 1 by self time)\n  searx " in report
@@ -0,0 +1,60 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+"""Tests of the lazy engines (:py:obj:`searx.enginelib.registry`)."""
+
+import threading
+import time
+import types
+
+from searx.enginelib.registry import LazyEngine, _analyze
+
+
+def test_analyze_none_names():
+    source = b"""
+api_key = None
+if True:
+    token = None
+else:
+    token = "abc"
+base_url = "https://example.org"
+"""
+    info = _analyze(source, "engine.py")
+    assert info.none_names == ["api_key", "token"]
+    assert info.literals["api_key"] is None
+    assert "token" not in info.literals
+
+
+def test_lazy_engine_info_checks_none_names(monkeypatch):
+    import searx.engines
+
+    info = _analyze(b"if True:\n    api_key = None\n", "engine.py")
+    monkeypatch.setattr(searx.engines, "module_info", lambda filename: info)
+    # the value of api_key is known after the import of the module
+    assert searx.engines.lazy_engine_info("dummy", {"name": "dummy"}) is None
+    assert searx.engines.lazy_engine_info("dummy", {"name": "dummy", "api_key": "x"}) is info
+
+
+def test_load_waits_for_hooks():
+    inits: list[str] = []
+    ready = threading.Event()
+
+    def loader(attrs):
+        return types.SimpleNamespace(request=lambda: "request", **attrs)
+
+    engine = LazyEngine({"name": "dummy"}, ["request"], loader)
+
+    def init():
+        ready.set()
+        time.sleep(0.2)
+        # the hook can access the module while the module is loading
+        assert engine.request() == "request"
+        inits.append("init")
+
+    engine.on_load(init)
+    first = threading.Thread(target=engine.load)
+    first.start()
+    ready.wait()
+    # a second request waits until the init of the engine is done
+    assert engine.request() == "request"
+    assert inits == ["init"]
+    assert engine.loaded
+    first.join()
@@ -0,0 +1,114 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+"""Tests of the typed results converted from legacy result dicts."""
+
+import importlib
+import pkgutil
+import re
+import types
+
+import searx.plugins
+from searx.data.tracker_patterns import TrackerPatternsDB
+from searx.plugins import Plugin, PluginCfg
+from searx.plugins import ahmia_filter, hostnames, oa_doi_rewrite, tracker_url_remover
+from searx.result_types import LegacyResult
+from searx.result_types._base import LegacyMainResult, main_result_from_legacy
+from searx.results import ResultContainer
+
+DOI_RESOLVER = "https://doi.example.org/"
+
+
+def test_main_result_from_legacy():
+    result = main_result_from_legacy({"url": "https://example.org/a", "title": "a", "engine": "e"})
+    assert isinstance(result, LegacyMainResult)
+    assert main_result_from_legacy({"url": "https://example.org/a", "infobox": "a"}) is None
+
+
+def test_oa_doi_rewrite_on_converted_result(monkeypatch):
+    monkeypatch.setattr(oa_doi_rewrite, "get_doi_resolver", lambda: DOI_RESOLVER)
+    plugin = oa_doi_rewrite.SXNGPlugin(PluginCfg(active=True))
+
+    url = "https://publisher.example.org/article/10.1234/abcd.5678/full"
+    converted = main_result_from_legacy({"url": url, "title": "paper", "engine": "e"})
+    legacy = LegacyResult({"url": url, "title": "paper", "engine": "e"})
+
+    for result in (converted, legacy):
+        result.normalize_result_fields()
+        assert plugin.on_result(None, None, result)  # type: ignore[arg-type]
+        assert result.url == DOI_RESOLVER + "10.1234/abcd.5678"
+        assert result["doi"] == "10.1234/abcd.5678"
+
+
+def _plugins_with_on_result() -> list[Plugin]:
+    plugins = []
+    for module_info in pkgutil.iter_modules(searx.plugins.__path__):
+        module = importlib.import_module(f"searx.plugins.{module_info.name}")
+        cls = getattr(module, "SXNGPlugin", None)
+        if cls is not None and cls.on_result is not Plugin.on_result:
+            plugins.append(cls(PluginCfg(active=True)))
+    return plugins
+
+
+def test_plugins_on_converted_results(monkeypatch):
+    """All plugins with an ``on_result`` hook are declared to support typed
+    results and do not fail on a converted result (they only set fields)."""
+
+    monkeypatch.setattr(oa_doi_rewrite, "get_doi_resolver", lambda: DOI_RESOLVER)
+    monkeypatch.setattr(hostnames, "REPLACE", {re.compile(r"(.*\.)?old\.example\.org$"): "new.example.org"})
+    monkeypatch.setattr(hostnames, "REMOVE", {re.compile(r"(.*\.)?spam\.example\.org$")})
+    monkeypatch.setattr(hostnames, "HIGH", {re.compile(r"(.*\.)?good\.example\.org$")})
+    monkeypatch.setattr(hostnames, "LOW", {re.compile(r"(.*\.)?bad\.example\.org$")})
+    monkeypatch.setattr(ahmia_filter, "ahmia_blacklist", set(), raising=False)
+    rules = [(r"^https?://[^/]*example\.org", [], ["utm_.*"])]
+    monkeypatch.setattr(TrackerPatternsDB, "rules", lambda self: iter(rules))
+    monkeypatch.setattr(tracker_url_remover, "TRACKER_PATTERNS", TrackerPatternsDB())
+
+    plugins = _plugins_with_on_result()
+    assert {p.id for p in plugins} >= {"ahmia_filter", "hostnames", "oa_doi_rewrite", "tracker_url_remover"}
+    assert all(p.typed_results for p in plugins)
+
+    urls = [
+        "https://old.example.org/a?utm_source=x&id=1",
+        "https://good.example.org/10.1234/abcd.5678",
+        "https://bad.example.org/b",
+        "https://spam.example.org/c",
+    ]
+    kept = []
+    for url in urls:
+        result = main_result_from_legacy({"url": url, "title": "t", "engine": "e", "thumbnail": url + ".png"})
+        assert result is not None
+        result.normalize_result_fields()
+        if all(p.on_result(None, None, result) for p in plugins):  # type: ignore[arg-type]
+            kept.append(result)
+
+    assert [(r.url, r.priority) for r in kept] == [
+        ("https://new.example.org/a?id=1", ""),
+        (DOI_RESOLVER + "10.1234/abcd.5678", "high"),
+        ("https://bad.example.org/b", "low"),
+    ]
+    assert kept[1].doi == "10.1234/abcd.5678"
+
+
+class _UntypedPlugin(Plugin):
+    id = "untyped"
+
+    def on_result(self, request, search, result):
+        result["my_key"] = "value"
+        return True
+
+
+def test_untyped_plugin_gets_legacy_results(monkeypatch):
+    storage = searx.plugins.PluginStorage()
+    plugin = _UntypedPlugin(PluginCfg(active=True))
+    storage.register(plugin)
+    search = types.SimpleNamespace(user_plugins=["untyped"])
+
+    container = ResultContainer()
+    container.typed_legacy_results = storage.typed_results(search.user_plugins)
+    container.on_result = lambda result: storage.on_result(None, search, result)  # type: ignore[arg-type]
+    container.extend("e", [{"url": "https://example.org/", "title": "t"}])
+
+    assert not container.typed_legacy_results
+    [result] = container.get_ordered_results()
+    assert isinstance(result, LegacyResult)
+    assert result["my_key"] == "value"
+    assert storage.typed_results([])
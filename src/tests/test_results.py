@@ -0,0 +1,187 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+"""Tests of the :py:obj:`searx.results.ResultContainer`."""
+
+import random
+import types
+
+import pytest
+
+import searx.engines
+import searx.metrics
+from searx.plugins import PluginCfg
+from searx.plugins import oa_doi_rewrite
+from searx.results import GROUP_MAX_DISTANCE, BordaRankFusion, ReciprocalRankFusion, ResultContainer
+
+DOI_RESOLVER = "https://doi.example.org/"
+
+
+def _lazy_container(plugins=()) -> ResultContainer:
+    """Container in the lazy mode, the ``on_result`` hooks of the plugins are
+    wired like :py:obj:`searx.search.SearchWithPlugins` does."""
+
+    container = ResultContainer()
+    container.lazy_normalization = True
+    container.on_result = lambda result: all(p.on_result(None, None, result) for p in plugins)
+    return container
+
+
+def test_lazy_normalization_merges_rewritten_urls(monkeypatch):
+    monkeypatch.setattr(oa_doi_rewrite, "get_doi_resolver", lambda: DOI_RESOLVER)
+    container = _lazy_container([oa_doi_rewrite.SXNGPlugin(PluginCfg(active=True))])
+
+    container.extend("e1", [{"url": "https://a.example.org/10.1234/abcd.5678", "title": "paper"}])
+    container.extend("e2", [{"url": "https://b.example.org/doi/10.1234/abcd.5678/full", "title": "paper"}])
+    results = container.normalize_results(container.get_ordered_results())
+
+    assert [r.url for r in results] == [DOI_RESOLVER + "10.1234/abcd.5678"]
+    assert results[0].engines == {"e1", "e2"}
+
+
+def test_lazy_normalization_merges_normalized_content():
+    container = _lazy_container()
+
+    container.extend("e1", [{"url": "https://example.org/", "title": "t", "content": "a    b\n\n"}])
+    container.extend("e2", [{"url": "https://example.org/", "title": "t", "content": "a b c d"}])
+    results = container.normalize_results(container.get_ordered_results())
+
+    assert [r.content for r in results] == ["a b c d"]
+
+
+def _random_engines(rnd: random.Random) -> dict[str, types.SimpleNamespace]:
+    return {
+        f"e{i}": types.SimpleNamespace(
+            name=f"e{i}",
+            categories=[rnd.choice(["general", "videos", "images", "news"])],
+            weight=rnd.choice([0.5, 1, 1, 2]),
+            paging=False,
+            timeout=3.0,
+        )
+        for i in range(rnd.randint(1, 6))
+    }
+
+
+def _random_results(rnd: random.Random, engines: dict) -> list[tuple[str, list[dict]]]:
+    # a small pool of URLs: results are merged, the positions and the scores
+    # of the results vary
+    urls = [f"https://example.org/{i}" for i in range(rnd.randint(1, 4 * GROUP_MAX_DISTANCE))]
+    calls = []
+    for engine_name in engines:
+        results = []
+        for url in rnd.sample(urls, rnd.randint(0, len(urls))):
+            result = {"url": url, "title": url[-3:], "template": rnd.choice(["default.html", "videos.html"])}
+            if rnd.random() < 0.3:
+                result["thumbnail"] = url + ".png"
+            results.append(result)
+        calls.append((engine_name, results))
+    return calls
+
+
+@pytest.mark.parametrize("seed", range(200))
+def test_get_top_results_equals_ordered_prefix(monkeypatch, seed):
+    """:py:obj:`ResultContainer.get_top_results` returns the first ``k``
+    results of the full ordering, including the grouping of the results by
+    category and template (which moves results up to ``GROUP_MAX_DISTANCE``
+    places forward)."""
+
+    rnd = random.Random(seed)
+    engines = _random_engines(rnd)
+    monkeypatch.setattr(searx.engines, "engines", engines)
+    searx.metrics.initialize(list(engines), enabled=False)
+    calls = _random_results(rnd, engines)
+
+    def container() -> ResultContainer:
+        c = ResultContainer()
+        for engine_name, results in calls:
+            c.extend(engine_name, [dict(r) for r in results])
+        return c
+
+    ordered = [r.url for r in container().get_ordered_results()]
+    for k in sorted({1, 2, GROUP_MAX_DISTANCE, rnd.randint(1, len(ordered) + 5), len(ordered) + 1}):
+        assert [r.url for r in container().get_top_results(k)] == ordered[:k], k
+
+
+def test_lazy_normalization_of_returned_results():
+    container = _lazy_container()
+
+    container.extend("e1", [{"url": "//example.org/a", "title": "a"}, {"url": "//example.org/b", "title": "b"}])
+    results = container.get_ordered_results()
+    assert [r.url for r in results] == ["//example.org/a", "//example.org/b"]
+
+    # only the returned results are normalized
+    returned = container.normalize_results(results[:1])
+    assert [r.url for r in returned] == ["http://example.org/a"]
+    assert results[1].url == "//example.org/b"
+
+
+def _fusion_container(monkeypatch, rank_fusion, weights: dict[str, float], priorities=None) -> ResultContainer:
+    engines = {
+        name: types.SimpleNamespace(name=name, categories=["general"], weight=weight, paging=False, timeout=3.0)
+        for name, weight in weights.items()
+    }
+    monkeypatch.setattr(searx.engines, "engines", engines)
+    searx.metrics.initialize(list(engines), enabled=False)
+    priorities = priorities or {}
+
+    def on_result(result):
+        result.priority = priorities.get(result.url, "")
+        return True
+
+    container = ResultContainer(rank_fusion)
+    container.on_result = on_result
+    return container
+
+
+def _urls(*names: str) -> list[dict]:
+    return [{"url": f"https://example.org/{name}", "title": name} for name in names]
+
+
+def _scores(container: ResultContainer) -> dict[str, float]:
+    return {r.url.rsplit("/", 1)[-1]: r.score for r in container.get_ordered_results()}
+
+
+def test_rrf_scores(monkeypatch):
+    container = _fusion_container(monkeypatch, ReciprocalRankFusion(k=60), {"e1": 1.0, "e2": 2.0})
+    container.extend("e1", _urls("a", "b"))
+    container.extend("e2", _urls("b", "c"))
+
+    scores = _scores(container)
+    assert scores["a"] == pytest.approx(1 / 61)
+    assert scores["b"] == pytest.approx(1 / 62 + 2 / 61)
+    assert scores["c"] == pytest.approx(2 / 62)
+    assert list(scores) == ["b", "c", "a"]
+
+
+def test_borda_scores(monkeypatch):
+    container = _fusion_container(monkeypatch, BordaRankFusion(depth=3), {"e1": 1.0, "e2": 0.5})
+    container.extend("e1", _urls("a", "b", "c", "d"))
+    container.extend("e2", _urls("d", "a"))
+
+    scores = _scores(container)
+    # e1: 3, 2, 1, 0 points / e2: 3, 2 points (weight 0.5)
+    assert scores == {"a": 3 + 1.0, "b": 2, "d": 1.5, "c": 1}
+    assert list(scores) == ["a", "b", "d", "c"]
+
+
+@pytest.mark.parametrize("rank_fusion", [ReciprocalRankFusion(), BordaRankFusion()])
+def test_fusion_ties_keep_the_order_of_the_engines(monkeypatch, rank_fusion):
+    container = _fusion_container(monkeypatch, rank_fusion, {"e1": 1.0, "e2": 1.0})
+    container.extend("e1", _urls("a", "b"))
+    container.extend("e2", _urls("c", "d"))
+
+    scores = _scores(container)
+    assert scores["a"] == scores["c"] and scores["b"] == scores["d"]
+    # equal scores: the results are in the order they were added
+    assert list(scores) == ["a", "c", "b", "d"]
+
+
+@pytest.mark.parametrize("rank_fusion", [ReciprocalRankFusion(), BordaRankFusion()])
+def test_fusion_priority(monkeypatch, rank_fusion):
+    priorities = {"https://example.org/a": "low", "https://example.org/d": "high"}
+    container = _fusion_container(monkeypatch, rank_fusion, {"e1": 1.0}, priorities)
+    container.extend("e1", _urls("a", "b", "c", "d"))
+
+    scores = _scores(container)
+    assert scores["a"] == 0
+    # a high priority result is scored like a result at the first position
+    assert scores["d"] > scores["b"] > scores["c"]
+    assert list(scores) == ["d", "b", "c", "a"]
@@ -0,0 +1,99 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+"""Tests of the cache of the validated settings (:py:obj:`searx.settings_loader`)."""
+
+import os
+
+import pytest
+
+from searx import settings_loader
+
+ENVIRON_NAMES = ["SEARXNG_SECRET", "SEARXNG_PORT"]
+
+
+@pytest.fixture(name="user_settings")
+def _user_settings(tmp_path, monkeypatch):
+    settings_yml = tmp_path / "myinstance.yml"
+    settings_yml.write_text("use_default_settings: true\nserver:\n  port: 8888\n")
+    monkeypatch.setenv("SEARXNG_SETTINGS_PATH", str(settings_yml))
+    for name in ENVIRON_NAMES:
+        monkeypatch.delenv(name, raising=False)
+    return settings_yml
+
+
+def test_cache_file(monkeypatch, tmp_path):
+    monkeypatch.setenv("SEARXNG_SETTINGS_CACHE", str(tmp_path / "cache.msgpack"))
+    assert settings_loader.get_settings_cache_file() == tmp_path / "cache.msgpack"
+    for value in ("", "0", "false", "Off"):
+        monkeypatch.setenv("SEARXNG_SETTINGS_CACHE", value)
+        assert settings_loader.get_settings_cache_file() is None
+
+
+def test_key_changes_with_yaml(user_settings):
+    key = settings_loader.settings_cache_key(ENVIRON_NAMES)
+    assert settings_loader.settings_cache_key(ENVIRON_NAMES) == key
+    # the key of the default settings only does not depend on the user settings
+    default_key = settings_loader.settings_cache_key(ENVIRON_NAMES, load_user_settings=False)
+    assert default_key != key
+
+    # same size and same mtime, only the content has changed
+    st = user_settings.stat()
+    user_settings.write_text(user_settings.read_text().replace("8888", "9999"))
+    os.utime(user_settings, ns=(st.st_atime_ns, st.st_mtime_ns))
+    assert settings_loader.settings_cache_key(ENVIRON_NAMES) != key
+    assert settings_loader.settings_cache_key(ENVIRON_NAMES, load_user_settings=False) == default_key
+
+
+def test_key_changes_with_environ(user_settings, monkeypatch):  # pylint: disable=unused-argument
+    key = settings_loader.settings_cache_key(ENVIRON_NAMES)
+    monkeypatch.setenv("SEARXNG_PORT", "9999")
+    port_key = settings_loader.settings_cache_key(ENVIRON_NAMES)
+    assert port_key != key
+    # an empty value is not the same as an unset environment
+    monkeypatch.setenv("SEARXNG_PORT", "")
+    assert settings_loader.settings_cache_key(ENVIRON_NAMES) not in (key, port_key)
+    monkeypatch.delenv("SEARXNG_PORT")
+    assert settings_loader.settings_cache_key(ENVIRON_NAMES) == key
+
+
+def test_read_write(tmp_path):
+    cache_file = tmp_path / "cache.msgpack"
+    cfg = {"server": {"port": 8888, "bind_address": "127.0.0.1"}, "engines": [{"name": "dummy"}]}
+    assert settings_loader.write_settings_cache(cache_file, b"key", cfg, "msg")
+    assert cache_file.stat().st_mode & 0o777 == 0o600
+    assert settings_loader.read_settings_cache(cache_file, b"key") == (cfg, "msg")
+    # a cache of other settings is a miss
+    assert settings_loader.read_settings_cache(cache_file, b"other key") is None
+    assert settings_loader.read_settings_cache(tmp_path / "no such file", b"key") is None
+
+
+def test_miss_after_yaml_change(user_settings, tmp_path):
+    cache_file = tmp_path / "cache.msgpack"
+    settings_loader.write_settings_cache(cache_file, settings_loader.settings_cache_key(ENVIRON_NAMES), {}, "msg")
+    assert settings_loader.read_settings_cache(cache_file, settings_loader.settings_cache_key(ENVIRON_NAMES))
+    user_settings.write_text("use_default_settings: true\n")
+    assert settings_loader.read_settings_cache(cache_file, settings_loader.settings_cache_key(ENVIRON_NAMES)) is None
+
+
+def test_settings_not_surviving_msgpack_are_not_cached(tmp_path):
+    cache_file = tmp_path / "cache.msgpack"
+    assert not settings_loader.write_settings_cache(cache_file, b"key", {"a": (1, 2)}, "msg")
+    assert not settings_loader.write_settings_cache(cache_file, b"key", {"a": {1, 2}}, "msg")
+    assert not cache_file.exists()
+
+
+@pytest.mark.skipif(not hasattr(os, "getuid"), reason="no owner of the files")
+def test_unsafe_cache_file_is_ignored(tmp_path, monkeypatch):
+    cache_file = tmp_path / "cache.msgpack"
+    settings_loader.write_settings_cache(cache_file, b"key", {"a": 1}, "msg")
+
+    cache_file.chmod(0o620)
+    assert settings_loader.read_settings_cache(cache_file, b"key") is None
+    cache_file.chmod(0o602)
+    assert settings_loader.read_settings_cache(cache_file, b"key") is None
+    cache_file.chmod(0o644)
+    assert settings_loader.read_settings_cache(cache_file, b"key") == ({"a": 1}, "msg")
+
+    # a file of another user
+    uid = os.getuid()
+    monkeypatch.setattr(os, "getuid", lambda: uid + 1)
+    assert settings_loader.read_settings_cache(cache_file, b"key") is None
@@ -0,0 +1,67 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+"""Tests of the PRAGMAs of the DB connections (:py:obj:`searx.sqlitedb`)."""
+
+import sqlite3
+
+import pytest
+
+from searx import sqlitedb
+from searx.cache import ExpireCacheCfg, ExpireCacheSQLite
+from searx.favicons.cache import FaviconCacheConfig, FaviconCacheSQLite
+
+PROFILE = {
+    # PRAGMA --> value read from the DB connection
+    "synchronous": 1,  # NORMAL
+    "cache_size": -1024 * 8,
+    "temp_store": 2,  # MEMORY
+    "busy_timeout": 5000,
+    "journal_mode": "wal",
+}
+
+
+def _pragmas(conn: sqlite3.Connection) -> dict:
+    return {name: conn.execute(f"PRAGMA {name}").fetchone()[0] for name in PROFILE}
+
+
+def _mmap_size(conn: sqlite3.Connection) -> int | None:
+    row = conn.execute("PRAGMA mmap_size").fetchone()
+    # no row if the SQLite library is compiled without memory-mapped I/O
+    return row[0] if row else None
+
+
+@pytest.mark.parametrize(
+    "build",
+    [
+        lambda path: ExpireCacheSQLite(ExpireCacheCfg(name="test", db_url=str(path), password=b"secret")),
+        lambda path: FaviconCacheSQLite(FaviconCacheConfig(db_url=str(path))),
+    ],
+    ids=["ExpireCacheSQLite", "FaviconCacheSQLite"],
+)
+def test_performance_profile(tmp_path, build):
+    db = build(tmp_path / "cache.db")
+    assert db.SQLITE_PRAGMAS == sqlitedb.SQLiteAppl.SQLITE_PERFORMANCE_PROFILE
+
+    conn = db.connect()
+    try:
+        assert _pragmas(conn) == PROFILE
+        assert _mmap_size(conn) in (None, 0, db.SQLITE_PRAGMAS["mmap_size"])
+    finally:
+        conn.close()
+    # the (thread local) connection of the DB session is shared with the
+    # properties of the DB, the properties may have opened it
+    assert _pragmas(db.DB) == PROFILE
+    assert db.properties.DB is db.DB
+
+
+def test_default_pragmas(tmp_path):
+    class DB(sqlitedb.SQLiteAppl):
+        """DB application without PRAGMAs."""
+
+    db = DB(str(tmp_path / "db.sqlite"))
+    conn = db.connect()
+    try:
+        # no PRAGMAs other than the journal mode
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert conn.execute("PRAGMA synchronous").fetchone()[0] == 2  # FULL
+    finally:
+        conn.close()
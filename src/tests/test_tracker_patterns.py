@@ -0,0 +1,105 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+"""Tests of the rules index of the :py:obj:`TrackerPatternsDB`: the indexed
+``clean_url`` gives the same results as the linear scan over all rules."""
+
+import re
+from urllib.parse import urlparse, urlunparse, parse_qsl, urlencode
+
+import pytest
+
+from searx.data.tracker_patterns import TrackerPatternsDB, RuleType, host_label
+
+PREFIX = r"^https?:\/\/(?:[a-z0-9-]+\.)*?"
+
+
+def _linear_clean_url(rules: list[RuleType], url: str) -> bool | str:
+    """The ``clean_url`` of the :py:obj:`TrackerPatternsDB` before the rules
+    were indexed: all rules are tested in the order of the list."""
+
+    new_url = url
+    parsed_new_url = urlparse(url=new_url)
+    for url_regexp, url_ignore, del_args in rules:
+        try:
+            if not re.match(url_regexp, new_url):
+                continue
+        except re.error:
+            continue
+        if any(re.match(pattern, new_url) for pattern in url_ignore):
+            continue
+        query_args = list(parse_qsl(parsed_new_url.query))
+        for name, val in query_args.copy():
+            if any(re.match(pattern, name) for pattern in del_args):
+                query_args.remove((name, val))
+        parsed_new_url = parsed_new_url._replace(query=urlencode(query_args))
+        new_url = urlunparse(parsed_new_url)
+    if new_url != url:
+        return new_url
+    return True
+
+
+def _db(monkeypatch, rules: list[RuleType]) -> TrackerPatternsDB:
+    monkeypatch.setattr(TrackerPatternsDB, "rules", lambda self: iter(rules))
+    return TrackerPatternsDB()
+
+
+@pytest.mark.parametrize(
+    "url_regexp, label",
+    [
+        (PREFIX + r"amazon(?:\.[a-z]{2,}){1,}", "amazon"),
+        (PREFIX + r"amazon\/", "amazon"),
+        # the label can be continued (amazonaws.com)
+        (PREFIX + r"amazon", None),
+        (PREFIX + r"amazon(?:\.com)?", None),
+        (PREFIX + r"amazon(?:\.com|aws)", None),
+        (PREFIX + r"amazon\.?", None),
+        (r".*", None),
+    ],
+)
+def test_host_label(url_regexp, label):
+    assert host_label(url_regexp) == label
+
+
+def test_prefix_pattern_matches_longer_labels(monkeypatch):
+    rules: list[RuleType] = [
+        (PREFIX + r"amazon", [], ["tag"]),
+        (PREFIX + r"google(?:\.[a-z]{2,}){1,}", [], ["ved"]),
+    ]
+    db = _db(monkeypatch, rules)
+    for url in [
+        "https://s3.amazonaws.com/bucket?tag=1&id=2",
+        "https://www.amazon.de/dp/1?tag=1",
+        "https://www.google.com/url?ved=1&q=x",
+        "https://www.googleapis.com/x?ved=1",
+    ]:
+        assert db.clean_url(url) == _linear_clean_url(rules, url), url
+
+
+def _clear_list() -> list[RuleType]:
+    rules = list(TrackerPatternsDB().iter_clear_list())
+    if not rules:
+        pytest.skip("ClearURLs rule list not available (no network)")
+    return rules
+
+
+def _test_urls(rules: list[RuleType]) -> list[str]:
+    """URLs on the hosts of the rules (and on hosts with longer labels) whose
+    query has the (literal) names of the arguments deleted by the rules."""
+
+    args = set()
+    for _, _, del_args in rules:
+        args.update(arg for arg in del_args if re.fullmatch(r"[\w-]+", arg))
+    query = urlencode([(arg, "1") for arg in sorted(args)] + [("id", "2")])
+
+    labels = {host_label(url_regexp) for url_regexp, _, _ in rules} - {None}
+    urls = ["https://example.org/?" + query]
+    for label in sorted(labels):  # type: ignore[type-var]
+        for host in (f"www.{label}.com", f"{label}.co.uk", f"{label}aws.com", f"x{label}.org", f"a.{label}-b.net"):
+            urls.append(f"https://{host}/path/item?{query}")
+    return urls
+
+
+def test_clean_url_equals_linear_scan(monkeypatch):
+    rules = _clear_list()
+    db = _db(monkeypatch, rules)
+    for url in _test_urls(rules):
+        assert db.clean_url(url) == _linear_clean_url(rules, url), url
@@ -0,0 +1,80 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+"""Tests of the lookup tables of the :py:obj:`EngineTraits` and of the shared
+:py:obj:`EngineTraitsMap` of :py:obj:`searx.data.ENGINE_TRAITS`."""
+
+import types
+
+from searx import locales
+from searx.data import ENGINE_TRAITS
+from searx.enginelib.traits import EngineTraits, EngineTraitsMap
+
+SXNG_LOCALES = ["all", "en", "en-US", "de-CH", "fr-BE", "zh-TW", "pt", "xx-YY", "sr-Latn"]
+
+
+def test_lookup_equals_get_engine_locale():
+    for name in ["google", "bing", "startpage"]:
+        traits = EngineTraitsMap.from_data()[name]
+
+        def expected(tag, engine_locales):
+            if tag == "all" and traits.all_locale is not None:
+                return traits.all_locale  # pylint: disable=cell-var-from-loop
+            return locales.get_engine_locale(tag, engine_locales, "x")
+
+        for tag in SXNG_LOCALES:
+            for _ in range(2):  # the second call is a hit in the lookup table
+                assert traits.get_region(tag, "x") == expected(tag, traits.regions)
+                assert traits.get_language(tag, "x") == expected(tag, traits.languages)
+
+
+def test_setattr_drops_the_lookup_table():
+    traits = EngineTraits(languages={"de": "lang_de"}, regions={"de-DE": "DE"})
+    assert traits.get_language("de-AT") == "lang_de"
+    assert traits.get_region("de-AT") == "DE"
+
+    traits.languages = {"de": "german"}
+    assert traits.get_language("de-AT") == "german"
+    # the table of the regions is kept
+    assert "_lookup_regions" in traits.__dict__
+
+    traits.regions = {"de-AT": "AT"}
+    assert traits.get_region("de-AT") == "AT"
+
+
+def test_lookup_table_is_bounded(monkeypatch):
+    monkeypatch.setattr(EngineTraits, "LOOKUP_TABLE_SIZE", 2)
+    traits = EngineTraits(languages={"en": "en"})
+    for tag in ["en", "en-US", "en-GB", "en-AU"]:
+        assert traits.get_language(tag) == "en"
+    assert len(traits.__dict__["_lookup_languages"]) == 2
+
+
+def test_data_traits_map_is_shared_and_lazy():
+    traits_map = EngineTraitsMap.from_data()
+    assert EngineTraitsMap.from_data() is traits_map
+    assert set(traits_map) == set(ENGINE_TRAITS)
+
+    name = next(iter(ENGINE_TRAITS))
+    traits = traits_map.get(name)
+    assert isinstance(traits, EngineTraits)
+    assert traits_map[name] is traits
+    assert traits.languages == ENGINE_TRAITS[name]["languages"]
+    assert traits_map.get("no such engine") is None
+
+    assert all(isinstance(v, EngineTraits) for v in traits_map.values())
+    assert all(traits_map[k] is v for k, v in traits_map.items())
+
+
+def test_set_traits_of_an_engine_with_one_language():
+    traits_map = EngineTraitsMap.from_data()
+    google = traits_map["google"]
+    google.get_language("de-CH")  # fills the lookup table of the shared traits
+
+    engine = types.SimpleNamespace(name="google german", engine="google", language="de")
+    traits_map.set_traits(engine)
+
+    assert engine.traits is not google
+    assert engine.traits.languages == {"de": google.languages["de"]}
+    assert engine.traits.get_language("fr") is None
+    assert google.get_language("fr") == google.languages["fr"]
+    # the dicts of the shared traits are not modified
+    assert google.languages == ENGINE_TRAITS["google"]["languages"]
@@ -0,0 +1,67 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+"""Tests of the index of the unit converters: :py:obj:`find_conversion` chooses
+the same units as the scan of the :py:obj:`list of unit converters
+<searx.wikidata_units.symbol_to_si>` in the unit converter plugin."""
+
+import collections
+import itertools
+
+import pytest
+
+from searx import wikidata_units
+from searx.wikidata_units import find_conversion, pos_from_si, pos_symbol, pos_to_si, symbol_to_si
+
+
+def _scan(units_of_symbol: dict, source_symbol: str, target_symbol: str):
+    """The conversion of the unit converter plugin before the converters were
+    indexed: the last source unit and the last target unit with a common SI
+    name win."""
+    source_list = [(si_name, to_si) for si_name, _, to_si, _ in units_of_symbol[source_symbol]]
+    target_list = [
+        (si_name, from_si, orig_symbol) for si_name, from_si, _, orig_symbol in units_of_symbol[target_symbol]
+    ]
+    conversion = None
+    for source in source_list:
+        for target in target_list:
+            if source[0] == target[0]:
+                conversion = (source[1], target[1], target[2])
+    return conversion
+
+
+@pytest.fixture(name="units_of_symbol", scope="module")
+def _units_of_symbol():
+    units = collections.defaultdict(list)
+    for symbol, si_name, from_si, to_si, orig_symbol in symbol_to_si():
+        units[symbol].append((si_name, from_si, to_si, orig_symbol))
+    return units
+
+
+def _find(source_symbol: str, target_symbol: str):
+    conversion = find_conversion(source_symbol, target_symbol)
+    if conversion is None:
+        return None
+    source, target = conversion
+    return (source[pos_to_si], target[pos_from_si], target[pos_symbol])
+
+
+def test_ambiguous_symbols(units_of_symbol):
+    ambiguous = sorted(symbol for symbol, units in units_of_symbol.items() if len(units) > 1)
+    # symbols of several units with the same SI name (e.g. 'g') need the tie-break
+    assert any(len({unit[0] for unit in units}) < len(units) for units in map(units_of_symbol.get, ambiguous))
+    for source_symbol, target_symbol in itertools.product(ambiguous, repeat=2):
+        assert _find(source_symbol, target_symbol) == _scan(units_of_symbol, source_symbol, target_symbol)
+
+
+def test_common_symbols(units_of_symbol):
+    symbols = ["m", "km", "mi", "ft", "in", "kg", "lb", "°C", "°F", "K", "l", "gal", "h", "min", "s", "B", "MB"]
+    symbols = [symbol for symbol in symbols if symbol in units_of_symbol]
+    for source_symbol, target_symbol in itertools.product(symbols, repeat=2):
+        assert _find(source_symbol, target_symbol) == _scan(units_of_symbol, source_symbol, target_symbol)
+    assert _find("km", "mi") is not None
+    assert _find("km", "kg") is None
+
+
+def test_unknown_symbol():
+    assert find_conversion("no such unit", "m") is None
+    assert find_conversion("m", "no such unit") is None
+    assert wikidata_units.units_by_symbol("no such unit") == {}
@@ -0,0 +1,80 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+"""Tests of the result output options of :py:mod:`websearch.service`: the
+result profiles, the ``fields`` option and ``max_content_chars``."""
+
+import pytest
+
+from searx.result_types import LegacyResult
+from searx.result_types._base import MainResult
+from websearch import service
+
+CONTENT = "The quick brown fox jumps over the lazy dog"
+
+
+@pytest.mark.parametrize("profile", list(service.RESULT_PROFILES))
+def test_result_profiles(profile):
+    assert service._result_fields({"profile": profile}) == service.RESULT_PROFILES[profile]
+
+
+def test_default_profile():
+    assert service._result_fields({}) == service.RESULT_PROFILES[service.DEFAULT_RESULT_PROFILE]
+
+
+def test_unknown_profile():
+    with pytest.raises(ValueError):
+        service._result_fields({"profile": "tiny"})
+
+
+@pytest.mark.parametrize(
+    "fields, expected",
+    [
+        ("url, title,,", ("url", "title")),
+        (["url", " content "], ("url", "content")),
+    ],
+)
+def test_fields_override_profile(fields, expected):
+    assert service._result_fields({"fields": fields, "profile": "llm"}) == expected
+
+
+@pytest.mark.parametrize("value, expected", [(None, None), ("", None), ("0", None), (-3, None), ("12", 12)])
+def test_max_content_chars(value, expected):
+    assert service._max_content_chars({"max_content_chars": value}) == expected
+
+
+def test_max_content_chars_not_a_number():
+    with pytest.raises(ValueError):
+        service._max_content_chars({"max_content_chars": "many"})
+
+
+def _results():
+    typed = MainResult(url="https://example.org/a", title="typed", content=CONTENT, engine="e")
+    legacy = LegacyResult({"url": "https://example.org/b", "title": "legacy", "content": CONTENT, "engine": "e"})
+    simple = {"url": "https://example.org/c", "title": "simple", "content": CONTENT}
+    return [typed, legacy, simple]
+
+
+@pytest.mark.parametrize("result", _results())
+def test_project_minimal_profile(result):
+    rd = service._project_result(result, service.RESULT_PROFILES["minimal"], None)
+    assert list(rd) == ["url", "title", "content"]
+    assert rd["content"] == CONTENT
+
+
+@pytest.mark.parametrize("result", _results())
+def test_project_truncates_content(result):
+    rd = service._project_result(result, ("title", "content"), 9)
+    assert rd == {"title": result.get("title"), "content": "The quick…"}
+    # the result itself is not changed
+    assert result.get("content") == CONTENT
+
+
+def test_project_full_profile():
+    result = _results()[0]
+    rd = service._project_result(result, None, None)
+    assert set(rd) == set(result) - {"parsed_url"}
+    assert rd["engine"] == "e"
+
+
+def test_project_missing_field():
+    rd = service._project_result(_results()[2], ("url", "publishedDate"), 5)
+    assert rd == {"url": "https://example.org/c", "publishedDate": None}
@@ -23,6 +23,11 @@ def _payload_from_request(req: func.HttpRequest) -> Dict[str, Any]:
         "pageno": req.params.get("pageno"),
         "safesearch": req.params.get("safesearch"),
         "max_results": req.params.get("max_results"),
+        "rank_fusion": req.params.get("rank_fusion"),
+        "profile": req.params.get("profile"),
+        "fields": req.params.get("fields"),
+        "max_content_chars": req.params.get("max_content_chars"),
+        "detect_language": req.params.get("detect_language"),
     }
 
 
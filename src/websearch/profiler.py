@@ -0,0 +1,290 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+"""Profiler of the cold start of the search core.
+
+The profile is recorded in a fresh Python process (started with ``-X
+importtime``) which runs the initialization of :py:mod:`websearch.service`
+and builds the first ``Preferences``.  The profile contains:
+
+- the import time of each module (self and cumulative)
+- the duration of ``load_engine``, the (lazy) import of the module and
+  ``engine.init`` of each engine
+- the time spent in ``EngineTraitsMap.from_data``, the network initialization,
+  the creation of SSL contexts and HTTP clients, the ``searx.data`` files and
+  the construction of ``Preferences``
+- the phases of the initialization (wall clock)
+
+Usage::
+
+  $ python -m websearch.profiler                       # sorted report
+  $ python -m websearch.profiler --json > profile.json # diff between releases
+
+The same profile is served by the debug route ``/api/debug/profile`` (see
+``ENABLE_DEBUG_ROUTES`` in ``function_app.py``).
+"""
+
+from __future__ import annotations
+
+import argparse
+import functools
+import inspect
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from typing import Any, Callable
+
+DEFAULT_TOP = 25
+
+# Maximum time to wait for the init threads of the engines (seconds)
+ENGINE_INIT_TIMEOUT = float(os.getenv("PROFILE_ENGINE_INIT_TIMEOUT", "30"))
+
+_APP_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class _Recorder:
+    """Thread safe record of the durations (ms) of the patched calls, grouped
+    by section and name."""
+
+    def __init__(self) -> None:
+        self._cond = threading.Condition()
+        self.calls: dict[str, dict[str, list[float]]] = {}
+
+    def add(self, section: str, name: str, duration: float) -> None:
+        with self._cond:
+            self.calls.setdefault(section, {}).setdefault(name, []).append(duration)
+            self._cond.notify_all()
+
+    def wait(self, section: str, count: int, timeout: float) -> bool:
+        """Waits until ``count`` different names are recorded in ``section``."""
+        with self._cond:
+            return self._cond.wait_for(lambda: len(self.calls.get(section, {})) >= count, timeout)
+
+
+def _patch(
+    recorder: _Recorder,
+    owner: Any,
+    attr: str,
+    section: str,
+    name: Callable[..., str] | None = None,
+) -> None:
+    """Replaces ``owner.attr`` (function, method or classmethod) by a wrapper
+    that records the duration of each call.  ``name`` returns the name of the
+    call from the arguments of the call (default: the qualified name)."""
+    raw = inspect.getattr_static(owner, attr)
+    kind = type(raw) if isinstance(raw, (classmethod, staticmethod)) else None
+    func = raw.__func__ if kind else raw
+    default_name = f"{func.__module__}.{func.__qualname__}"
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            duration = (time.perf_counter() - start) * 1000
+            recorder.add(section, name(*args, **kwargs) if name else default_name, duration)
+
+    setattr(owner, attr, kind(wrapper) if kind else wrapper)
+
+
+def _install_patches(recorder: _Recorder) -> None:
+    # pylint: disable=import-outside-toplevel
+    # searx.data first: the data files are loaded while the modules below are
+    # imported
+    import searx.data
+
+    _patch(recorder, searx.data, "__getattr__", "calls", lambda name: f"searx.data.{name}")
+
+    import searx.network
+    import searx.network.client
+
+    # patched before searx.search imports it by name
+    _patch(recorder, searx.network, "initialize", "calls")
+    _patch(recorder, searx.network.client, "get_sslcontexts", "calls")
+    _patch(recorder, searx.network.client, "new_client", "calls")
+
+    import searx.engines
+    from searx.enginelib.traits import EngineTraitsMap
+    from searx.preferences import Preferences
+    from searx.search.processors.abstract import EngineProcessor
+
+    _patch(recorder, searx.engines, "load_engine", "load_engine", lambda engine_data, *a, **kw: engine_data["name"])
+    _patch(recorder, searx.engines, "import_engine", "engine_import", lambda module_name, engine_name, _: engine_name)
+    _patch(recorder, searx.engines, "precompute_locales", "calls")
+    _patch(recorder, EngineTraitsMap, "from_data", "calls")
+    _patch(recorder, Preferences, "__init__", "calls")
+    _patch(recorder, EngineProcessor, "initialize", "engine_init", lambda processor: processor.engine_name)
+
+
+def _summary(durations: dict[str, list[float]]) -> dict[str, dict[str, Any]]:
+    return {
+        name: {"count": len(values), "total_ms": round(sum(values), 3)}
+        for name, values in sorted(durations.items(), key=lambda item: -sum(item[1]))
+    }
+
+
+def _profile_process() -> dict[str, Any]:
+    """Profiles the cold start in this process, the search core must not have
+    been imported yet."""
+    if "searx" in sys.modules:
+        raise RuntimeError("the search core is already imported, the cold start can't be profiled")
+
+    recorder = _Recorder()
+    phases: dict[str, float] = {}
+
+    def phase(phase_name: str, func: Callable[[], Any]) -> Any:
+        start = time.perf_counter()
+        try:
+            return func()
+        finally:
+            phases[phase_name] = round((time.perf_counter() - start) * 1000, 3)
+
+    # pylint: disable=import-outside-toplevel
+    from websearch import service
+
+    start = time.perf_counter()
+    phase("import", lambda: _install_patches(recorder))
+    phase("initialize", service._initialize_search_core)  # pylint: disable=protected-access
+
+    from searx.search.processors import PROCESSORS
+    from searx.enginelib.registry import LazyEngine
+
+    if service._PRELOAD_THREAD is not None:  # pylint: disable=protected-access
+        phase("preload", service._PRELOAD_THREAD.join)  # pylint: disable=protected-access
+    # the init function of a lazy engine is called in the thread that imports
+    # its module (the preloaded engines are initialized by the preload thread)
+    expected = sum(
+        1
+        for processor in PROCESSORS.values()
+        if processor.has_initialize_function
+        and (not isinstance(processor.engine, LazyEngine) or processor.engine.loaded)
+    )
+    complete = phase("engine_init", lambda: recorder.wait("engine_init", expected, ENGINE_INIT_TIMEOUT))
+    phase("first_preferences", service._new_preferences)  # pylint: disable=protected-access
+    total = round((time.perf_counter() - start) * 1000, 3)
+
+    calls = recorder.calls
+    return {
+        "python": platform.python_version(),
+        "total_ms": total,
+        "phases": phases,
+        "load_engine": {name: d["total_ms"] for name, d in _summary(calls.get("load_engine", {})).items()},
+        "engine_import": {name: d["total_ms"] for name, d in _summary(calls.get("engine_import", {})).items()},
+        "engine_init": {name: d["total_ms"] for name, d in _summary(calls.get("engine_init", {})).items()},
+        "engine_init_complete": complete,
+        "calls": _summary(calls.get("calls", {})),
+    }
+
+
+def _parse_importtime(stderr: str) -> list[dict[str, Any]]:
+    """Parses the output of ``-X importtime``, the modules are in the order of
+    the import (a module follows the modules it imports)."""
+    imports = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:") :].split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue
+        module = fields[2].rstrip()
+        imports.append(
+            {
+                "module": module.strip(),
+                "depth": (len(module) - len(module.lstrip()) - 1) // 2,
+                "self_ms": int(fields[0]) / 1000,
+                "cumulative_ms": int(fields[1]) / 1000,
+            }
+        )
+    return imports
+
+
+def profile_cold_start(timeout: float | None = None) -> dict[str, Any]:
+    """Profiles the cold start of the search core in a new Python process and
+    returns the profile (JSON serializable)."""
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(p for p in sys.path if p)
+    with tempfile.TemporaryDirectory() as tmp:
+        output = os.path.join(tmp, "profile.json")
+        proc = subprocess.run(
+            [sys.executable, "-X", "importtime", "-m", "websearch.profiler", "--child", output],
+            cwd=_APP_ROOT,
+            env=env,
+            capture_output=True,
+            text=True,
+            timeout=timeout,
+            check=False,
+        )
+        if proc.returncode != 0:
+            detail = [line for line in proc.stderr.splitlines() if not line.startswith("import time:")]
+            raise RuntimeError("profiler process failed: " + "\n".join(detail[-10:]))
+        with open(output, encoding="utf-8") as f:
+            profile = json.load(f)
+    profile["imports"] = _parse_importtime(proc.stderr)
+    return profile
+
+
+def format_report(profile: dict[str, Any], top: int = DEFAULT_TOP) -> str:
+    """Formats the profile as a report, each section sorted by time."""
+    lines = [f"cold start of the search core: {profile['total_ms']:.1f} ms (Python {profile['python']})", ""]
+
+    def table(title: str, rows: list[tuple[str, str]]):
+        lines.append(title)
+        width = max((len(name) for name, _ in rows), default=0)
+        lines.extend(f"  {name:<{width}}  {value}" for name, value in rows)
+        lines.append("")
+
+    table("phases", [(name, f"{ms:10.1f} ms") for name, ms in profile["phases"].items()])
+
+    imports = sorted(profile["imports"], key=lambda i: -i["self_ms"])[:top]
+    table(
+        f"imports (top {top} by self time)",
+        [(i["module"], f"{i['self_ms']:10.1f} ms  (cumulative {i['cumulative_ms']:.1f} ms)") for i in imports],
+    )
+    top_level = [i for i in profile["imports"] if i["depth"] == 0]
+    top_level = sorted(top_level, key=lambda i: -i["cumulative_ms"])[:top]
+    table(
+        f"top level imports (top {top} by cumulative time)",
+        [(i["module"], f"{i['cumulative_ms']:10.1f} ms") for i in top_level],
+    )
+
+    for section in ("load_engine", "engine_import", "engine_init"):
+        rows = list(profile[section].items())
+        title = f"{section} ({len(rows)} engines, total {sum(ms for _, ms in rows):.1f} ms, top {top})"
+        if section == "engine_init" and not profile["engine_init_complete"]:
+            title += " -- not all engines completed their init"
+        table(title, [(name, f"{ms:10.1f} ms") for name, ms in rows[:top]])
+
+    table(
+        "calls",
+        [(name, f"{c['total_ms']:10.1f} ms  ({c['count']} calls)") for name, c in profile["calls"].items()],
+    )
+    return "\n".join(lines)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m websearch.profiler", description=__doc__.splitlines()[0])
+    parser.add_argument("--json", action="store_true", help="print the profile as JSON")
+    parser.add_argument("--top", type=int, default=DEFAULT_TOP, help="number of rows of each section in the report")
+    parser.add_argument("--child", metavar="FILE", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.child:
+        profile = _profile_process()
+        with open(args.child, "w", encoding="utf-8") as f:
+            json.dump(profile, f)
+        return 0
+
+    profile = profile_cold_start()
+    if args.json:
+        print(json.dumps(profile, indent=2))
+    else:
+        print(format_report(profile, args.top))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
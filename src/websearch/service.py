@@ -14,9 +14,25 @@ Engine = None  # type: ignore[assignment]
 
 _SEARCH_INITIALIZED: bool = False
 
+# Engines always kept enabled by _harden_settings and the default engines of a
+# search
+_BASIC_ENGINES = ("google", "bing", "startpage", "brave", "mojeek")
+_DEFAULT_ENGINES = "google,bing,startpage,brave"
+
+# Import the engine modules on first use (see searx.enginelib.registry), the
+# modules of the engines in PRELOAD_ENGINES (default: DEFAULT_ENGINES) are
+# imported by a background thread after the initialization.
+_LAZY_ENGINES = os.getenv("LAZY_ENGINES", "true").lower() == "true"
+_PRELOAD_THREAD: Any = None
+
+# SearXNG locales resolved for the enabled engines at the initialization
+# (comma separated, default: searx.locales.COMMON_LOCALES)
+_PRECOMPUTE_LOCALES = os.getenv("PRECOMPUTE_LOCALES")
+
 
 def _initialize_search_core() -> None:
     global _SEARCH_INITIALIZED
+    global _PRELOAD_THREAD
     global searx
     global Engine
     if _SEARCH_INITIALIZED:
@@ -29,6 +45,7 @@ def _initialize_search_core() -> None:
         import searx.webadapter as _searx_webadapter  # noqa: F401
         import searx.search as _searx_search  # noqa: F401
         import searx.plugins as _searx_plugins  # noqa: F401
+        import searx.results as _searx_results  # noqa: F401
         from searx.enginelib import Engine as _Engine  # type: ignore
         searx = _searx
         Engine = _Engine
@@ -57,29 +74,20 @@ def _initialize_search_core() -> None:
         enable_checker=False,
         check_network=False,
         enable_metrics=False,
+        lazy_engines=_LAZY_ENGINES,
     )
+    if _PRECOMPUTE_LOCALES is None:
+        searx.engines.precompute_locales()
+    else:
+        searx.engines.precompute_locales([t.strip() for t in _PRECOMPUTE_LOCALES.split(",") if t.strip()])
+    if _LAZY_ENGINES:
+        preload = os.getenv("PRELOAD_ENGINES", os.getenv("DEFAULT_ENGINES", _DEFAULT_ENGINES))
+        _PRELOAD_THREAD = searx.engines.preload_engines(
+            [e.strip().lower() for e in preload.split(",") if e.strip()]
+        )
     _SEARCH_INITIALIZED = True
 
 
-def _test_engine_imports() -> set[str]:
-    """Test which engines can be imported successfully."""
-    working_engines = set()
-    
-    # Test some basic engines that usually work
-    basic_engines = ["google", "bing", "startpage", "brave", "mojeek"]
-    
-    for engine_name in basic_engines:
-        try:
-            # Try to import the engine module
-            import importlib
-            module = importlib.import_module(f"searx.engines.{engine_name}")
-            working_engines.add(engine_name)
-            print(f"DEBUG: Engine {engine_name} imported successfully")
-        except Exception as e:
-            print(f"DEBUG: Engine {engine_name} failed to import: {e}")
-    
-    return working_engines
-
 def _harden_settings(searx_mod) -> None:
     """Tune SearXNG at runtime sans modifier le YAML."""
     s = searx_mod.settings
@@ -87,9 +95,6 @@ def _harden_settings(searx_mod) -> None:
     outgoing["request_timeout"] = float(os.getenv("REQUEST_TIMEOUT", "2.5"))
     outgoing["max_request_timeout"] = float(os.getenv("MAX_REQUEST_TIMEOUT", "6"))
     
-    # Test which engines work and disable the rest
-    working_engines = _test_engine_imports()
-    
     # Désactiver des engines problématiques si présents
     to_disable = {
         e.strip().lower()
@@ -101,8 +106,9 @@ def _harden_settings(searx_mod) -> None:
     
     for eng in s.get("engines", []):
         name = str(eng.get("name", "")).lower()
-        # Disable if explicitly in disable list OR if it failed import test
-        if name in to_disable or (name not in working_engines and name not in ["google", "bing", "startpage", "brave", "mojeek"]):
+        # Disable if explicitly in disable list OR if it is not a basic engine
+        # (the modules of the engines are imported when they are loaded)
+        if name in to_disable or name not in _BASIC_ENGINES:
             eng["disabled"] = True
             print(f"DEBUG: Disabled engine {name}")
         else:
@@ -115,7 +121,7 @@ def _build_form(payload: dict[str, Any]) -> dict[str, str]:
     # Engines par défaut si non fournis - utiliser seulement les engines simples qui fonctionnent
     default_engines = os.getenv(
         "DEFAULT_ENGINES",
-        "google,bing,startpage,brave",
+        _DEFAULT_ENGINES,
     )
     engines = payload.get("engines") or default_engines
     if engines:
@@ -134,6 +140,77 @@ def _build_form(payload: dict[str, Any]) -> dict[str, str]:
     return form
 
 
+# Result fields returned by the named output profiles (None: all fields)
+RESULT_PROFILES: dict[str, tuple[str, ...] | None] = {
+    "minimal": ("url", "title", "content"),
+    "llm": ("url", "title", "content", "engines", "publishedDate"),
+    "full": None,
+}
+DEFAULT_RESULT_PROFILE = "full"
+
+
+def _result_fields(payload: dict[str, Any]) -> tuple[str, ...] | None:
+    """Fields to return for each result: ``fields`` (list or comma separated
+    string) takes precedence over the named ``profile``."""
+    fields = payload.get("fields")
+    if fields:
+        if isinstance(fields, str):
+            fields = fields.split(",")
+        return tuple(str(f).strip() for f in fields if str(f).strip())
+    profile = payload.get("profile") or DEFAULT_RESULT_PROFILE
+    if profile not in RESULT_PROFILES:
+        raise ValueError(f"Unknown profile: {profile} (available: {', '.join(RESULT_PROFILES)})")
+    return RESULT_PROFILES[profile]
+
+
+def _max_content_chars(payload: dict[str, Any]) -> int | None:
+    if payload.get("max_content_chars") in (None, ""):
+        return None
+    try:
+        max_chars = int(payload["max_content_chars"])
+    except (TypeError, ValueError) as exc:
+        raise ValueError("max_content_chars must be an integer") from exc
+    return max_chars if max_chars > 0 else None
+
+
+def _detect_language(payload: dict[str, Any]) -> bool:
+    value = payload.get("detect_language")
+    if isinstance(value, str):
+        return value.strip().lower() in ("1", "true", "yes")
+    return bool(value)
+
+
+def _annotate_languages(results: list[Any], results_json: list[dict[str, Any]]) -> None:
+    """Sets ``lang`` of each result (JSON) to the language detected from the
+    title and the content of the result (``None`` if not detected).  The
+    languages of all results are detected by one batch."""
+    from searx.utils import detect_languages  # pylint: disable=import-outside-toplevel
+
+    texts = [
+        " ".join(text for text in (result.get("title"), result.get("content")) if isinstance(text, str))
+        for result in results
+    ]
+    for rd, lang in zip(results_json, detect_languages(texts)):
+        rd["lang"] = lang
+
+
+def _project_result(result: Any, fields: tuple[str, ...] | None, max_content_chars: int | None) -> dict[str, Any]:
+    """Builds the JSON object of a result from the selected fields only.
+
+    ``result`` is a typed SearXNG result, a legacy result (dict) or a result of
+    the simple search (dict), all of them support ``iter`` and ``get``.
+    """
+    if fields is None:
+        fields = tuple(f for f in result if f != "parsed_url")
+    rd: dict[str, Any] = {}
+    for f in fields:
+        value = result.get(f)
+        if f == "content" and max_content_chars and isinstance(value, str) and len(value) > max_content_chars:
+            value = value[:max_content_chars].rstrip() + "…"
+        rd[f] = value
+    return rd
+
+
 def _json_default(obj: Any) -> Any:
     if isinstance(obj, datetime):
         return obj.isoformat()
@@ -151,41 +228,79 @@ def perform_search(payload: dict[str, Any]) -> dict[str, Any]:
     """Run a search using SearXNG core based on the given payload.
 
     Expected payload keys: query (str), engines (list[str]|str), language (str),
-    time_range (str), pageno (int), safesearch (int), max_results (int).
+    time_range (str), pageno (int), safesearch (int), max_results (int),
+    rank_fusion (str: ``legacy``, ``rrf`` or ``borda``), profile (str:
+    ``minimal``, ``llm`` or ``full``), fields (list[str]|str),
+    max_content_chars (int) and detect_language (bool: add the detected
+    language ``lang`` to each result).
 
     The returned dictionary includes an ``unresponsive_engines`` field listing
     engines that failed to respond. Each entry contains the engine name and the
     error type encountered.
     """
+    fields = _result_fields(payload)
+    max_content_chars = _max_content_chars(payload)
+    detect_language = _detect_language(payload)
+    rank_fusion = _rank_fusion(payload)
     # Try SearXNG first, but fallback to simple search if it fails
     try:
-        return _perform_searxng_search(payload)
+        return _perform_searxng_search(payload, fields, max_content_chars, detect_language, rank_fusion)
     except Exception as e:
         print(f"SearXNG search failed, using fallback: {e}")
         # Import here to avoid circular imports
         from .simple_search import perform_simple_search
-        return perform_simple_search(payload)
+        response = perform_simple_search(payload)
+        results = response["results"]
+        response["results"] = [_project_result(r, fields, max_content_chars) for r in results]
+        if detect_language:
+            _annotate_languages(results, response["results"])
+        return response
 
 
-def _perform_searxng_search(payload: dict[str, Any]) -> dict[str, Any]:
-    """Original SearXNG search implementation."""
-    _initialize_search_core()
+def _rank_fusion(payload: dict[str, Any]) -> Any:
+    """Rank-fusion strategy (``rank_fusion``) of the search, raises a
+    ``ValueError`` if the strategy is unknown.  ``None`` if the search core
+    can't be initialized (the simple search does not fuse ranks)."""
+    try:
+        _initialize_search_core()
+    except Exception:  # pylint: disable=broad-except
+        return None
+    return searx.results.get_rank_fusion(payload.get("rank_fusion"))  # type: ignore[attr-defined]
 
-    form = _build_form(payload)
-    if not form.get("q"):
-        raise ValueError("Missing required field: query")
 
+def _new_preferences() -> Any:
     engine_categories = list(searx.engines.categories.keys())  # type: ignore[attr-defined]
     engines_map: dict[str, Engine] = cast(
         dict[str, Engine], searx.engines.engines)  # type: ignore[attr-defined]
-    preferences = searx.preferences.Preferences(  # type: ignore[attr-defined]
+    return searx.preferences.Preferences(  # type: ignore[attr-defined]
         ["simple"], engine_categories, engines_map, searx.plugins.STORAGE)  # type: ignore[attr-defined]
 
+
+def _perform_searxng_search(
+    payload: dict[str, Any],
+    fields: tuple[str, ...] | None = None,
+    max_content_chars: int | None = None,
+    detect_language: bool = False,
+    rank_fusion: Any = None,
+) -> dict[str, Any]:
+    """Original SearXNG search implementation."""
+    _initialize_search_core()
+
+    form = _build_form(payload)
+    if not form.get("q"):
+        raise ValueError("Missing required field: query")
+    if rank_fusion is None:
+        rank_fusion = searx.results.get_rank_fusion(payload.get("rank_fusion"))  # type: ignore[attr-defined]
+    preferences = _new_preferences()
+
     search_query = searx.webadapter.get_search_query_from_webapp(preferences, form)[  # type: ignore[attr-defined]
         0]
-    result_container = searx.search.Search(search_query).search()  # type: ignore[attr-defined]
+    search = searx.search.Search(search_query)  # type: ignore[attr-defined]
+    search.result_container.set_rank_fusion(rank_fusion)
+    # normalize only the results that are returned (see below)
+    search.result_container.lazy_normalization = True
+    result_container = search.search()
 
-    results = result_container.get_ordered_results()
     max_results: int | None = None
     try:
         if payload.get("max_results") is not None:
@@ -193,13 +308,14 @@ def _perform_searxng_search(payload: dict[str, Any]) -> dict[str, Any]:
     except Exception:
         max_results = None
     if isinstance(max_results, int) and max_results > 0:
-        results = results[:max_results]
+        results = result_container.get_top_results(max_results)
+    else:
+        results = result_container.get_ordered_results()
+    results = result_container.normalize_results(results)
 
-    results_json: list[dict[str, Any]] = []
-    for r in results:
-        rd = r.as_dict()
-        rd.pop("parsed_url", None)
-        results_json.append(rd)
+    results_json = [_project_result(r, fields, max_content_chars) for r in results]
+    if detect_language:
+        _annotate_languages(results, results_json)
 
     response = {
         "search": {